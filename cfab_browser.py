@@ -4,6 +4,7 @@ CFAB Browser - Główny plik uruchamiający aplikację
 """
 
 import logging
+import multiprocessing
 import os
 import sys
 import time
@@ -112,4 +113,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the thumbnail process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+CFAB Indexer - Headless indexing of whole work-folder trees
+
+Runs the same pipeline as a folder click in CFAB Browser (pairing, .asset
+creation, thumbnails, unpair_files.json and the asset index) for every
+subfolder of the work folders from config.json, or of the given roots,
+using multiple processes. Intended for overnight runs, so folders are
+ready to show as a gallery when opened in the browser. The run also
+fills the library search index and drops folders that no longer exist
+under the roots from it.
+
+Usage:
+    python cfab_indexer.py                      # all work_folderN paths
+    python cfab_indexer.py --root W:/_SBSAR_LIB  # selected root(s)
+    python cfab_indexer.py --workers 8 --full    # full (non-incremental) rebuild
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from core.folder_snapshot import get_folder_snapshot
+from core.json_utils import load_from_file
+from core.library_index import get_library_index
+from core.scanner import AssetRepository
+
+logger = logging.getLogger("cfab_indexer")
+
+CONFIG_PATH = Path(__file__).parent / "config.json"
+
+# Folders never shown in the folder tree, so they are not indexed either
+SKIPPED_FOLDER_NAMES = {
+    "__pycache__", "node_modules", ".git", ".svn", ".hg",
+    "cache", ".cache", ".tmp", "temp", ".temp",
+    "system volume information", "$recycle.bin",
+    ".vscode", ".idea", ".vs",
+}
+
+
+def get_work_folder_roots(config_path: Path) -> list:
+    """Returns existing work_folderN paths from config.json"""
+    config = load_from_file(config_path) or {}
+    roots = []
+    for key in sorted(config, key=lambda k: (len(k), k)):
+        if not key.startswith("work_folder"):
+            continue
+        folder_config = config[key]
+        path = folder_config.get("path") if isinstance(folder_config, dict) else None
+        if not path:
+            continue
+        if os.path.isdir(path):
+            roots.append(path)
+        else:
+            logger.warning(f"Work folder does not exist, skipping: {path}")
+    return roots
+
+
+def find_folders_to_index(roots: list) -> list:
+    """Walks the roots and returns folders containing archives or previews"""
+    folders = []
+    seen = set()
+    pending = list(reversed(roots))
+    while pending:
+        dir_path = pending.pop()
+        key = os.path.normcase(os.path.abspath(dir_path))
+        if key in seen:
+            continue
+        seen.add(key)
+        try:
+            snapshot = get_folder_snapshot(dir_path)
+        except OSError as e:
+            logger.warning(f"Cannot list folder {dir_path}: {e}")
+            continue
+        if snapshot.archives or snapshot.previews:
+            folders.append(dir_path)
+        pending.extend(
+            os.path.join(dir_path, name)
+            for name in sorted(snapshot.subfolders, key=str.lower, reverse=True)
+            if not name.startswith(".") and name.lower() not in SKIPPED_FOLDER_NAMES
+        )
+    return folders
+
+
+def index_folder(folder_path: str, incremental: bool = True) -> dict:
+    """
+    Indexes a single folder (runs in a worker process)
+
+    Returns:
+        dict: Folder statistics (pairs, processed, thumbnails, reused,
+            assets, duration, error)
+    """
+    start_time = time.perf_counter()
+    stats = {
+        "folder": folder_path,
+        "pairs": 0,
+        "processed": 0,
+        "thumbnails": 0,
+        "reused": 0,
+        "assets": 0,
+        "duration": 0.0,
+        "error": None,
+    }
+    try:
+        repository = AssetRepository()
+        created = repository.find_and_create_assets(
+            folder_path, incremental=incremental
+        )
+        # Loading also builds the asset index used by the gallery
+        loaded = repository.load_existing_assets(folder_path)
+
+        stats["pairs"] = repository.scan_stats["pairs"]
+        stats["processed"] = sum(1 for a in created if a.get("type") == "asset")
+        stats["thumbnails"] = repository.thumbnail_stats["thumbnails"]
+        stats["reused"] = repository.thumbnail_stats["reused"]
+        stats["assets"] = sum(1 for a in loaded if a.get("type") == "asset")
+    except Exception as e:
+        stats["error"] = str(e)
+    stats["duration"] = time.perf_counter() - start_time
+    return stats
+
+
+def run_indexer(folders: list, workers: int, incremental: bool) -> dict:
+    """Indexes folders in a process pool and prints per-folder progress"""
+    totals = {
+        "folders": 0, "pairs": 0, "processed": 0, "thumbnails": 0, "reused": 0,
+        "assets": 0, "errors": 0,
+    }
+    total = len(folders)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(index_folder, folder, incremental) for folder in folders
+        ]
+        for done, future in enumerate(as_completed(futures), 1):
+            stats = future.result()
+            totals["folders"] += 1
+            if stats["error"]:
+                totals["errors"] += 1
+                print(f"[{done}/{total}] ERROR {stats['folder']}: {stats['error']}")
+                continue
+            totals["pairs"] += stats["pairs"]
+            totals["processed"] += stats["processed"]
+            totals["thumbnails"] += stats["thumbnails"]
+            totals["reused"] += stats["reused"]
+            totals["assets"] += stats["assets"]
+            print(
+                f"[{done}/{total}] {stats['folder']}: {stats['pairs']} pairs, "
+                f"{stats['processed']} processed ({stats['duration']:.2f}s)"
+            )
+    return totals
+
+
+def print_summary(totals: dict, scan_time: float, index_time: float, workers: int):
+    """Prints throughput statistics of the run"""
+
+    def rate(count: int) -> float:
+        return count / index_time if index_time > 0 else 0.0
+
+    print()
+    print(f"Folders indexed:   {totals['folders']} ({totals['errors']} errors)")
+    print(f"Pairs found:       {totals['pairs']}")
+    print(f"Pairs processed:   {totals['processed']}")
+    dedup_ratio = totals["reused"] / totals["thumbnails"] if totals["thumbnails"] else 0.0
+    print(
+        f"Thumbnails:        {totals['thumbnails']} "
+        f"({totals['reused']} reused, dedup ratio {dedup_ratio:.0%})"
+    )
+    print(f"Assets in index:   {totals['assets']}")
+    print(f"Worker processes:  {workers}")
+    print(f"Folder walk time:  {scan_time:.2f}s")
+    print(f"Indexing time:     {index_time:.2f}s")
+    print(
+        f"Throughput:        {rate(totals['folders']):.1f} folders/s, "
+        f"{rate(totals['pairs']):.1f} pairs/s, "
+        f"{rate(totals['processed']):.1f} processed/s"
+    )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Headless CFAB Browser indexer for whole work-folder trees"
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        help="Root folder to index (repeatable; default: work_folderN from config.json)",
+    )
+    parser.add_argument(
+        "--config", default=str(CONFIG_PATH), help="Path to config.json"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPU cores)",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Process every pair, ignoring the incremental scan manifests",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Enable INFO logging"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    roots = args.root or get_work_folder_roots(Path(args.config))
+    if not roots:
+        print("No folders to index (no --root given and no work folders in config)")
+        return 1
+    workers = max(1, args.workers)
+
+    start_time = time.perf_counter()
+    folders = find_folders_to_index(roots)
+    scan_time = time.perf_counter() - start_time
+    print(f"Found {len(folders)} folders to index in {len(roots)} root(s)")
+
+    start_time = time.perf_counter()
+    totals = run_indexer(folders, workers, incremental=not args.full)
+    index_time = time.perf_counter() - start_time
+
+    library_index = get_library_index()
+    if library_index is not None:
+        removed = library_index.remove_missing_folders(roots, folders)
+        stats = library_index.get_stats()
+        print(
+            f"Library index: {stats['assets']} assets in {stats['folders']} folders"
+            f" ({removed} removed folders dropped)"
+        )
+
+    print_summary(totals, scan_time, index_time, workers)
+    return 1 if totals["errors"] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -90,6 +90,7 @@ class AmvController(QObject):
         logger.info(f"Controller: Scan started for: {folder_path}")
         self.view.update_gallery_placeholder("Scanning folder...")
         self.model.control_panel_model.set_progress(0)
+        self.asset_grid_controller.on_scan_started()
         # Update button states at the start of the scan
         self.control_panel_controller.update_button_states()
 
@@ -101,6 +102,11 @@ class AmvController(QObject):
         # Update button states during the scan
         self.control_panel_controller.update_button_states()
 
+    def _on_scan_batch_ready(self, assets: list):
+        """Shows a batch of assets streamed by the running scan."""
+        logger.debug(f"Controller: Scan batch of {len(assets)} assets")
+        self.asset_grid_controller.on_scan_batch_ready(assets)
+
     def _on_scan_completed(self, assets: list, duration: float, operation_type: str):
         with measure_operation(
             "amv_controller.scan_completed",
@@ -118,6 +124,7 @@ class AmvController(QObject):
             )
             self.model.control_panel_model.set_progress(100)
             self.view.update_gallery_placeholder("")
+            self.asset_grid_controller.on_scan_finished()
 
             # Zamiast resetować filtry, zastosuj aktualny filtr do nowych danych
             self.model.asset_grid_model.set_assets(assets)
@@ -125,6 +132,7 @@ class AmvController(QObject):
     def _on_scan_error(self, error_msg: str):
         logger.error(f"Controller: Scan error: {error_msg}")
         self.model.control_panel_model.set_progress(0)
+        self.asset_grid_controller.on_scan_finished()
         self.view.update_gallery_placeholder(f"Scan error: {error_msg}")
         # Aktualizuj stan przycisków po błędzie skanowania
         self.control_panel_controller.update_button_states()
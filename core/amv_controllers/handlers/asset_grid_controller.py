@@ -1,22 +1,40 @@
 """
 AssetGridController - Controller for managing the asset grid.
 Responsible for creating, rebuilding, and updating the asset tile grid.
+
+New tiles are created in chunks of a few milliseconds per event-loop tick
+(cells of tiles not created yet are reserved in the flow layout), tiles in
+the viewport first, so a large folder does not freeze the window and a
+folder switch cancels the remaining work.
+
+Filters are answered by AssetFilterIndex of the folder and applied as
+the difference against the result shown: tiles filtered out are hidden,
+tiles filtered in are shown again, nothing is rebuilt.
 """
 
 import logging
 import os
+import time
 
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, QPoint, QRect, QSize, QTimer
 
 from core.amv_models.asset_tile_model import AssetTileModel
+from core.asset_filter_index import AssetFilterIndex, sort_assets_for_display
+from core.library_index import update_library_asset
+from core.amv_views.asset_gallery_view import AssetGalleryView
 from core.amv_views.asset_tile_pool import AssetTilePool
 from core.performance_monitor import measure_operation
+from core.thumbnail_cache import thumbnail_cache
 from core.utilities import update_main_window_status
+from core.workers.thumbnail_load_scheduler import get_thumbnail_load_scheduler
 
 from ...amv_views.asset_tile_view import AssetTileView
 
 logger = logging.getLogger(__name__)
 
+# Time budget (seconds) for creating tiles in one event-loop tick
+POPULATION_CHUNK_BUDGET = 0.008
+
 
 class AssetGridController(QObject):
     """Controller for managing the asset grid"""
@@ -34,28 +52,89 @@ class AssetGridController(QObject):
 
         # Moved from AmvController
         self.asset_tiles = []  # List of tiles
+        # Tiles of assets hidden by the active filter (asset_id -> tile); they
+        # are out of the layout and are shown again when the filter changes
+        self._filtered_tiles = {}
         self.original_assets = (
             []
         )  # Stores the original list of assets (unfiltered)
         self.drag_and_drop_enabled = True  # D&D lock flag
 
         self.active_star_filter = 0  # 0 = no filter, 1-5 = star filter
+        self.active_color_filter = None  # None = no filter, otherwise asset color
+
+        # Filter index of original_assets (built on first use) and the
+        # positions currently shown (None - unfiltered list)
+        self._filter_index = None
+        self._filter_result = None
         
         # OPTIMIZATION: Throttling for rebuild_asset_grid
-        from PyQt6.QtCore import QTimer
         self._rebuild_timer = QTimer()
         self._rebuild_timer.setSingleShot(True)
         self._rebuild_timer.timeout.connect(self._perform_delayed_rebuild)
         self._pending_assets = None
+        self._pending_update_existing = True
+
+        # Assets streamed by the running scan (None when not streaming)
+        self._streamed_assets = None
+
+        # Chunked tile creation: (cell index, asset) still to create, stack
+        # popped from the end; assets of the grid being populated
+        self._population_queue = []
+        self._population_assets = []
+        self._population_timer = QTimer()
+        self._population_timer.setSingleShot(True)
+        self._population_timer.timeout.connect(self._populate_next_chunk)
+
+        # Thumbnails of tiles in the viewport are loaded first
+        get_thumbnail_load_scheduler().set_scroll_area(self.view.scroll_area)
+
+        # Virtualized gallery (config.json: "virtual_gallery") - no tiles
+        self.gallery_view = None
+        if self._is_virtual_gallery_enabled():
+            self._create_virtual_gallery()
 
     def setup(self):
         """Initializes the asset grid"""
         logger.debug("Asset grid model connected to view - STAGE 9")
 
+    def _is_virtual_gallery_enabled(self) -> bool:
+        """Checks config.json "virtual_gallery" flag"""
+        try:
+            config = self.model.config_manager.get_config()
+            return bool(config.get("virtual_gallery", False))
+        except Exception as e:
+            logger.debug(f"Could not read virtual_gallery flag: {e}")
+            return False
+
+    def _create_virtual_gallery(self):
+        """Creates the model/delegate gallery used instead of AssetTileView tiles"""
+        self.gallery_view = AssetGalleryView(
+            self.model.selection_model,
+            self.model.control_panel_model.get_thumbnail_size(),
+        )
+        self.gallery_view.thumbnail_clicked.connect(
+            lambda asset_id, asset_path: self.controller._handle_file_action(
+                asset_path, "thumbnail"
+            )
+        )
+        self.gallery_view.filename_clicked.connect(
+            lambda asset_id, asset_path: self.controller._handle_file_action(
+                asset_path, "filename"
+            )
+        )
+        self.gallery_view.checkbox_state_changed.connect(
+            lambda checked: self.controller.control_panel_controller.update_button_states()
+        )
+        self.gallery_view.stars_changed.connect(self._on_asset_data_changed)
+        self.view.set_virtual_gallery(self.gallery_view)
+        logger.info("Virtual asset gallery enabled")
+
     def on_assets_changed(self, assets):
         """Handles asset list changes"""
         if assets is None or len(assets) == 0:  # More specific check for None
             self.set_original_assets([])
+            self.controller.control_panel_controller.update_color_filter_options()
             return
         self.set_original_assets(assets)
         self.rebuild_asset_grid(assets)
@@ -69,15 +148,37 @@ class AssetGridController(QObject):
             # via signal connections, avoiding cross-controller dependencies
             pass
 
+        # Colors of the new asset list in the control panel color filter
+        self.controller.control_panel_controller.update_color_filter_options()
+
         # Update button states after asset change
         self.controller.control_panel_controller.update_button_states()
 
-    def rebuild_asset_grid(self, assets: list):
+    def on_scan_started(self):
+        """Streams scan batches into the grid only when it starts empty (new folder)"""
+        self._streamed_assets = [] if not self.get_displayed_asset_count() else None
+
+    def on_scan_batch_ready(self, batch: list):
+        """Adds a batch of scanned assets to the grid while the scan is running"""
+        if self._streamed_assets is None:
+            return
+        self._streamed_assets.extend(batch)
+        self.original_assets = self._streamed_assets
+        self._reset_filter_index()
+        # Tiles already shown are unchanged - numbering is refreshed at the end
+        self.rebuild_asset_grid(self._streamed_assets, update_existing=False)
+
+    def on_scan_finished(self):
+        """Ends streaming; the full asset list arrives through assets_changed"""
+        self._streamed_assets = None
+
+    def rebuild_asset_grid(self, assets: list, update_existing: bool = True):
         """
         Throttled version of asset grid rebuild to prevent excessive calls.
         """
         # OPTYMALIZACJA: Throttling - opóźnij rebuild o 50ms
         self._pending_assets = assets
+        self._pending_update_existing = update_existing
         self._rebuild_timer.start(50)  # 50ms delay
     
     def _perform_delayed_rebuild(self):
@@ -85,19 +186,23 @@ class AssetGridController(QObject):
         Performs the actual delayed rebuild.
         """
         if self._pending_assets is not None:
-            self._rebuild_asset_grid_immediate(self._pending_assets)
+            self._rebuild_asset_grid_immediate(
+                self._pending_assets, self._pending_update_existing
+            )
             self._pending_assets = None
 
-    def _rebuild_asset_grid_immediate(self, assets: list):
+    def _rebuild_asset_grid_immediate(self, assets: list, update_existing: bool = True):
         """
         Intelligently synchronizes the grid with the new asset list, minimizing
         UI operations to eliminate flickering and loading errors.
         """
         # First, extract the folder tile (is_special_folder), sort the rest alphabetically
-        folder_tile = [a for a in assets if a.get("type") == "special_folder"]
-        other_tiles = [a for a in assets if a.get("type") != "special_folder"]
-        other_tiles.sort(key=lambda x: x.get("name", "").lower())
-        assets = folder_tile + other_tiles
+        assets = sort_assets_for_display(assets)
+        if self.gallery_view is not None:
+            self._rebuild_virtual_gallery(assets)
+            return
+        # Tiles not created yet are compared with the new list again
+        self._cancel_population()
         with measure_operation(
             "asset_grid_controller.rebuild_asset_grid", {"assets_count": len(assets)}
         ):
@@ -110,13 +215,36 @@ class AssetGridController(QObject):
                 ids_to_add,
                 ids_to_update,
             ) = self._prepare_asset_maps(assets)
-            self._remove_unnecessary_tiles(ids_to_remove, current_tile_map)
-            self._update_existing_tiles(assets, ids_to_update, current_tile_map)
-            self._add_new_tiles(assets, ids_to_add, current_tile_map)
+            self._remove_unnecessary_tiles(
+                ids_to_remove, current_tile_map, self._get_folder_asset_ids()
+            )
+            if update_existing:
+                self._update_existing_tiles(assets, ids_to_update, current_tile_map)
+            pending = self._add_new_tiles(assets, ids_to_add, current_tile_map)
             if not new_ids:
+                self.view.gallery_layout.set_widgets([])
                 self._finalize_grid_update(empty=True)
                 return
             self._reorganize_layout(assets, current_tile_map)
+            self._start_population(assets, pending)
+            self._finalize_grid_update()
+
+    def _rebuild_virtual_gallery(self, assets: list):
+        """Shows the asset list in the virtualized gallery (no widgets per asset)"""
+        with measure_operation(
+            "asset_grid_controller.rebuild_virtual_gallery",
+            {"assets_count": len(assets)},
+        ):
+            self.gallery_view.set_thumbnail_size(
+                self.model.control_panel_model.get_thumbnail_size()
+            )
+            self.gallery_view.set_assets(
+                assets, self.model.asset_grid_model.get_current_folder() or ""
+            )
+            if not assets:
+                self._finalize_grid_update(empty=True)
+                return
+            self.view.update_gallery_placeholder("")
             self._finalize_grid_update()
 
     def _prepare_asset_maps(self, assets):
@@ -137,68 +265,153 @@ class AssetGridController(QObject):
             ids_to_update,
         )
 
-    def _remove_unnecessary_tiles(self, ids_to_remove, current_tile_map):
+    def _get_folder_asset_ids(self) -> set:
+        """Names of all assets of the current folder (unfiltered)"""
+        return {asset.get("name") for asset in self.original_assets}
+
+    def _remove_unnecessary_tiles(self, ids_to_remove, current_tile_map, folder_ids):
+        """Hides tiles filtered out, returns tiles of removed assets to the pool"""
         for asset_id in ids_to_remove:
             tile = current_tile_map.pop(asset_id)
-            self.tile_pool.release(tile)
-            self.asset_tiles.remove(tile)
+            if asset_id in folder_ids:
+                # Filtr - tylko ukryj, kafelek zostaje w layoucie
+                tile.hide()
+                self._filtered_tiles[asset_id] = tile
+            else:
+                self.tile_pool.release(tile)
+        if ids_to_remove:
+            self.asset_tiles = [
+                tile for tile in self.asset_tiles if tile.asset_id not in ids_to_remove
+            ]
+        # Assets removed from the folder while filtered out
+        for asset_id in [a for a in self._filtered_tiles if a not in folder_ids]:
+            self.tile_pool.release(self._filtered_tiles.pop(asset_id))
 
     def _update_existing_tiles(self, assets, ids_to_update, current_tile_map):
         for i, asset in enumerate(assets):
             asset_id = asset["name"]
             if asset_id in ids_to_update:
                 tile = current_tile_map[asset_id]
+                if tile.model is not None and tile.model.data is asset:
+                    continue  # Same record (e.g. filter change) - nothing to update
                 tile_model = AssetTileModel(asset, self._get_asset_file_path(asset_id))
+                self._connect_tile_model(tile_model)
                 tile.update_asset_data(tile_model, i + 1, len(assets))
 
     def _add_new_tiles(self, assets, ids_to_add, current_tile_map):
-        thumb_size = self.model.control_panel_model.get_thumbnail_size()
+        """Shows tiles hidden by the filter again; returns (index, asset) to create"""
+        pending = []
         for i, asset in enumerate(assets):
             asset_id = asset["name"]
             if asset_id in ids_to_add:
-                tile_model = AssetTileModel(asset, self._get_asset_file_path(asset_id))
-                tile = self.tile_pool.acquire(
-                    tile_model, thumb_size, i + 1, len(assets)
-                )
-                self._connect_tile_signals(tile)
-                self.asset_tiles.append(tile)
-                current_tile_map[asset_id] = tile
+                tile = self._filtered_tiles.pop(asset_id, None)
+                if tile is not None and tile.model.data is asset:
+                    # Tile hidden by the filter - shown again in _reorganize_layout
+                    self.asset_tiles.append(tile)
+                    current_tile_map[asset_id] = tile
+                    continue
+                if tile is not None:
+                    self.tile_pool.release(tile)
+                pending.append((i, asset))
+        return pending
+
+    def _create_tile(self, asset, number, total, thumb_size) -> AssetTileView:
+        """Acquires a tile for an asset from the pool and connects it"""
+        asset_id = asset["name"]
+        tile_model = AssetTileModel(asset, self._get_asset_file_path(asset_id))
+        self._connect_tile_model(tile_model)
+        tile = self.tile_pool.acquire(tile_model, thumb_size, number, total)
+        if tile.thumbnail_size != thumb_size:
+            tile.update_thumbnail_size(thumb_size)  # Tile from the pool
+        self._connect_tile_signals(tile)
+        return tile
 
     def _reorganize_layout(self, assets, current_tile_map):
+        """Sets the tile order and numbers; the flow layout moves only changed cells"""
         self.view.update_gallery_placeholder("")
-        cols = self.model.asset_grid_model.get_columns()
-        sorted_tiles = [
-            current_tile_map[asset["name"]]
-            for asset in assets
-            if asset["name"] in current_tile_map
-        ]
-        
-        # OPTIMIZATION: Check if layout actually needs rebuilding using hash
-        new_layout_hash = hash(tuple(asset["name"] for asset in assets))
-        
-        if hasattr(self, '_last_layout_hash') and self._last_layout_hash == new_layout_hash:
-            logger.debug("Layout unchanged - skipping full rebuild")
+        # None - cell reserved for a tile created by _populate_next_chunk
+        cells = [current_tile_map.get(asset["name"]) for asset in assets]
+        layout = self.view.gallery_layout
+        layout.set_columns(self.model.asset_grid_model.get_columns())
+        # Rozmiar komórki znany zanim powstanie pierwszy kafelek (widoczne
+        # komórki po zmianie folderu, gdy siatka jest pusta)
+        thumb_size = self.model.control_panel_model.get_thumbnail_size()
+        layout.set_cell_size(QSize(*AssetTileView.get_tile_size_for(thumb_size)))
+        layout.set_widgets(cells)
+
+        total = len(assets)
+        for number, tile in enumerate(cells, 1):
+            if tile is None:
+                continue
+            tile.set_tile_number(number, total)
+            if tile.isHidden():
+                tile.show()
+
+    def _start_population(self, assets, pending):
+        """Queues tile creation; cells in the viewport are created first"""
+        if not pending:
             return
-        
-        self._last_layout_hash = new_layout_hash
-        
-        # Full rebuild only when necessary
-        logger.debug("Layout changed - performing full rebuild")
-        while self.view.gallery_layout.count():
-            item = self.view.gallery_layout.takeAt(0)
-            if item.widget():
-                item.widget().hide()
-        for i, tile in enumerate(sorted_tiles):
-            row, col = divmod(i, cols)
-            self.view.gallery_layout.addWidget(tile, row, col)
+        visible = self.view.gallery_layout.get_cells_in_rect(self._get_viewport_rect())
+        # Stos zdejmowany od końca: widoczne komórki na końcu, reszta malejąco
+        pending.sort(key=lambda entry: (entry[0] in visible, -entry[0]))
+        self._population_queue = pending
+        self._population_assets = assets
+        logger.debug(
+            f"Populating {len(pending)} tiles in chunks "
+            f"({len([e for e in pending if e[0] in visible])} visible)"
+        )
+        self._populate_next_chunk()
+
+    def _populate_next_chunk(self):
+        """Creates tiles until the time budget of this tick is used up"""
+        if not self._population_queue:
+            return
+        deadline = time.perf_counter() + POPULATION_CHUNK_BUDGET
+        thumb_size = self.model.control_panel_model.get_thumbnail_size()
+        total = len(self._population_assets)
+        layout = self.view.gallery_layout
+        created = 0
+        while self._population_queue and (
+            created == 0 or time.perf_counter() < deadline
+        ):
+            index, asset = self._population_queue.pop()
+            tile = self._create_tile(asset, index + 1, total, thumb_size)
+            layout.set_widget_at(index, tile)
+            self.asset_tiles.append(tile)
             tile.show()
+            created += 1
+
+        if self._population_queue:
+            self._population_timer.start(0)
+        else:
+            logger.debug(f"Grid population finished ({total} assets)")
+            self._population_assets = []
+            self._finalize_grid_update()
+
+    def _cancel_population(self):
+        """Drops tiles not created yet (their cells stay reserved until set_widgets)"""
+        self._population_timer.stop()
+        if self._population_queue:
+            logger.debug(f"Cancelled creation of {len(self._population_queue)} tiles")
+        self._population_queue = []
+        self._population_assets = []
+
+    def is_populating(self) -> bool:
+        """True while tiles of the grid are still being created"""
+        return bool(self._population_queue)
+
+    def _get_viewport_rect(self) -> QRect:
+        """Scroll area viewport in gallery widget coordinates"""
+        viewport = self.view.scroll_area.viewport()
+        top_left = self.view.gallery_content_widget.mapFrom(viewport, QPoint(0, 0))
+        return QRect(top_left, viewport.size())
 
     def _finalize_grid_update(self, empty=False):
         if empty:
             self.view.update_gallery_placeholder("No assets found in this folder.")
             update_main_window_status(self.view)
             return
-        self.view.stacked_layout.setCurrentIndex(0)
+        self.view.stacked_layout.setCurrentIndex(self.view.gallery_page_index)
         self.controller.control_panel_controller.update_button_states()
         update_main_window_status(self.view)
 
@@ -209,6 +422,17 @@ class AssetGridController(QObject):
             return os.path.join(current_folder, f"{asset_name}.asset")
         return ""
 
+    def _connect_tile_model(self, tile_model: AssetTileModel):
+        """Keeps the filter index in step with ratings set on a tile"""
+        tile_model.data_changed.connect(
+            lambda: self._on_asset_data_changed(tile_model.data)
+        )
+
+    def _on_asset_data_changed(self, asset: dict):
+        if self._filter_index is not None:
+            self._filter_index.update_asset(asset)
+        update_library_asset(self.model.asset_grid_model.get_current_folder(), asset)
+
     def _connect_tile_signals(self, tile: AssetTileView):
         """Connects signals for a newly acquired tile."""
         try:
@@ -236,6 +460,8 @@ class AssetGridController(QObject):
         """Handles loading state change"""
         logger.debug(f"Loading state changed: {is_loading}")
         self.drag_and_drop_enabled = not is_loading
+        if self.gallery_view is not None:
+            self.gallery_view.set_drag_and_drop_enabled(self.drag_and_drop_enabled)
         # Pass the flag to all asset tiles
         for tile in self.asset_tiles:
             if hasattr(tile, "set_drag_and_drop_enabled"):
@@ -252,6 +478,10 @@ class AssetGridController(QObject):
     def on_thumbnail_size_changed(self, size: int):
         """Handles thumbnail size change."""
         logger.debug(f"Controller: Thumbnail size changed to {size}")
+        # Display variants of the previous size will not be shown again
+        thumbnail_cache.invalidate_variants(size)
+        if self.gallery_view is not None:
+            self.gallery_view.set_thumbnail_size(size)
         gallery_width = self.view.gallery_container_widget.width()
         # Just request a column recalculation with the new size.
         # Tile updates will happen in on_recalculate_columns_requested.
@@ -262,21 +492,21 @@ class AssetGridController(QObject):
     ):
         """Handles column recalculation request, rearranging existing widgets."""
         logger.debug("Rearranging layout due to size or settings change.")
+        if self.gallery_view is not None:
+            # The list view lays out its cells itself
+            self.gallery_view.set_thumbnail_size(thumbnail_size)
+            self.controller.control_panel_controller.update_button_states()
+            return
         cols = self.model.asset_grid_model.get_columns()
 
-        # Collect all widgets from the current layout
-        widgets = []
-        while self.view.gallery_layout.count() > 0:
-            item = self.view.gallery_layout.takeAt(0)
-            if item and item.widget():
-                widgets.append(item.widget())
+        # Only tiles of another size are updated; positions follow the columns
+        for tile in self.asset_tiles + list(self._filtered_tiles.values()):
+            if tile.thumbnail_size != thumbnail_size:
+                tile.update_thumbnail_size(thumbnail_size)
+        self.view.gallery_layout.set_columns(cols)
 
-        # Add them back in the new configuration
-        for i, widget in enumerate(widgets):
-            # Size update might be needed
-            widget.update_thumbnail_size(thumbnail_size)
-            row, col = divmod(i, cols)
-            self.view.gallery_layout.addWidget(widget, row, col)
+        # Tile positions changed - visible thumbnails first again
+        get_thumbnail_load_scheduler().reprioritize()
 
         self.controller.control_panel_controller.update_button_states()
 
@@ -291,12 +521,21 @@ class AssetGridController(QObject):
                 self.asset_tiles.clear()
                 return
             
+            # Folder switch - tiles not created yet are not needed
+            self._cancel_population()
+
             for tile_view in self.asset_tiles:
                 # Sprawdź czy kafelek nie jest już w puli
                 if hasattr(tile_view, 'isVisible') and tile_view.isVisible():
                     self.tile_pool.release(tile_view)
                 
+            for tile_view in self._filtered_tiles.values():
+                self.tile_pool.release(tile_view)
+            self._filtered_tiles.clear()
             self.asset_tiles.clear()
+            self.view.gallery_layout.set_widgets([])
+            if self.gallery_view is not None:
+                self.gallery_view.clear_assets()
             logger.debug("OPTYMALIZACJA: Wszystkie kafelki zwrócone do puli")
             
         except Exception as e:
@@ -308,9 +547,37 @@ class AssetGridController(QObject):
         """Returns the list of asset tiles"""
         return self.asset_tiles
 
+    def get_displayed_asset_ids(self) -> list:
+        """Returns IDs of the displayed assets (without special folders)"""
+        if self.gallery_view is not None:
+            return self.gallery_view.get_asset_ids()
+        return [
+            tile.asset_id
+            for tile in self.asset_tiles
+            if tile.asset_id and not tile.model.is_special_folder
+        ]
+
+    def get_displayed_asset_count(self) -> int:
+        """Returns the number of displayed items (tiles or gallery rows)"""
+        if self.gallery_view is not None:
+            return self.gallery_view.asset_count()
+        return len(self.asset_tiles)
+
+    def remove_displayed_assets(self, asset_ids: list):
+        """Removes moved/deleted assets from the virtualized gallery"""
+        if self.gallery_view is not None:
+            self.gallery_view.remove_assets(asset_ids)
+        elif self.is_populating():
+            # Removed tiles shift the reserved cells - queue the rest again
+            removed = set(asset_ids)
+            assets = [a for a in self._population_assets if a["name"] not in removed]
+            self._cancel_population()
+            self.rebuild_asset_grid(assets)
+
     def set_original_assets(self, assets):
         """Sets the original list of assets (unfiltered)"""
         self.original_assets = assets.copy() if assets else []
+        self._reset_filter_index()
         logger.debug(
             f"AssetGridController: Original assets set to {len(self.original_assets)} items."
         )
@@ -322,6 +589,74 @@ class AssetGridController(QObject):
         )
         return self.original_assets
 
+    def _reset_filter_index(self):
+        """The asset list changed - the index is rebuilt on the next filter"""
+        self._filter_index = None
+        self._filter_result = None
+
+    def get_filter_index(self) -> AssetFilterIndex:
+        """Filter index of the original (unfiltered) assets of the folder"""
+        if self._filter_index is None:
+            with measure_operation(
+                "asset_grid_controller.build_filter_index",
+                {"assets_count": len(self.original_assets)},
+            ):
+                self._filter_index = AssetFilterIndex(self.original_assets)
+        return self._filter_index
+
+    def apply_filter_result(self, positions):
+        """Shows the assets at the given filter index positions
+
+        Only the difference against the positions shown is applied: tiles
+        filtered out are hidden and tiles filtered in are shown again.
+        """
+        index = self.get_filter_index()
+        previous = self._filter_result
+        if previous is None:
+            previous = index.all_positions  # Grid shows the whole folder
+        self._filter_result = positions
+        if positions is previous or positions == previous:
+            return
+
+        assets = index.get_assets(positions)
+        if (
+            self.gallery_view is not None
+            or self.is_populating()
+            or self._rebuild_timer.isActive()
+        ):
+            self.rebuild_asset_grid(assets)
+            return
+
+        tile_map = {tile.asset_id: tile for tile in self.asset_tiles}
+        added = [index.assets[p] for p in positions - previous]
+        for asset in added:
+            tile = self._filtered_tiles.get(asset["name"])
+            if tile is None or tile.model.data is not asset:
+                # Nowy kafelek do utworzenia - pełna synchronizacja
+                self.rebuild_asset_grid(assets)
+                return
+
+        with measure_operation(
+            "asset_grid_controller.apply_filter_result",
+            {"assets_count": len(assets), "changed": len(previous ^ positions)},
+        ):
+            for position in previous - positions:
+                asset_id = index.assets[position]["name"]
+                tile = tile_map.pop(asset_id, None)
+                if tile is not None:
+                    tile.hide()
+                    self._filtered_tiles[asset_id] = tile
+            for asset in added:
+                tile_map[asset["name"]] = self._filtered_tiles.pop(asset["name"])
+            self.asset_tiles = list(tile_map.values())
+
+            if not assets:
+                self.view.gallery_layout.set_widgets([])
+                self._finalize_grid_update(empty=True)
+                return
+            self._reorganize_layout(assets, tile_map)
+            self._finalize_grid_update()
+
     def set_star_filter(self, min_stars: int):
         """Sets the active star filter"""
         self.active_star_filter = min_stars
@@ -331,3 +666,13 @@ class AssetGridController(QObject):
         """Clears the star filter"""
         self.active_star_filter = 0
         logger.debug("Cleared star filter")
+
+    def set_color_filter(self, color: str):
+        """Sets the active color filter"""
+        self.active_color_filter = color
+        logger.debug(f"Set color filter: {color}")
+
+    def clear_color_filter(self):
+        """Clears the color filter"""
+        self.active_color_filter = None
+        logger.debug("Cleared color filter")
@@ -39,7 +39,7 @@ class AssetRebuildController(QObject):
             self.asset_rebuilder = AssetRebuilderWorker(folder_path)
 
             # Connect signals
-            self.asset_rebuilder.progress_updated.connect(self.on_rebuild_progress)
+            self.asset_rebuilder.progress_batch.connect(self.on_rebuild_progress)
             self.asset_rebuilder.finished.connect(self.on_rebuild_finished)
             self.asset_rebuilder.error_occurred.connect(self.on_rebuild_error)
 
@@ -60,16 +60,19 @@ class AssetRebuildController(QObject):
             # First, request a stop
             self.asset_rebuilder.request_stop()
             
-            # Try to gracefully quit
+            # The scanner stops after the pairs in progress and saves a checkpoint,
+            # terminate() could leave half-written .asset files behind
             if not self.asset_rebuilder.wait(3000):  # 3-second timeout
-                logger.warning("Rebuild worker did not stop gracefully, forcing termination...")
-                self.asset_rebuilder.terminate()
+                logger.warning(
+                    "Rebuild worker is finishing the pairs in progress, waiting..."
+                )
                 self.asset_rebuilder.wait()
             
             logger.info("Rebuild has been stopped.")
 
-    def on_rebuild_progress(self, current: int, total: int, message: str):
-        """Handles asset rebuild progress"""
+    def on_rebuild_progress(self, progress_batch: list):
+        """Handles asset rebuild progress (latest step of a batch)"""
+        current, total, message = progress_batch[-1]
         progress = int((current / total) * 100) if total > 0 else 0
         self.model.control_panel_model.set_progress(progress)
         logger.debug(f"Rebuild progress: {progress}% - {message}")
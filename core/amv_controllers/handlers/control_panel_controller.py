@@ -4,7 +4,6 @@ Responsible for handling buttons, filtering, and asset selection.
 """
 
 import logging
-import os
 
 from PyQt6.QtCore import QObject, QTimer
 
@@ -36,20 +35,12 @@ class ControlPanelController(QObject):
         logger.debug("Controller: Select all clicked")
 
         # Get only the assets that are currently displayed (filtered)
-        visible_asset_ids = []
-        asset_tiles = self.controller.asset_grid_controller.get_asset_tiles()
-        for tile in asset_tiles:
-            if not tile.model.is_special_folder:
-                asset_id = tile.asset_id
-                if asset_id:
-                    visible_asset_ids.append(asset_id)
-                    # Check if the asset is not already selected before adding
-                    if (
-                        asset_id
-                        not in self.model.selection_model.get_selected_asset_ids()
-                    ):
-                        self.model.selection_model.add_selection(asset_id)
+        asset_grid_controller = self.controller.asset_grid_controller
+        visible_asset_ids = asset_grid_controller.get_displayed_asset_ids()
+        # One selection_changed signal for all assets
+        self.model.selection_model.add_selections(visible_asset_ids)
 
+        asset_tiles = asset_grid_controller.get_asset_tiles()
         # Visually update all tiles
         for tile in asset_tiles:
             if not tile.model.is_special_folder:
@@ -98,11 +89,9 @@ class ControlPanelController(QObject):
         selected_count = len(self.model.selection_model.get_selected_asset_ids())
 
         # Count only visible assets (excluding special folders)
-        visible_assets_count = 0
-        asset_tiles = self.controller.asset_grid_controller.get_asset_tiles()
-        for tile in asset_tiles:
-            if not tile.model.is_special_folder:
-                visible_assets_count += 1
+        visible_assets_count = len(
+            self.controller.asset_grid_controller.get_displayed_asset_ids()
+        )
 
         has_any_selection = selected_count > 0
         has_working_folder = bool(self.model.asset_grid_model.get_current_folder())
@@ -165,19 +154,49 @@ class ControlPanelController(QObject):
             logger.info(f"Selected {star_rating} stars - filtering")
         logger.info("=== END OF STAR FILTERING ===")
 
+    def on_color_filter_changed(self, index: int):
+        """Handles choosing a color in the control panel color filter"""
+        color = self.view.color_filter_combo.itemData(index)
+        asset_grid_controller = self.controller.asset_grid_controller
+        if color is None:
+            asset_grid_controller.clear_color_filter()
+        else:
+            asset_grid_controller.set_color_filter(color)
+        self.filter_assets()
+
+    def update_color_filter_options(self):
+        """Fills the color filter with the colors of the folder's assets
+
+        An active color that the folder still has stays selected and is
+        applied to the new asset list; otherwise the filter is cleared.
+        """
+        combo = self.view.color_filter_combo
+        asset_grid_controller = self.controller.asset_grid_controller
+        colors = asset_grid_controller.get_filter_index().get_colors()
+        active_color = asset_grid_controller.active_color_filter
+        combo.blockSignals(True)
+        try:
+            while combo.count() > 1:
+                combo.removeItem(1)
+            for color in colors:
+                combo.addItem(color, color)
+            combo.setCurrentIndex(max(0, combo.findData(active_color)))
+        finally:
+            combo.blockSignals(False)
+        if active_color is None:
+            return
+        if active_color in colors:
+            self.filter_assets()
+        else:
+            asset_grid_controller.clear_color_filter()
+
     def filter_assets(self):
-        """Filters assets by stars and text at once."""
-        min_stars = self.controller.asset_grid_controller.active_star_filter
-        text = self.view.text_input.text().strip().lower() if hasattr(self.view, 'text_input') else ''
-        original_assets = self.controller.asset_grid_controller.get_original_assets()
-        filtered_assets = []
-        for asset in original_assets:
-            if asset.get("type") == "special_folder":
-                filtered_assets.append(asset)
-                continue
-            stars = asset.get("stars") or 0
-            name = asset.get("name", "")
-            name_no_ext = os.path.splitext(name)[0].lower()
-            if (min_stars == 0 or stars >= min_stars) and (not text or text in name_no_ext):
-                filtered_assets.append(asset)
-        self.controller.asset_grid_controller.rebuild_asset_grid(filtered_assets)
+        """Filters assets by stars, color and text at once (folder filter index)."""
+        asset_grid_controller = self.controller.asset_grid_controller
+        text = self.view.text_input.text() if hasattr(self.view, 'text_input') else ''
+        positions = asset_grid_controller.get_filter_index().query(
+            min_stars=asset_grid_controller.active_star_filter,
+            text=text,
+            color=asset_grid_controller.active_color_filter,
+        )
+        asset_grid_controller.apply_filter_result(positions)
@@ -218,6 +218,9 @@ class FileOperationController(QObject):
     
     def _update_controller_asset_list(self, success_messages: list):
         """Aktualizuje listę assetów w kontrolerze"""
+        # Galeria wirtualna - usuń wiersze z modelu listy
+        self.controller.asset_grid_controller.remove_displayed_assets(success_messages)
+
         asset_tiles = self.controller.asset_grid_controller.get_asset_tiles()
         if asset_tiles:
             logger.debug(f"Active tiles count before removal: {len(asset_tiles)}")
@@ -1,4 +1,5 @@
 import logging
+import os
 
 from PyQt6.QtCore import QObject, Qt
 
@@ -152,6 +153,29 @@ class FolderTreeController(QObject):
             self.controller.working_directory_changed.emit(folder_path)
             logger.info("working_directory_changed signal was emitted")
 
+    def open_folder(self, folder_path: str):
+        """Opens any folder of the library (e.g. a library search result)
+
+        Switches the tree to the work folder containing it if needed.
+        """
+        folder_key = os.path.normcase(os.path.abspath(folder_path))
+        root = self.model.folder_system_model.get_root_folder()
+        if not root or not self._is_in_folder(folder_key, root):
+            for workspace_folder in self.model.workspace_folders_model.get_folders():
+                path = workspace_folder.get("path")
+                if path and self._is_in_folder(folder_key, path):
+                    logger.info(f"Switching root folder to {path} for {folder_path}")
+                    self.model.folder_system_model.set_root_folder(path)
+                    break
+        self.on_folder_clicked(folder_path)
+
+    @staticmethod
+    def _is_in_folder(folder_key: str, parent_path: str) -> bool:
+        parent_key = os.path.normcase(os.path.abspath(parent_path))
+        return folder_key == parent_key or folder_key.startswith(
+            parent_key.rstrip(os.sep) + os.sep
+        )
+
     def on_tree_item_clicked(self, index):
         model = self.view.folder_tree_view.model()
         item = model.itemFromIndex(index)
@@ -88,6 +88,11 @@ class SignalConnector:
                 )
             )
 
+        # --- Color filter signal from the control panel ---
+        self.view.color_filter_combo.currentIndexChanged.connect(
+            control_panel_controller.on_color_filter_changed
+        )
+
         # --- Text filter signal connection ---
         # Połącz sygnał filtra tekstowego
         if hasattr(self.view, 'text_input') and self.view.text_input:
@@ -111,6 +116,9 @@ class SignalConnector:
         self.model.asset_grid_model.scan_progress.connect(
             self.controller._on_scan_progress
         )
+        self.model.asset_grid_model.scan_batch_ready.connect(
+            self.controller._on_scan_batch_ready
+        )
         self.model.asset_grid_model.scan_completed.connect(
             self.controller._on_scan_completed
         )
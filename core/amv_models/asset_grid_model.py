@@ -5,7 +5,7 @@ from typing import Any, List, Optional
 from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QIcon, QStandardItem, QStandardItemModel
 
-from core.scanner import AssetRepository
+from core.workers.asset_scan_worker import AssetScanWorker
 from core.amv_models.folder_system_model import FolderSystemModel
 from core.amv_models.workspace_folders_model import WorkspaceFoldersModel
 
@@ -21,6 +21,7 @@ class AssetGridModel(QObject):
     recalculate_columns_requested = pyqtSignal(int, int)
     scan_started = pyqtSignal(str)
     scan_progress = pyqtSignal(int, int, str)
+    scan_batch_ready = pyqtSignal(list)  # part of the assets, while scanning
     scan_completed = pyqtSignal(list, float, str)
     scan_error = pyqtSignal(str)
 
@@ -35,6 +36,8 @@ class AssetGridModel(QObject):
         self._recalc_timer = QTimer(self)
         self._recalc_timer.setSingleShot(True)
         self._recalc_timer.timeout.connect(self._perform_recalculate_columns)
+        self._scan_worker = None
+        self._retired_scan_workers = set()
 
         logger.debug("AssetGridModel initialized")
 
@@ -65,52 +68,90 @@ class AssetGridModel(QObject):
         return self._current_folder_path
 
     def scan_folder(self, folder_path: str):
-        """RELOADS assets in the folder - refresh = reload!"""
-        import time
+        """RELOADS assets in the folder - refresh = reload!
 
-        start_time = time.time()
+        The scan runs in AssetScanWorker; records are forwarded in batches
+        through scan_batch_ready and the full list through scan_completed.
+        """
+        self.scan_started.emit(folder_path)
+        logger.info("WCZYTYWANIE OD NOWA assetów w folderze: %s", folder_path)
 
-        try:
-            self.scan_started.emit(folder_path)
-            logger.info("WCZYTYWANIE OD NOWA assetów w folderze: %s", folder_path)
-
-            if not os.path.exists(folder_path):
-                error_msg = f"Folder does not exist: {folder_path}"
-                logger.error(error_msg)
-                self.scan_error.emit(error_msg)
-                return
-
-            # WCZYTAJ OD NOWA - najpierw skanuj i utwórz assety
-            asset_repository = AssetRepository()
-            
-            # Skanuj folder i utwórz nowe assety
-            def progress_callback(current, total, message):
-                if total > 0:
-                    # Map scan progress to the 10-90% range
-                    progress_percent = 10 + int((current / total) * 80)
-                    self.scan_progress.emit(progress_percent, 100, message)
-                else:
-                    self.scan_progress.emit(50, 100, message)
-
-            scanned_assets = asset_repository.find_and_create_assets(
-                folder_path, progress_callback, use_async_thumbnails=False
-            )
-            logger.debug("Skanowanie zakończone, znaleziono %d assetów", len(scanned_assets))
-
-            # WCZYTAJ OD NOWA - teraz załaduj wszystkie assety z plików .asset
-            all_assets = asset_repository.load_existing_assets(folder_path)
-            logger.debug("WCZYTANO OD NOWA %d assetów z plików .asset", len(all_assets))
-
-            duration = time.time() - start_time
-            logger.debug(f"WCZYTYWANIE OD NOWA zakończone, łącznie {len(all_assets)} assetów")
-            self.scan_completed.emit(all_assets, duration, "scan_folder")
+        # Wyniki poprzedniego skanowania (inny folder) są ignorowane
+        self._stop_scan_worker()
+
+        if not os.path.exists(folder_path):
+            error_msg = f"Folder does not exist: {folder_path}"
+            logger.error(error_msg)
+            self.scan_error.emit(error_msg)
+            return
 
+        try:
+            worker = AssetScanWorker(folder_path)
+            worker.assets_batch_ready.connect(self._on_scan_batch_ready)
+            worker.progress_batch.connect(self._on_scan_worker_progress)
+            worker.scan_finished.connect(self._on_scan_worker_finished)
+            worker.error_occurred.connect(self._on_scan_worker_error)
+            worker.finished.connect(self._on_scan_thread_finished)
+            self._scan_worker = worker
+            worker.start()
         except Exception as e:
-            duration = time.time() - start_time
             error_msg = f"Error during scan: {str(e)}"
             logger.error(error_msg)
             self.scan_error.emit(error_msg)
 
+    def is_scanning(self) -> bool:
+        return self._scan_worker is not None
+
+    def _stop_scan_worker(self):
+        """Stops the running scan; the thread is kept alive until it finishes"""
+        worker = self._scan_worker
+        if worker is None:
+            return
+        self._scan_worker = None
+        worker.request_stop()
+        if worker.isRunning():
+            self._retired_scan_workers.add(worker)
+        logger.debug("Stopped previous scan: %s", worker.folder_path)
+
+    def _is_current_scan_worker(self) -> bool:
+        sender = self.sender()
+        return sender is not None and sender is self._scan_worker
+
+    def _on_scan_batch_ready(self, batch: list):
+        if self._is_current_scan_worker():
+            self.scan_batch_ready.emit(batch)
+
+    def _on_scan_worker_progress(self, progress_batch: list):
+        if not self._is_current_scan_worker():
+            return
+        # Only the latest step of the batch is shown
+        current, total, message = progress_batch[-1]
+        if total > 0:
+            # Map scan progress to the 10-90% range
+            progress_percent = 10 + int((current / total) * 80)
+            self.scan_progress.emit(progress_percent, 100, message)
+        else:
+            self.scan_progress.emit(50, 100, message)
+
+    def _on_scan_worker_finished(self, all_assets: list, duration: float):
+        if not self._is_current_scan_worker():
+            return
+        self._scan_worker = None
+        logger.debug(f"WCZYTYWANIE OD NOWA zakończone, łącznie {len(all_assets)} assetów")
+        self.scan_completed.emit(all_assets, duration, "scan_folder")
+
+    def _on_scan_worker_error(self, error_msg: str):
+        if not self._is_current_scan_worker():
+            return
+        self._scan_worker = None
+        self.scan_error.emit(error_msg)
+
+    def _on_scan_thread_finished(self):
+        worker = self.sender()
+        self._retired_scan_workers.discard(worker)
+        if worker is not None and worker is not self._scan_worker:
+            worker.deleteLater()
+
     def request_recalculate_columns(self, available_width: int, thumbnail_size: int):
         """Requests column recalculation with debouncing."""
         logger.debug(
@@ -3,11 +3,40 @@ import os
 
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
+from core.folder_snapshot import invalidate_folder_snapshot
 from core.json_utils import save_to_file
+from core.local_thumbnail_store import resolve_local_thumbnail
+from core.thumbnail import get_level_thumbnail_name, select_thumbnail_level
 
 logger = logging.getLogger(__name__)
 
 
+def get_asset_thumbnail_path(
+    asset_data: dict, folder_path: str, display_size: int | None = None
+) -> str:
+    """Thumbnail path of an asset record (no QObject needed, e.g. for delegates)"""
+    if not asset_data.get("thumbnail"):
+        return ""
+
+    cache_dir = os.path.join(folder_path, ".cache")
+    name = asset_data.get("name", "Unknown")
+    thumbnail_path = os.path.join(cache_dir, f"{name}.thumb")
+    if display_size:
+        level = select_thumbnail_level(
+            asset_data.get("thumbnail_levels") or [], display_size
+        )
+        if level is not None:
+            # Rozmiar zapisany z poziomami - nazwy plików sprzed zmiany
+            # "thumbnail" w config.json (do ponownego skanu)
+            thumbnail_path = os.path.join(
+                cache_dir,
+                get_level_thumbnail_name(
+                    name, level, asset_data.get("thumbnail_size")
+                ),
+            )
+    return resolve_local_thumbnail(thumbnail_path) or thumbnail_path
+
+
 class AssetTileModel(QObject):
     """Model for a single asset tile"""
 
@@ -27,16 +56,18 @@ class AssetTileModel(QObject):
     def get_name(self) -> str:
         return self.data.get("name", "Unknown")
 
-    def get_thumbnail_path(self) -> str:
-        if self.is_special_folder or not self.data.get("thumbnail"):
+    def get_thumbnail_path(self, display_size: int | None = None) -> str:
+        """Returns the thumbnail path, the closest pyramid level for display_size
+
+        With the local thumbnail store enabled, the local copy is returned
+        when the store has one.
+        """
+        if self.is_special_folder:
             return ""
-        
         folder_path = self.get_folder_path()
         if not folder_path:
             return ""
-        
-        cache_dir = os.path.join(folder_path, ".cache")
-        return os.path.join(cache_dir, f"{self.get_name()}.thumb")
+        return get_asset_thumbnail_path(self.data, folder_path, display_size)
 
     def get_size_mb(self) -> float:
         return self.data.get("size_mb", 0.0)
@@ -74,6 +105,8 @@ class AssetTileModel(QObject):
             # Save data to file
             save_to_file(self.data, self.asset_file_path, indent=True)
             logger.debug(f"Saved asset data to file: {self.asset_file_path}")
+            # Changed mtime of the .asset file marks its index record as stale
+            invalidate_folder_snapshot(os.path.dirname(self.asset_file_path))
 
         except Exception as e:
             logger.error(f"Error saving asset {self.get_name()}: {e}")
@@ -5,6 +5,11 @@ import shutil
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, QMutex, QMutexLocker
 
+from core.folder_snapshot import invalidate_folder_snapshot
+from core.thumbnail import get_level_thumbnail_name
+from core.local_thumbnail_store import sync_local_thumbnails
+from core.thumbnail_atlas import sync_thumbnail_atlases
+
 logger = logging.getLogger(__name__)
 
 
@@ -105,8 +110,18 @@ class FileOperationsWorker(QThread):
                         f"Cannot remove empty .cache folder in source {source_cache_dir}: {e}"
                     )
             
+            self._invalidate_folder_snapshots()
             self.operation_completed.emit(success_asset_names, error_messages)
 
+    def _invalidate_folder_snapshots(self):
+        """Files were moved/deleted - drops stale folder snapshots"""
+        invalidate_folder_snapshot(self.source_folder_path)
+        if self.target_folder_path:
+            invalidate_folder_snapshot(self.target_folder_path)
+        # Moved/deleted thumbnails are dropped from (added to) folder atlases
+        sync_thumbnail_atlases([self.source_folder_path, self.target_folder_path])
+        sync_local_thumbnails([self.source_folder_path, self.target_folder_path])
+
     def _generate_unique_asset_name(self, original_name: str) -> str:
         """Generates a unique asset name by adding suffix _D_01, _D_02, etc."""
         base_name = original_name
@@ -178,14 +193,25 @@ class FileOperationsWorker(QThread):
                     self.target_folder_path, f"{unique_name}{preview_ext}"
                 )
                 files_to_move.append((source_preview, target_preview))
-        source_thumb = os.path.join(
-            self.source_folder_path, ".cache", f"{original_name}.thumb"
-        )
-        if os.path.exists(source_thumb):
-            target_cache_dir = os.path.join(self.target_folder_path, ".cache")
-            os.makedirs(target_cache_dir, exist_ok=True)
-            target_thumb = os.path.join(target_cache_dir, f"{unique_name}.thumb")
-            files_to_move.append((source_thumb, target_thumb))
+        # Miniaturka .thumb i poziomy piramidy (.thumb64, .thumb128, ...);
+        # poziom rozmiaru miniaturki to sam .thumb, więc bez duplikatów
+        base_size = asset_data.get("thumbnail_size")
+        thumb_names = list(dict.fromkeys(
+            [(f"{original_name}.thumb", f"{unique_name}.thumb")] + [
+                (
+                    get_level_thumbnail_name(original_name, level, base_size),
+                    get_level_thumbnail_name(unique_name, level, base_size),
+                )
+                for level in asset_data.get("thumbnail_levels") or []
+            ]
+        ))
+        target_cache_dir = os.path.join(self.target_folder_path, ".cache")
+        for source_name, target_name in thumb_names:
+            source_thumb = os.path.join(self.source_folder_path, ".cache", source_name)
+            if os.path.exists(source_thumb):
+                os.makedirs(target_cache_dir, exist_ok=True)
+                target_thumb = os.path.join(target_cache_dir, target_name)
+                files_to_move.append((source_thumb, target_thumb))
         return files_to_move, source_asset, target_asset
 
     def _move_files(self, files_to_move):
@@ -325,6 +351,7 @@ class FileOperationsWorker(QThread):
                         f"Cannot remove empty .cache folder {cache_dir}: {e}"
                     )
 
+            self._invalidate_folder_snapshots()
             self.operation_completed.emit(success_asset_names, error_messages)
 
     def _get_asset_files_paths(self, asset_data: dict, folder_path: str) -> list:
@@ -352,6 +379,15 @@ class FileOperationsWorker(QThread):
         cache_dir = os.path.join(folder_path, ".cache")
         thumb_file = os.path.join(cache_dir, f"{asset_name}.thumb")
         files.append(thumb_file)
+        for level in asset_data.get("thumbnail_levels") or []:
+            level_file = os.path.join(
+                cache_dir,
+                get_level_thumbnail_name(
+                    asset_name, level, asset_data.get("thumbnail_size")
+                ),
+            )
+            if level_file != thumb_file:
+                files.append(level_file)
 
         return files
 
@@ -4,6 +4,8 @@ import os
 from PyQt6.QtCore import QObject, Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QIcon, QStandardItem, QStandardItemModel
 
+from core.folder_snapshot import get_folder_snapshot, invalidate_folder_snapshot
+
 logger = logging.getLogger(__name__)
 
 
@@ -105,28 +107,24 @@ class FolderSystemModel(QObject):
             logger.warning(f"Max recursion depth reached for {folder_path}")
             return 0
         
-        count = 0
-        
         try:
-            with os.scandir(folder_path) as entries:
-                for entry in entries:
-                    try:
-                        if entry.is_file() and entry.name.endswith(".asset"):
-                            count += 1
-                        elif (recursive and entry.is_dir() and 
-                              not entry.name.startswith(".") and 
-                              not self._is_system_folder(entry.name)):
-                            # Recursive call only for recursive mode
-                            subfolder_count = self._scan_folder_for_assets(
-                                entry.path, recursive=True, max_depth=max_depth, current_depth=current_depth + 1
-                            )
-                            count += subfolder_count
-                    except (PermissionError, OSError) as e:
-                        logger.debug(f"Cannot access {entry.path}: {e}")
-                        continue
+            snapshot = get_folder_snapshot(folder_path)
         except (PermissionError, OSError) as e:
             logger.debug(f"Cannot scan folder {folder_path}: {e}")
             return 0
+
+        count = len(snapshot.assets)
+        if recursive:
+            for subfolder_name in snapshot.subfolders:
+                if subfolder_name.startswith(".") or self._is_system_folder(subfolder_name):
+                    continue
+                # Recursive call only for recursive mode (subfolder snapshots are reused)
+                count += self._scan_folder_for_assets(
+                    os.path.join(folder_path, subfolder_name),
+                    recursive=True,
+                    max_depth=max_depth,
+                    current_depth=current_depth + 1,
+                )
         
         return count
 
@@ -162,6 +160,7 @@ class FolderSystemModel(QObject):
             self._root_folder = folder_path
             # Wyczyść cache przy zmianie root folder
             self.clear_asset_count_cache()
+            invalidate_folder_snapshot()
             self._tree_model.clear()
             self._tree_model.setHorizontalHeaderLabels(["Folders"])
             self._set_loading_state(True)
@@ -202,9 +201,10 @@ class FolderSystemModel(QObject):
             if not os.path.exists(folder_path):
                 return
 
-            for item_name in sorted(os.listdir(folder_path), key=str.lower):
+            subfolders = get_folder_snapshot(folder_path).subfolders
+            for item_name in sorted(subfolders, key=str.lower):
                 item_path = os.path.join(folder_path, item_name)
-                if os.path.isdir(item_path) and not item_name.startswith(".") and not self._is_system_folder(item_name):
+                if not item_name.startswith(".") and not self._is_system_folder(item_name):
                     display_name = self._format_folder_display_name(item_name, item_path)
                     
                     child_item = QStandardItem(display_name)
@@ -265,6 +265,8 @@ class FolderSystemModel(QObject):
         try:
             # Wyczyść cache dla odświeżanego folderu
             self._clear_cache_for_path(folder_path)
+            # Nowy cykl odświeżania - folder zostanie wylistowany ponownie
+            invalidate_folder_snapshot(folder_path)
             
             found = self._refresh_folder_recursive(
                 self._tree_model.invisibleRootItem(), folder_path
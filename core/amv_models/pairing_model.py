@@ -3,6 +3,7 @@ import logging
 import os
 import shutil
 
+from core.folder_snapshot import invalidate_folder_snapshot
 from core.scanner import AssetRepository
 from core.json_utils import save_to_file
 
@@ -207,6 +208,7 @@ class PairingModel:
                 logger.info(
                     f"Renamed preview from {preview_full_path} to {new_preview_full_path}"
                 )
+                invalidate_folder_snapshot(os.path.dirname(preview_full_path))
 
             # 2. Utwórz asset
             work_folder_path = os.path.dirname(archive_full_path)
@@ -231,6 +233,9 @@ class PairingModel:
                         f"Failed to create thumbnail for {archive_name_without_ext}"
                     )
 
+                # Nowe pliki .asset/.thumb - snapshot folderu jest nieaktualny
+                invalidate_folder_snapshot(work_folder_path)
+
                 # 4. Zaktualizuj unpair_files.json
                 self.remove_paired_files(
                     os.path.basename(archive_full_path),
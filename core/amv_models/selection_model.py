@@ -21,6 +21,13 @@ class SelectionModel(QObject):
             self._selected_asset_ids.add(asset_id)
             self._emit_selection_changed()
 
+    def add_selections(self, asset_ids: list):
+        """Adds many assets at once (emits selection_changed once)"""
+        new_ids = set(asset_ids) - self._selected_asset_ids
+        if new_ids:
+            self._selected_asset_ids.update(new_ids)
+            self._emit_selection_changed()
+
     def remove_selection(self, asset_id: str):
         if asset_id in self._selected_asset_ids:
             self._selected_asset_ids.remove(asset_id)
@@ -4,12 +4,14 @@ Contains UI components responsible for data presentation.
 """
 
 from .asset_tile_view import AssetTileView
+from .asset_gallery_view import AssetGalleryView
 from .gallery_widgets import GalleryContainerWidget, DropHighlightDelegate
 from .amv_view import AmvView
 from .folder_tree_view import CustomFolderTreeView
 
 __all__ = [
     "AssetTileView",
+    "AssetGalleryView",
     "GalleryContainerWidget", 
     "DropHighlightDelegate",
     "AmvView",
@@ -11,6 +11,7 @@ from PyQt6.QtCore import QSize, Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QCheckBox,
+    QComboBox,
     QFrame,
     QGridLayout,
     QHBoxLayout,
@@ -27,6 +28,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from .asset_flow_layout import AssetFlowLayout
 from .gallery_widgets import GalleryContainerWidget
 
 logger = logging.getLogger(__name__)
@@ -335,7 +337,8 @@ class AmvView(QWidget):
 
     def _create_gallery_content_widget(self):
         self.gallery_content_widget = QWidget()
-        self.gallery_layout = QGridLayout(self.gallery_content_widget)
+        # Pozycje kafelków liczone z indeksu i liczby kolumn
+        self.gallery_layout = AssetFlowLayout(self.gallery_content_widget)
 
         # ADD: Set better gallery layout properties
         self.gallery_layout.setSpacing(8)  # Fixed spacing
@@ -353,6 +356,8 @@ class AmvView(QWidget):
         self.stacked_layout = QStackedLayout()
         self.stacked_layout.addWidget(self.gallery_content_widget)
         self.stacked_layout.addWidget(self.placeholder_widget)
+        # Strona z galerią (grid kafelków albo galeria wirtualna)
+        self.gallery_page_index = 0
 
         self.gallery_container_widget = GalleryContainerWidget()
         self.gallery_container_widget.setLayout(self.stacked_layout)
@@ -368,7 +373,23 @@ class AmvView(QWidget):
         if text:
             self.stacked_layout.setCurrentIndex(1)  # Pokaż placeholder
         else:
-            self.stacked_layout.setCurrentIndex(0)  # Pokaż siatkę
+            self.stacked_layout.setCurrentIndex(self.gallery_page_index)  # Pokaż siatkę
+
+    def set_virtual_gallery(self, gallery_view: QWidget):
+        """Shows the virtualized gallery instead of the tile grid.
+
+        The gallery scrolls itself, so the outer scroll area only keeps the
+        control panel on top of it.
+        """
+        self.gallery_page_index = self.stacked_layout.addWidget(gallery_view)
+        self.scroll_area.setVerticalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        self.scroll_area.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
+        )
+        if self.stacked_layout.currentIndex() == 0:
+            self.stacked_layout.setCurrentIndex(self.gallery_page_index)
 
     def _create_control_panel(self):
         self.control_panel = QFrame()
@@ -424,6 +445,11 @@ class AmvView(QWidget):
             star_cb.setText("★")
             self.star_checkboxes.append(star_cb)
             control_layout.addWidget(star_cb)
+        # Filtr koloru - lista kolorów assetów bieżącego folderu
+        self.color_filter_combo = QComboBox()
+        self.color_filter_combo.setObjectName("ControlPanelColorFilter")
+        self.color_filter_combo.addItem("Any color", None)
+        control_layout.addWidget(self.color_filter_combo)
         self.selection_buttons = []
         # Compact style like on Collapse/Expand buttons
         button_style = """
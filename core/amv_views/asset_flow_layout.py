@@ -0,0 +1,224 @@
+"""
+AssetFlowLayout - Grid layout for equally sized asset tiles.
+
+Replaces QGridLayout in the gallery. Tile positions are computed from the
+cell index and the column count, so changing the columns or the order does
+not remove and re-add widgets:
+
+- set_columns() only triggers a relayout,
+- set_widgets() replaces the tile order in one pass (widgets already in
+  the layout keep their items); widgets left out (e.g. tiles filtered out)
+  are hidden by the caller and take no cell,
+- a None entry reserves a cell for a tile created later (set_widget_at()),
+  so tiles can be populated in any order without moving the others,
+- setGeometry() positions only cells from the first changed one on and
+  the cells filled since the last pass,
+- set_cell_size() gives the cell size while no tile exists yet, so the
+  cells in the viewport are known before the first tile is created.
+"""
+
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QPoint, QRect, QSize
+from PyQt6.QtWidgets import QLayout, QLayoutItem, QWidget, QWidgetItem
+
+logger = logging.getLogger(__name__)
+
+
+class AssetFlowLayout(QLayout):
+    """Row-major grid of equally sized tiles with arithmetic positions"""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        # Cell order; None - cell reserved for a tile not created yet
+        self._cells: List[Optional[QLayoutItem]] = []
+        # Items of the layout (QLayout API: count/itemAt/takeAt)
+        self._items: List[QLayoutItem] = []
+        self._columns = 1
+        # Cell size used while the layout has no items yet
+        self._cell_size = QSize()
+        # Cells whose geometry must be set in the next setGeometry pass
+        self._dirty_from = 0
+        self._dirty_cells: Set[int] = set()
+        # Origin, cell size and columns used for the current geometries
+        self._geometry_key: Optional[Tuple] = None
+
+    # ------------------------------------------------------------------
+    # QLayout interface
+    # ------------------------------------------------------------------
+
+    def addItem(self, item: QLayoutItem) -> None:
+        self._items.append(item)
+        self._cells.append(item)
+        self._dirty_cells.add(len(self._cells) - 1)
+        self.invalidate()
+
+    def count(self) -> int:
+        return len(self._items)
+
+    def itemAt(self, index: int) -> Optional[QLayoutItem]:
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def takeAt(self, index: int) -> Optional[QLayoutItem]:
+        if not 0 <= index < len(self._items):
+            return None
+        item = self._items.pop(index)
+        cell = self._cells.index(item)
+        del self._cells[cell]
+        # Następne kafelki przesuwają się o jedną komórkę
+        self._mark_dirty_from(cell)
+        self.invalidate()
+        return item
+
+    def sizeHint(self) -> QSize:
+        return self._get_grid_size()
+
+    def minimumSize(self) -> QSize:
+        return self._get_grid_size()
+
+    def setGeometry(self, rect: QRect) -> None:
+        super().setGeometry(rect)
+        cell = self.get_cell_size()
+        if cell.isEmpty():
+            return
+        content = self.contentsRect()
+        geometry_key = (content.topLeft(), cell, self._columns, self.spacing())
+        if geometry_key != self._geometry_key:
+            self._geometry_key = geometry_key
+            self._dirty_from = 0
+
+        dirty = [i for i in self._dirty_cells if i < self._dirty_from]
+        dirty.extend(range(self._dirty_from, len(self._cells)))
+        for index in dirty:
+            item = self._cells[index]
+            if item is None:
+                continue
+            # QWidgetItem pomija ukryte widgety - kafelek pokazywany po
+            # przebiegu layoutu musi już mieć swoją komórkę
+            widget = item.widget()
+            if widget is not None:
+                widget.setGeometry(QRect(self.get_cell_position(index), cell))
+            else:
+                item.setGeometry(QRect(self.get_cell_position(index), cell))
+        self._dirty_from = len(self._cells)
+        self._dirty_cells.clear()
+        if dirty:
+            logger.debug(f"AssetFlowLayout: positioned {len(dirty)}/{len(self._cells)} cells")
+
+    # ------------------------------------------------------------------
+    # Gallery API
+    # ------------------------------------------------------------------
+
+    def get_columns(self) -> int:
+        return self._columns
+
+    def set_columns(self, columns: int) -> None:
+        columns = max(1, columns)
+        if columns != self._columns:
+            self._columns = columns
+            self.invalidate()
+
+    def set_widgets(self, widgets: List[Optional[QWidget]]) -> None:
+        """Sets the cell order; widgets not listed are taken out of the layout
+
+        Widgets stay children of the gallery widget (AssetTilePool reuses them).
+        None reserves a cell for set_widget_at().
+        """
+        items_by_widget: Dict[QWidget, QLayoutItem] = {
+            item.widget(): item for item in self._items
+        }
+        cells = []
+        for widget in widgets:
+            if widget is None:
+                cells.append(None)
+                continue
+            item = items_by_widget.pop(widget, None)
+            if item is None:
+                self.addChildWidget(widget)
+                item = QWidgetItem(widget)
+            cells.append(item)
+
+        # Komórki przed pierwszą różnicą zostają na miejscu
+        first_changed = 0
+        for old, new in zip(self._cells, cells):
+            if old is not new:
+                break
+            first_changed += 1
+        if first_changed == len(cells) == len(self._cells):
+            return
+
+        self._cells = cells
+        self._items = [item for item in cells if item is not None]
+        self._mark_dirty_from(first_changed)
+        self.invalidate()
+
+    def set_widget_at(self, index: int, widget: QWidget) -> None:
+        """Puts a widget into a reserved cell (other tiles do not move)"""
+        if not 0 <= index < len(self._cells) or self._cells[index] is not None:
+            raise IndexError(f"Cell {index} is not reserved")
+        self.addChildWidget(widget)
+        item = QWidgetItem(widget)
+        self._cells[index] = item
+        self._items.append(item)
+        self._dirty_cells.add(index)
+        self.invalidate()
+
+    def set_cell_size(self, size: QSize) -> None:
+        """Expected cell size, used until the first tile is in the layout"""
+        if size != self._cell_size:
+            self._cell_size = QSize(size)
+            if not self._items:
+                self.invalidate()
+
+    def get_cell_size(self) -> QSize:
+        """Size of a cell (all tiles of the grid have the same size)"""
+        for item in self._items:
+            return item.sizeHint()
+        return QSize(self._cell_size)
+
+    def get_cell_position(self, index: int) -> QPoint:
+        cell = self.get_cell_size()
+        spacing = max(self.spacing(), 0)
+        content = self.contentsRect()
+        row, col = divmod(index, self._columns)
+        return QPoint(
+            content.x() + col * (cell.width() + spacing),
+            content.y() + row * (cell.height() + spacing),
+        )
+
+    def get_cells_in_rect(self, rect: QRect) -> range:
+        """Indexes of the cells intersecting a rectangle (e.g. the viewport)"""
+        cell = self.get_cell_size()
+        if cell.isEmpty():
+            return range(0)
+        step_y = cell.height() + max(self.spacing(), 0)
+        top = self.contentsRect().y()
+        first_row = max(0, (rect.top() - top) // step_y)
+        last_row = max(0, (rect.bottom() - top) // step_y)
+        return range(
+            min(first_row * self._columns, len(self._cells)),
+            min((last_row + 1) * self._columns, len(self._cells)),
+        )
+
+    def _mark_dirty_from(self, index: int) -> None:
+        self._dirty_from = min(self._dirty_from, index)
+
+    def _get_grid_size(self) -> QSize:
+        """Size of the grid with all cells (scroll area content size)"""
+        margins = self.contentsMargins()
+        extra_width = margins.left() + margins.right()
+        extra_height = margins.top() + margins.bottom()
+        cell = self.get_cell_size()
+        if not self._cells or cell.isEmpty():
+            return QSize(extra_width, extra_height)
+
+        spacing = max(self.spacing(), 0)
+        columns = min(self._columns, len(self._cells))
+        rows = (len(self._cells) + self._columns - 1) // self._columns
+        return QSize(
+            extra_width + columns * cell.width() + (columns - 1) * spacing,
+            extra_height + rows * cell.height() + (rows - 1) * spacing,
+        )
@@ -0,0 +1,742 @@
+"""
+AssetGalleryView - Virtualized asset gallery (config.json: "virtual_gallery").
+
+Instead of one AssetTileView (a QFrame with about ten child widgets) per
+asset, the gallery is a QListView over AssetGalleryModel and the cells are
+painted by AssetGalleryDelegate. Only cells inside the viewport are painted
+and only their thumbnails are requested, so memory use and layout time do
+not grow with the number of assets in the folder.
+
+The cell layout (thumbnail, file name row, number/stars/checkbox row)
+follows AssetTileView. Clicks on the thumbnail, file name, stars and
+checkbox, and drag and drop, work like on the tile.
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import (
+    QAbstractListModel,
+    QMimeData,
+    QModelIndex,
+    QPoint,
+    QRect,
+    QSize,
+    Qt,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor, QDrag, QFont, QPainter, QPen, QPixmap
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+)
+
+from core.thumbnail_atlas import thumbnail_exists
+from core.thumbnail_cache import thumbnail_cache
+from core.utilities import update_main_window_status
+from core.workers.thumbnail_load_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_NEAR,
+    PRIORITY_VISIBLE,
+    get_thumbnail_load_scheduler,
+)
+
+from ..amv_models.asset_tile_model import AssetTileModel, get_asset_thumbnail_path
+from ..amv_models.selection_model import SelectionModel
+
+logger = logging.getLogger(__name__)
+
+ASSET_DATA_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Odstęp między kafelkami (jak spacing gallery_layout)
+CELL_SPACING = 8
+
+# Tile geometry (as AssetTileView.update_thumbnail_size)
+CELL_MARGIN = 8
+CELL_TEXT_HEIGHT = 70
+NAME_ROW_HEIGHT = 22
+BOTTOM_ROW_HEIGHT = 22
+STAR_WIDTH = 12
+CHECKBOX_SIZE = 14
+MAX_NAME_LENGTH = 16
+
+# Kolory z styles.qss (AssetTileView, gwiazdki, etykiety)
+TILE_BACKGROUND = QColor("#2f313e")
+TILE_BORDER = QColor("#616161")
+TILE_BORDER_HOVER = QColor("#717bbc")
+TEXT_COLOR = QColor("#a9b7c6")
+STAR_COLOR = QColor("#848484")
+STAR_CHECKED_COLOR = QColor("#717bbc")
+PLACEHOLDER_COLOR = QColor("#2A2D2E")
+
+
+def _load_icon(icon_name: str, size: int) -> QPixmap:
+    """Loads an icon from resources/img, grey square as fallback"""
+    icon_path = os.path.join(
+        os.path.dirname(__file__), "..", "resources", "img", icon_name
+    )
+    pixmap = QPixmap(icon_path) if os.path.exists(icon_path) else QPixmap()
+    if pixmap.isNull():
+        pixmap = QPixmap(size, size)
+        pixmap.fill(PLACEHOLDER_COLOR)
+        return pixmap
+    return pixmap.scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+def _get_asset_id(asset: dict) -> str:
+    """Asset ID used by SelectionModel and drag and drop (the asset name)"""
+    return asset.get("name", "")
+
+
+def _to_display_pixmap(pixmap: QPixmap, size: int) -> QPixmap:
+    """Crops a thumbnail to a top-left square and scales it to the cell size"""
+    side = min(pixmap.width(), pixmap.height())
+    if pixmap.width() != pixmap.height():
+        # Szeroki - od lewej, wysoki - od góry
+        pixmap = pixmap.copy(0, 0, side, side)
+    if side == size:
+        return pixmap
+    return pixmap.scaled(
+        size,
+        size,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
+class AssetGalleryModel(QAbstractListModel):
+    """List model over the asset records of the current folder"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._assets: List[dict] = []
+        self._rows: Dict[str, int] = {}  # asset name -> row
+        self._folder_path = ""
+        # (asset name, display size) -> thumbnail path
+        self._thumbnail_paths: Dict[tuple, str] = {}
+        # .asset path -> AssetTileModel (created only for edited assets)
+        self._tile_models: Dict[str, AssetTileModel] = {}
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._assets)
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._assets):
+            return None
+        asset = self._assets[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return asset.get("name", "")
+        if role == ASSET_DATA_ROLE:
+            return asset
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled
+
+    def set_assets(self, assets: list, folder_path: str) -> None:
+        """Shows a new asset list; rows appended by a streaming scan are inserted"""
+        names = [asset.get("name", "") for asset in assets]
+        count = len(self._assets)
+        if (
+            folder_path == self._folder_path
+            and count < len(assets)
+            and all(self._assets[i].get("name", "") == names[i] for i in range(count))
+        ):
+            self.beginInsertRows(QModelIndex(), count, len(assets) - 1)
+            self._assets = list(assets)
+            self._rows = {name: row for row, name in enumerate(names)}
+            self.endInsertRows()
+            return
+
+        self.beginResetModel()
+        self._thumbnail_paths.clear()
+        self._folder_path = folder_path
+        self._assets = list(assets)
+        self._rows = {name: row for row, name in enumerate(names)}
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self._assets = []
+        self._rows = {}
+        self._thumbnail_paths.clear()
+        self._tile_models.clear()
+        self.endResetModel()
+
+    def remove_assets(self, asset_ids: list) -> None:
+        """Removes rows of moved/deleted assets"""
+        removed = set(asset_ids)
+        if not removed.intersection(self._rows):
+            return
+        self.beginResetModel()
+        self._assets = [a for a in self._assets if a.get("name", "") not in removed]
+        self._rows = {a.get("name", ""): row for row, a in enumerate(self._assets)}
+        self.endResetModel()
+
+    def get_asset(self, row: int) -> Optional[dict]:
+        if 0 <= row < len(self._assets):
+            return self._assets[row]
+        return None
+
+    def get_row(self, asset_id: str) -> int:
+        return self._rows.get(asset_id, -1)
+
+    def get_assets(self) -> List[dict]:
+        return self._assets
+
+    def get_folder_path(self) -> str:
+        return self._folder_path
+
+    def get_asset_file_path(self, asset: dict) -> str:
+        name = asset.get("name", "")
+        if self._folder_path and name:
+            return os.path.join(self._folder_path, f"{name}.asset")
+        return ""
+
+    def get_tile_model(self, row: int) -> Optional[AssetTileModel]:
+        """AssetTileModel of a row (star changes are saved through it)"""
+        asset = self.get_asset(row)
+        if asset is None:
+            return None
+        asset_file_path = self.get_asset_file_path(asset)
+        tile_model = self._tile_models.get(asset_file_path)
+        if tile_model is None or tile_model.data is not asset:
+            tile_model = AssetTileModel(asset, asset_file_path)
+            self._tile_models[asset_file_path] = tile_model
+        return tile_model
+
+    def get_thumbnail_path(self, asset: dict, display_size: int) -> str:
+        key = (asset.get("name", ""), display_size)
+        path = self._thumbnail_paths.get(key)
+        if path is None:
+            path = ""
+            if self._folder_path and asset.get("type") != "special_folder":
+                path = get_asset_thumbnail_path(asset, self._folder_path, display_size)
+            self._thumbnail_paths[key] = path
+        return path
+
+
+class AssetGalleryDelegate(QStyledItemDelegate):
+    """Paints gallery cells in the AssetTileView layout"""
+
+    def __init__(self, thumbnail_size: int, parent=None):
+        super().__init__(parent)
+        self.thumbnail_size = thumbnail_size
+        self._name_font = QFont()
+        self._name_font.setPixelSize(12)
+        self._small_font = QFont()
+        self._small_font.setPixelSize(11)
+        self._star_font = QFont()
+        self._star_font.setPixelSize(11)
+        self._star_checked_font = QFont(self._star_font)
+        self._star_checked_font.setBold(True)
+        self._texture_icon = _load_icon("texture.png", 16)
+        self._folder_icons: Dict[int, QPixmap] = {}
+        self._placeholder: Optional[QPixmap] = None
+
+    def set_thumbnail_size(self, size: int) -> None:
+        self.thumbnail_size = size
+        self._placeholder = None
+
+    def get_cell_size(self) -> QSize:
+        """Cell size including the spacing between tiles"""
+        return QSize(
+            self.thumbnail_size + 2 * CELL_MARGIN + CELL_SPACING,
+            self.thumbnail_size + CELL_TEXT_HEIGHT + CELL_SPACING,
+        )
+
+    def sizeHint(self, option, index) -> QSize:
+        return self.get_cell_size()
+
+    def get_cell_rects(self, rect: QRect) -> dict:
+        """Geometry of the tile parts inside a cell (also used for hit testing)"""
+        tile = rect.adjusted(
+            CELL_SPACING // 2, CELL_SPACING // 2, -CELL_SPACING // 2, -CELL_SPACING // 2
+        )
+        size = self.thumbnail_size
+        thumbnail = QRect(
+            tile.x() + (tile.width() - size) // 2, tile.y() + CELL_MARGIN, size, size
+        )
+        name_row = QRect(
+            tile.x() + CELL_MARGIN,
+            thumbnail.bottom() + 4,
+            tile.width() - 2 * CELL_MARGIN,
+            NAME_ROW_HEIGHT,
+        )
+        bottom_row = QRect(
+            name_row.x(), name_row.bottom() + 1, name_row.width(), BOTTOM_ROW_HEIGHT
+        )
+        center_y = bottom_row.center().y()
+        checkbox = QRect(
+            bottom_row.right() - CHECKBOX_SIZE + 1,
+            center_y - CHECKBOX_SIZE // 2,
+            CHECKBOX_SIZE,
+            CHECKBOX_SIZE,
+        )
+        # Gwiazdki tylko gdy mieszczą się obok numeru i checkboxa
+        stars = []
+        stars_width = 5 * STAR_WIDTH
+        if stars_width + 4 * 6 <= tile.width() - 2 * CELL_MARGIN - 30 - 16 - 12:
+            left = bottom_row.x() + (bottom_row.width() - stars_width) // 2
+            stars = [
+                QRect(left + i * STAR_WIDTH, center_y - 8, STAR_WIDTH, 16)
+                for i in range(5)
+            ]
+        return {
+            "tile": tile,
+            "thumbnail": thumbnail,
+            "name_row": name_row,
+            "texture": QRect(name_row.x(), name_row.center().y() - 8, 16, 16),
+            "name": name_row.adjusted(18, 0, -60, 0),
+            "size": name_row.adjusted(name_row.width() - 60, 0, 0, 0),
+            "number": bottom_row,
+            "stars": stars,
+            "checkbox": checkbox,
+        }
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        asset = index.data(ASSET_DATA_ROLE)
+        if asset is None:
+            return
+        view = self.parent()
+        rects = self.get_cell_rects(option.rect)
+        is_folder = asset.get("type") == "special_folder"
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(QPen(TILE_BORDER_HOVER if hovered else TILE_BORDER, 1))
+        painter.setBrush(TILE_BACKGROUND)
+        painter.drawRoundedRect(rects["tile"].adjusted(0, 0, -1, -1), 6, 6)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+
+        thumbnail_rect = rects["thumbnail"]
+        if is_folder:
+            painter.drawPixmap(thumbnail_rect, self._get_folder_icon())
+        else:
+            painter.drawPixmap(thumbnail_rect, view.get_thumbnail_pixmap(asset))
+
+        # Nazwa pliku (max 16 znaków) i rozmiar
+        name = asset.get("name", "")
+        if len(name) > MAX_NAME_LENGTH:
+            name = name[: MAX_NAME_LENGTH - 3] + "..."
+        painter.setPen(TEXT_COLOR)
+        painter.setFont(self._name_font)
+        painter.drawText(rects["name"], Qt.AlignmentFlag.AlignCenter, name)
+        painter.setFont(self._small_font)
+        size_mb = asset.get("size_mb", 0.0) or 0.0
+        if not is_folder and size_mb > 0:
+            painter.drawText(
+                rects["size"],
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                f"{size_mb:.1f} MB",
+            )
+        if not is_folder and asset.get("textures_in_the_archive", False):
+            painter.drawPixmap(rects["texture"], self._texture_icon)
+
+        painter.drawText(
+            rects["number"],
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"{index.row() + 1} / {index.model().rowCount()}",
+        )
+
+        if not is_folder:
+            self._paint_stars(painter, rects["stars"], asset.get("stars") or 0)
+            self._paint_checkbox(
+                painter, rects["checkbox"], view.is_asset_selected(_get_asset_id(asset))
+            )
+        painter.restore()
+
+    def _paint_stars(self, painter: QPainter, star_rects: list, rating: int) -> None:
+        for i, star_rect in enumerate(star_rects):
+            checked = i < rating
+            painter.setFont(self._star_checked_font if checked else self._star_font)
+            painter.setPen(STAR_CHECKED_COLOR if checked else STAR_COLOR)
+            painter.drawText(star_rect, Qt.AlignmentFlag.AlignCenter, "★")
+
+    def _paint_checkbox(self, painter: QPainter, rect: QRect, checked: bool) -> None:
+        option = QStyleOptionButton()
+        option.rect = rect
+        option.state = QStyle.StateFlag.State_Enabled | (
+            QStyle.StateFlag.State_On if checked else QStyle.StateFlag.State_Off
+        )
+        view = self.parent()
+        view.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_IndicatorCheckBox, option, painter, view
+        )
+
+    def _get_folder_icon(self) -> QPixmap:
+        icon = self._folder_icons.get(self.thumbnail_size)
+        if icon is None:
+            icon = _load_icon("folder.png", self.thumbnail_size)
+            self._folder_icons[self.thumbnail_size] = icon
+        return icon
+
+    def get_placeholder(self) -> QPixmap:
+        """Placeholder shown until the thumbnail is loaded"""
+        if self._placeholder is None:
+            self._placeholder = QPixmap(self.thumbnail_size, self.thumbnail_size)
+            self._placeholder.fill(PLACEHOLDER_COLOR)
+        return self._placeholder
+
+
+class _GalleryThumbnailRequest:
+    """Thumbnail request of one gallery cell for ThumbnailLoadScheduler"""
+
+    __slots__ = ("view", "asset_id", "path", "size")
+
+    def __init__(self, view, asset_id: str, path: str, size: int):
+        self.view = view
+        self.asset_id = asset_id
+        self.path = path
+        self.size = size
+
+    def get_load_priority(self) -> int:
+        return self.view.get_load_priority(self.asset_id)
+
+    def _on_thumbnail_loaded(self, path: str, pixmap: QPixmap):
+        self.view._on_thumbnail_loaded(self, path, pixmap)
+
+    def _on_thumbnail_error(self, path: str, error_message: str):
+        self.view._on_thumbnail_error(self, path, error_message)
+
+
+class AssetGalleryView(QListView):
+    """Virtualized asset gallery - QListView with painted tiles"""
+
+    thumbnail_clicked = pyqtSignal(str, str)  # asset_id, preview/folder path
+    filename_clicked = pyqtSignal(str, str)  # asset_id, archive/folder path
+    checkbox_state_changed = pyqtSignal(bool)  # Czy asset jest zaznaczony
+    drag_started = pyqtSignal(object)  # Lista ID przeciąganych assetów
+    stars_changed = pyqtSignal(object)  # Dane assetu po zmianie oceny
+
+    def __init__(self, selection_model: SelectionModel, thumbnail_size: int, parent=None):
+        super().__init__(parent)
+        self.selection_model = selection_model
+        self.gallery_model = AssetGalleryModel(self)
+        self.delegate = AssetGalleryDelegate(thumbnail_size, self)
+        self.setModel(self.gallery_model)
+        self.setItemDelegate(self.delegate)
+
+        self._drag_start_position = QPoint()
+        self._press_row = -1
+        self._drag_and_drop_enabled = True
+        self._drag_in_progress = False
+        # asset_id -> running or queued thumbnail request
+        self._thumbnail_requests: Dict[str, _GalleryThumbnailRequest] = {}
+        self._failed_thumbnails = set()
+
+        self.setObjectName("AssetGalleryView")
+        self.setViewMode(QListView.ViewMode.ListMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setGridSize(self.delegate.get_cell_size())
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setContentsMargins(0, 0, 0, 0)
+        self.setDragEnabled(False)  # D&D startowane ręcznie (format jak w kafelku)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.selection_model.selection_changed.connect(self._on_selection_changed)
+
+    # ------------------------------------------------------------------
+    # Dane
+    # ------------------------------------------------------------------
+
+    def set_assets(self, assets: list, folder_path: str) -> None:
+        if folder_path != self.gallery_model.get_folder_path():
+            self._cancel_thumbnail_requests()
+        # Miniaturki mogły zostać wygenerowane przez skan
+        self._failed_thumbnails.clear()
+        self.gallery_model.set_assets(assets, folder_path)
+
+    def clear_assets(self) -> None:
+        self._cancel_thumbnail_requests()
+        self._failed_thumbnails.clear()
+        self.gallery_model.clear()
+
+    def remove_assets(self, asset_ids: list) -> None:
+        for asset_id in asset_ids:
+            self._cancel_thumbnail_request(asset_id)
+        self.gallery_model.remove_assets(asset_ids)
+
+    def get_asset_ids(self) -> List[str]:
+        """IDs of the displayed assets (without special folders)"""
+        return [
+            _get_asset_id(asset)
+            for asset in self.gallery_model.get_assets()
+            if asset.get("type") != "special_folder"
+        ]
+
+    def asset_count(self) -> int:
+        return self.gallery_model.rowCount()
+
+    def is_asset_selected(self, asset_id: str) -> bool:
+        return self.selection_model.is_selected(asset_id)
+
+    def set_thumbnail_size(self, size: int) -> None:
+        if size == self.delegate.thumbnail_size:
+            return
+        self._cancel_thumbnail_requests()
+        self.delegate.set_thumbnail_size(size)
+        self.setGridSize(self.delegate.get_cell_size())
+
+    def set_drag_and_drop_enabled(self, enabled: bool) -> None:
+        self._drag_and_drop_enabled = enabled
+
+    # ------------------------------------------------------------------
+    # Miniaturki
+    # ------------------------------------------------------------------
+
+    def get_thumbnail_pixmap(self, asset: dict) -> QPixmap:
+        """Cached display variant of the thumbnail; queues loading when missing"""
+        size = self.delegate.thumbnail_size
+        path = self.gallery_model.get_thumbnail_path(asset, size)
+        if path:
+            pixmap = thumbnail_cache.get_variant(path, size)
+            if pixmap is not None:
+                return pixmap
+            self._request_thumbnail(_get_asset_id(asset), path, size)
+        return self.delegate.get_placeholder()
+
+    def _request_thumbnail(self, asset_id: str, path: str, size: int) -> None:
+        request = self._thumbnail_requests.get(asset_id)
+        if request is not None and request.path == path and request.size == size:
+            return
+        if path in self._failed_thumbnails or not thumbnail_exists(path):
+            self._failed_thumbnails.add(path)
+            return
+        request = _GalleryThumbnailRequest(self, asset_id, path, size)
+        self._thumbnail_requests[asset_id] = request
+        get_thumbnail_load_scheduler().request(request, path, size)
+
+    def _cancel_thumbnail_request(self, asset_id: str) -> None:
+        request = self._thumbnail_requests.pop(asset_id, None)
+        if request is not None:
+            get_thumbnail_load_scheduler().cancel(request)
+
+    def _cancel_thumbnail_requests(self) -> None:
+        scheduler = get_thumbnail_load_scheduler()
+        for request in self._thumbnail_requests.values():
+            scheduler.cancel(request)
+        self._thumbnail_requests.clear()
+
+    def get_load_priority(self, asset_id: str) -> int:
+        """Priority class of a cell from its position relative to the viewport"""
+        row = self.gallery_model.get_row(asset_id)
+        if row < 0:
+            return PRIORITY_BACKGROUND
+        rect = self.visualRect(self.gallery_model.index(row))
+        viewport_height = self.viewport().height()
+        if rect.bottom() >= 0 and rect.top() <= viewport_height:
+            return PRIORITY_VISIBLE
+        if rect.bottom() >= -viewport_height and rect.top() <= 2 * viewport_height:
+            return PRIORITY_NEAR
+        return PRIORITY_BACKGROUND
+
+    def _on_scrolled(self, _value: int) -> None:
+        """Drops requests of cells scrolled far away, visible cells go first"""
+        far_away = [
+            asset_id
+            for asset_id in self._thumbnail_requests
+            if self.get_load_priority(asset_id) == PRIORITY_BACKGROUND
+        ]
+        for asset_id in far_away:
+            self._cancel_thumbnail_request(asset_id)
+        get_thumbnail_load_scheduler().reprioritize()
+
+    def _on_thumbnail_loaded(self, request, path: str, pixmap: QPixmap) -> None:
+        if self._thumbnail_requests.get(request.asset_id) is not request:
+            return
+        del self._thumbnail_requests[request.asset_id]
+        thumbnail_cache.put_variant(
+            path, request.size, _to_display_pixmap(pixmap, request.size)
+        )
+        self._update_asset(request.asset_id)
+
+    def _on_thumbnail_error(self, request, path: str, error_message: str) -> None:
+        if self._thumbnail_requests.get(request.asset_id) is not request:
+            return
+        del self._thumbnail_requests[request.asset_id]
+        logger.warning(error_message)
+        self._failed_thumbnails.add(path)
+
+    def _update_asset(self, asset_id: str) -> None:
+        row = self.gallery_model.get_row(asset_id)
+        if row >= 0:
+            self.update(self.gallery_model.index(row))
+
+    def _on_selection_changed(self, _selected_asset_ids: list) -> None:
+        self.viewport().update()
+
+    # ------------------------------------------------------------------
+    # Mysz - kliknięcia i drag & drop
+    # ------------------------------------------------------------------
+
+    def _hit_test(self, index: QModelIndex, pos: QPoint) -> Optional[str]:
+        """Part of the tile under the cursor: thumbnail, name, star_N or checkbox"""
+        rects = self.delegate.get_cell_rects(self.visualRect(index))
+        if rects["thumbnail"].contains(pos):
+            return "thumbnail"
+        if rects["name"].contains(pos):
+            return "name"
+        asset = index.data(ASSET_DATA_ROLE)
+        if asset is None or asset.get("type") == "special_folder":
+            return None
+        for i, star_rect in enumerate(rects["stars"]):
+            if star_rect.contains(pos):
+                return f"star_{i + 1}"
+        if rects["checkbox"].adjusted(-3, -3, 3, 3).contains(pos):
+            return "checkbox"
+        return None
+
+    def mousePressEvent(self, event):
+        """Handles mouse press - clicks on tile parts and drag & drop start."""
+        if event.button() != Qt.MouseButton.LeftButton:
+            super().mousePressEvent(event)
+            return
+
+        pos = event.position().toPoint()
+        self._drag_start_position = pos
+        index = self.indexAt(pos)
+        self._press_row = index.row() if index.isValid() else -1
+
+        # Jeśli wciśnięty jest Shift, nie pokazuj podglądu ani archiwum
+        if not index.isValid() or event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+            super().mousePressEvent(event)
+            return
+
+        asset = index.data(ASSET_DATA_ROLE)
+        part = self._hit_test(index, pos)
+        if part == "thumbnail":
+            self._on_thumbnail_clicked(asset)
+        elif part == "name":
+            self._on_filename_clicked(asset)
+        elif part == "checkbox":
+            self._toggle_checked(asset)
+        elif part and part.startswith("star_"):
+            self._on_star_clicked(index.row(), int(part[len("star_"):]))
+        else:
+            super().mousePressEvent(event)
+            return
+        event.accept()
+
+    def mouseMoveEvent(self, event):
+        """Handles mouse move - initiates drag & drop."""
+        if (
+            event.buttons() & Qt.MouseButton.LeftButton
+            and self._press_row >= 0
+            and (
+                event.position().toPoint() - self._drag_start_position
+            ).manhattanLength()
+            >= QApplication.startDragDistance()
+        ):
+            asset = self.gallery_model.get_asset(self._press_row)
+            self._press_row = -1
+            if asset is not None and asset.get("type") != "special_folder":
+                self._start_drag(_get_asset_id(asset))
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self._press_row = -1
+        super().mouseReleaseEvent(event)
+
+    def _start_drag(self, asset_id: str) -> None:
+        # Blokada D&D gdy trwa ładowanie galerii
+        if not self._drag_and_drop_enabled:
+            logger.info("Drag and drop zablokowane podczas ładowania galerii.")
+            return
+        if self._drag_in_progress:
+            logger.warning("Drag already in progress, ignoring new drag request")
+            return
+
+        # Zaznaczone assety albo tylko przeciągany kafelek
+        selected_asset_ids = self.selection_model.get_selected_asset_ids()
+        if not selected_asset_ids:
+            selected_asset_ids = [asset_id]
+        if any(not aid for aid in selected_asset_ids):
+            logger.error(f"Invalid asset IDs for drag: {selected_asset_ids}")
+            return
+
+        try:
+            self._drag_in_progress = True
+            drag = QDrag(self)
+            mime_data = QMimeData()
+            mime_data.setText(
+                f"application/x-cfab-asset,{','.join(selected_asset_ids)}"
+            )
+            drag.setMimeData(mime_data)
+            drag.setDragCursor(QPixmap(), Qt.DropAction.MoveAction)
+            self.drag_started.emit(selected_asset_ids)
+            result = drag.exec(Qt.DropAction.MoveAction | Qt.DropAction.IgnoreAction)
+            logger.debug(f"Drag exec result: {result}")
+        except Exception as e:
+            logger.error(f"Error during drag operation: {e}")
+        finally:
+            self._drag_in_progress = False
+
+    def _on_thumbnail_clicked(self, asset: dict) -> None:
+        asset_id = _get_asset_id(asset)
+        logger.debug(f"AssetGalleryView: Thumbnail clicked for asset {asset_id}")
+        if asset.get("type") == "special_folder":
+            self.thumbnail_clicked.emit(asset_id, asset.get("folder_path", ""))
+        else:
+            preview = asset.get("preview")
+            folder_path = self.gallery_model.get_folder_path()
+            path = os.path.join(folder_path, preview) if preview and folder_path else ""
+            self.thumbnail_clicked.emit(asset_id, path)
+
+    def _on_filename_clicked(self, asset: dict) -> None:
+        asset_id = _get_asset_id(asset)
+        logger.debug(f"AssetGalleryView: Filename clicked for asset {asset_id}")
+        if asset.get("type") == "special_folder":
+            self.filename_clicked.emit(asset_id, asset.get("folder_path", ""))
+        else:
+            archive = asset.get("archive")
+            folder_path = self.gallery_model.get_folder_path()
+            path = os.path.join(folder_path, archive) if archive and folder_path else ""
+            self.filename_clicked.emit(asset_id, path)
+
+    def _toggle_checked(self, asset: dict) -> None:
+        asset_id = _get_asset_id(asset)
+        is_checked = not self.selection_model.is_selected(asset_id)
+        if is_checked:
+            self.selection_model.add_selection(asset_id)
+        else:
+            self.selection_model.remove_selection(asset_id)
+        self._update_asset(asset_id)
+        self.checkbox_state_changed.emit(is_checked)
+        update_main_window_status(self)
+
+    def _on_star_clicked(self, row: int, clicked_rating: int) -> None:
+        """Sets the rating; clicking the current rating clears the stars"""
+        tile_model = self.gallery_model.get_tile_model(row)
+        if tile_model is None:
+            return
+        if clicked_rating == tile_model.get_stars():
+            tile_model.set_stars(0)
+        else:
+            tile_model.set_stars(clicked_rating)
+        self.update(self.gallery_model.index(row))
+        self.stars_changed.emit(tile_model.data)
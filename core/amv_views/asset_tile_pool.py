@@ -61,6 +61,8 @@ class AssetTilePool:
         """
         if tile:
             tile.hide()  # Hide widget, instead of destroying it
+            # Pooled tile no longer needs its thumbnail
+            tile.cancel_thumbnail_loading()
             # FIXED: Do not change parent if not necessary
             # Avoid potential memory issues by unnecessary parent changes
             if tile.parent() != self._parent_widget and self._parent_widget:
@@ -6,7 +6,7 @@ Displays thumbnail, filename, stars, and checkbox for the asset.
 import logging
 import os
 
-from PyQt6.QtCore import QMimeData, QPoint, Qt, QThreadPool, pyqtSignal
+from PyQt6.QtCore import QMimeData, QPoint, Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QDrag, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
@@ -19,14 +19,19 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from core.thumbnail_atlas import thumbnail_exists
 from core.thumbnail_cache import thumbnail_cache
-from core.workers.thumbnail_loader_worker import ThumbnailLoaderWorker
+from core.workers.thumbnail_load_scheduler import get_thumbnail_load_scheduler
 
 from ..amv_models.asset_tile_model import AssetTileModel
 from ..amv_models.selection_model import SelectionModel
 
 logger = logging.getLogger(__name__)
 
+# Tile margin around the thumbnail and height of the name/stars area (px)
+TILE_MARGINS_SIZE = 8
+TILE_EXTRA_HEIGHT = 70
+
 
 class AssetTileView(QFrame):
     """View for a single asset tile - STAGE 15 + Object Pooling"""
@@ -36,9 +41,6 @@ class AssetTileView(QFrame):
     checkbox_state_changed = pyqtSignal(bool)  # Czy kafelek jest zaznaczony
     drag_started = pyqtSignal(object)  # Dane assetu
 
-    # Globalny QThreadPool do zarządzania workerami
-    thread_pool = QThreadPool()
-
     def __init__(
         self,
         tile_model: AssetTileModel,
@@ -59,7 +61,7 @@ class AssetTileView(QFrame):
         )  # Dodaj atrybut do przechowywania pozycji startowej przeciągania
         self.is_loading_thumbnail = False
 
-        self.margins_size = 8
+        self.margins_size = TILE_MARGINS_SIZE
         self.setObjectName("AssetTileViewFrame")  # Added object name
         self._setup_ui()
         self.model.data_changed.connect(self.update_ui)
@@ -80,8 +82,8 @@ class AssetTileView(QFrame):
             except (TypeError, AttributeError):
                 pass  # Połączenie już nie istnieje
 
-        # Zresetuj stan ładowania miniaturki
-        self.is_loading_thumbnail = False
+        # Zresetuj stan ładowania miniaturki (poprzedni asset nie jest już potrzebny)
+        self.cancel_thumbnail_loading()
 
         # Zaktualizuj dane
         self.model = tile_model
@@ -104,6 +106,14 @@ class AssetTileView(QFrame):
 
         logger.debug(f"AssetTileView data updated for asset: {self.asset_id}")
 
+    def set_tile_number(self, tile_number: int, total_tiles: int):
+        """Updates only the tile number (after filtering or reordering)."""
+        if tile_number == self.tile_number and total_tiles == self.total_tiles:
+            return
+        self.tile_number = tile_number
+        self.total_tiles = total_tiles
+        self.tile_number_label.setText(f"{tile_number} / {total_tiles}")
+
     def reset_for_pool(self):
         """Resets the tile to a state ready for reuse in the pool."""
         self._cleanup_connections_and_resources()
@@ -187,16 +197,8 @@ class AssetTileView(QFrame):
         )  # Usuwa wszelkie wewnętrzne marginesy
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
 
-        # Bardziej precyzyjne obliczanie rozmiaru
-        tile_padding = 6  # z CSS
-        tile_border = 1  # z CSS
-
-        # Oblicz szerokość na podstawie kolumn
-        # ikona(60) + nazwa(136) + rozmiar(60)
-        filename_width = 60 + 136 + 60  # 256px
-        tile_width = max(self.thumbnail_size, filename_width)
-        tile_height = self.thumbnail_size + 60 + (2 * tile_padding) + (2 * tile_border)
-        self.setFixedSize(tile_width, tile_height)
+        # Rozmiar jak po update_thumbnail_size - wszystkie kafelki siatki są równe
+        self.setFixedSize(*self._get_tile_size(self.thumbnail_size))
 
         # GŁÓWNY LAYOUT
         layout = QVBoxLayout(self)
@@ -317,12 +319,14 @@ class AssetTileView(QFrame):
             self.texture_icon.setVisible(True)
             self._load_empty_texture_spacer()
         self.checkbox.setVisible(True)
-        # Krok 1: Spróbuj załadować z cache
-        thumbnail_path = self.model.get_thumbnail_path()
-        cached_pixmap = thumbnail_cache.get(thumbnail_path)
+        # Krok 1: Spróbuj załadować z cache (gotowy wariant w rozmiarze kafelka)
+        thumbnail_path = self._get_thumbnail_path()
+        cached_pixmap = thumbnail_cache.get_variant(
+            thumbnail_path, self._get_display_size()
+        )
         if cached_pixmap:
-            self._set_thumbnail_pixmap(cached_pixmap)
-        elif thumbnail_path and os.path.exists(thumbnail_path):
+            self.thumbnail_container.setPixmap(cached_pixmap)
+        elif thumbnail_path and thumbnail_exists(thumbnail_path):
             # Krok 2: Jeśli nie ma w cache, załaduj asynchronicznie
             self._create_placeholder_thumbnail()
             self._load_thumbnail_async(thumbnail_path)
@@ -335,25 +339,42 @@ class AssetTileView(QFrame):
             return
         self.is_loading_thumbnail = True
 
-        worker = ThumbnailLoaderWorker(path)
-        worker.signals.finished.connect(self._on_thumbnail_loaded)
-        worker.signals.error.connect(self._on_thumbnail_error)
-        self.thread_pool.start(worker)
+        # Kolejka z priorytetem: widoczne kafelki ładowane najpierw,
+        # dekodowane od razu w rozmiarze kontenera miniaturki
+        get_thumbnail_load_scheduler().request(self, path, self._get_display_size())
+
+    def cancel_thumbnail_loading(self):
+        """Removes the tile's thumbnail request from the load queue."""
+        if self.is_loading_thumbnail:
+            get_thumbnail_load_scheduler().cancel(self)
+            self.is_loading_thumbnail = False
+
+    def _get_display_size(self) -> int:
+        """Side of the square the thumbnail is displayed in"""
+        container_size = self.thumbnail_container.size()
+        return min(container_size.width(), container_size.height())
+
+    def _get_thumbnail_path(self) -> str:
+        """Thumbnail pyramid level matching the tile size (cache key per size)"""
+        return self.model.get_thumbnail_path(self.thumbnail_size)
 
     def _on_thumbnail_loaded(self, path: str, pixmap: QPixmap):
-        if self.model and path == self.model.get_thumbnail_path():
-            thumbnail_cache.put(path, pixmap)
-            self._set_thumbnail_pixmap(pixmap)
+        if self.model and path == self._get_thumbnail_path():
+            self._set_thumbnail_pixmap(pixmap, path)
             self.is_loading_thumbnail = False
 
     def _on_thumbnail_error(self, path: str, error_message: str):
-        if self.model and path == self.model.get_thumbnail_path():
+        if self.model and path == self._get_thumbnail_path():
             logger.warning(error_message)
             self._create_placeholder_thumbnail()
             self.is_loading_thumbnail = False
 
-    def _set_thumbnail_pixmap(self, pixmap: QPixmap):
-        """Sets QPixmap on the thumbnail label, cropping to square as required."""
+    def _set_thumbnail_pixmap(self, pixmap: QPixmap, path: str = None):
+        """Sets QPixmap on the thumbnail label, cropping to square as required.
+
+        The display-ready result is cached as the (path, size) variant, so the
+        next time the thumbnail is shown at this size it is set directly.
+        """
         target_size = self.thumbnail_container.size()
         size = min(pixmap.width(), pixmap.height())
 
@@ -368,12 +389,19 @@ class AssetTileView(QFrame):
             # Już kwadrat
             rect = pixmap
 
-        scaled_pixmap = rect.scaled(
-            target_size,
-            Qt.AspectRatioMode.IgnoreAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.thumbnail_container.setPixmap(scaled_pixmap)
+        # Poziom piramidy w docelowym rozmiarze - bez skalowania
+        if rect.size() == target_size:
+            display_pixmap = rect
+        else:
+            display_pixmap = rect.scaled(
+                target_size,
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+
+        if path and target_size.width() == target_size.height():
+            thumbnail_cache.put_variant(path, target_size.width(), display_pixmap)
+        self.thumbnail_container.setPixmap(display_pixmap)
 
     def _setup_folder_tile_ui(self):
         # Wyświetlanie nazwy folderu
@@ -585,11 +613,21 @@ class AssetTileView(QFrame):
         """Updates thumbnail size and recalculates layout."""
         self.thumbnail_size = new_size
         # Przelicz szerokość kafelka
-        tile_width = new_size + (2 * self.margins_size)
-        tile_height = new_size + 70
-        self.setFixedSize(tile_width, tile_height)
+        self.setFixedSize(*self._get_tile_size(new_size))
         self.update_ui()  # Przeładuj UI, aby zastosować nowy rozmiar
 
+    def _get_tile_size(self, thumbnail_size: int) -> tuple:
+        """Tile width and height for a thumbnail size"""
+        return self.get_tile_size_for(thumbnail_size)
+
+    @staticmethod
+    def get_tile_size_for(thumbnail_size: int) -> tuple:
+        """Tile width and height for a thumbnail size (no tile needed)"""
+        return (
+            thumbnail_size + 2 * TILE_MARGINS_SIZE,
+            thumbnail_size + TILE_EXTRA_HEIGHT,
+        )
+
     def _update_stars_visibility(self):
         """Updates the visibility of stars based on available space."""
         if hasattr(self, "model") and self.model and not self.model.is_special_folder:
@@ -730,9 +768,9 @@ class AssetTileView(QFrame):
                     pass  # Widget already removed or signal already disconnected
         
         # Stop any running thumbnail workers
-        if hasattr(self, 'is_loading_thumbnail') and self.is_loading_thumbnail:
+        if hasattr(self, 'is_loading_thumbnail'):
             # Cancel any pending thumbnail loading
-            self.is_loading_thumbnail = False
+            self.cancel_thumbnail_loading()
         
         # Clear cached pixmap to free memory
         if hasattr(self, "_cached_pixmap"):
@@ -0,0 +1,215 @@
+"""
+AssetFilterIndex - Per-folder index for filtering the asset gallery.
+
+Built once for the asset list of a folder instead of a linear pass over
+all assets on every keystroke:
+
+- names are normalized once (lowercase, without extension); trigram
+  postings (trigram -> positions) are built on the first text query of
+  3+ characters, which then intersects the postings of its trigrams and
+  checks only the remaining candidates; shorter queries are scanned once,
+- stars and colors are kept in buckets (value -> positions); the sets for
+  "at least N stars" are built from the buckets on first use,
+- results of text queries are cached (typing back and forth repeats them).
+
+Positions are indexes in the display order of the gallery (special folder
+first, then names alphabetically). query() returns a frozenset of
+positions; special folders belong to every result, filters combine by set
+intersection and the grid applies the difference between two results.
+"""
+
+import logging
+import os
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+NGRAM_SIZE = 3
+
+# Number of cached text query results
+TEXT_CACHE_SIZE = 64
+
+
+def sort_assets_for_display(assets: list) -> list:
+    """Special folder first, then the assets sorted by name (gallery order)"""
+    folder_tiles = [a for a in assets if a.get("type") == "special_folder"]
+    other_tiles = [a for a in assets if a.get("type") != "special_folder"]
+    other_tiles.sort(key=lambda x: x.get("name", "").lower())
+    return folder_tiles + other_tiles
+
+
+def normalize_asset_name(name: str) -> str:
+    """Name compared with the search text: lowercase, without extension"""
+    return os.path.splitext(name)[0].lower()
+
+
+def get_ngrams(text: str) -> Set[str]:
+    return {text[i : i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class AssetFilterIndex:
+    """Star, color and name substring index of the assets of one folder"""
+
+    def __init__(self, assets: list):
+        self.assets = sort_assets_for_display(assets)
+        self.all_positions: FrozenSet[int] = frozenset(range(len(self.assets)))
+
+        self._names: List[str] = []
+        self._stars: List[int] = []
+        self._colors: List[Optional[str]] = []
+        self._positions_by_name: Dict[str, int] = {}
+        special = set()
+        self._star_buckets: Dict[int, Set[int]] = {}
+        self._color_buckets: Dict[Optional[str], Set[int]] = {}
+        for position, asset in enumerate(self.assets):
+            name = asset.get("name", "")
+            self._names.append(normalize_asset_name(name))
+            self._positions_by_name[name] = position
+            if asset.get("type") == "special_folder":
+                special.add(position)
+                self._stars.append(-1)
+                self._colors.append(None)
+                continue
+            stars = self._get_stars(asset)
+            color = asset.get("color")
+            self._stars.append(stars)
+            self._colors.append(color)
+            self._star_buckets.setdefault(stars, set()).add(position)
+            self._color_buckets.setdefault(color, set()).add(position)
+        # Folder specjalny jest w każdym wyniku (jak w filtrze liniowym)
+        self._special: FrozenSet[int] = frozenset(special)
+
+        self._ngram_postings: Optional[Dict[str, FrozenSet[int]]] = None
+        self._text_cache: "OrderedDict[str, FrozenSet[int]]" = OrderedDict()
+        self._min_stars_cache: Dict[int, FrozenSet[int]] = {}
+        self._color_cache: Dict[Optional[str], FrozenSet[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    def query(
+        self, min_stars: int = 0, text: str = "", color: Optional[str] = None
+    ) -> FrozenSet[int]:
+        """Positions of the assets matching all given filters
+
+        Args:
+            min_stars: Minimum rating (0 - no star filter).
+            text: Substring of the name (case-insensitive, "" - no filter).
+            color: Color label of the asset (None - no color filter).
+        """
+        results = []
+        if min_stars > 0:
+            results.append(self._get_min_stars_positions(min_stars))
+        if color is not None:
+            results.append(self._get_color_positions(color))
+        text = text.strip().lower()
+        if text:
+            results.append(self._get_text_positions(text))
+        if not results:
+            return self.all_positions
+        results.sort(key=len)
+        if len(results) == 1:
+            return results[0]
+        return results[0].intersection(*results[1:])
+
+    def get_colors(self) -> List[str]:
+        """Color labels used by the assets, sorted (for the color filter)"""
+        return sorted(
+            color for color, bucket in self._color_buckets.items() if color and bucket
+        )
+
+    def get_assets(self, positions) -> list:
+        """Assets at the given positions, in display order"""
+        return [self.assets[position] for position in sorted(positions)]
+
+    def update_asset(self, asset: dict) -> None:
+        """Moves an asset to its current star/color buckets (e.g. after rating)"""
+        position = self._positions_by_name.get(asset.get("name", ""))
+        if position is None or position in self._special:
+            return
+        stars = self._get_stars(asset)
+        if stars != self._stars[position]:
+            self._star_buckets[self._stars[position]].discard(position)
+            self._star_buckets.setdefault(stars, set()).add(position)
+            self._stars[position] = stars
+            self._min_stars_cache.clear()
+        color = asset.get("color")
+        if color != self._colors[position]:
+            self._color_buckets[self._colors[position]].discard(position)
+            self._color_buckets.setdefault(color, set()).add(position)
+            self._colors[position] = color
+            self._color_cache.clear()
+
+    @staticmethod
+    def _get_stars(asset: dict) -> int:
+        try:
+            return int(asset.get("stars") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _get_min_stars_positions(self, min_stars: int) -> FrozenSet[int]:
+        positions = self._min_stars_cache.get(min_stars)
+        if positions is None:
+            positions = set(self._special)
+            for stars, bucket in self._star_buckets.items():
+                if stars >= min_stars:
+                    positions.update(bucket)
+            positions = frozenset(positions)
+            self._min_stars_cache[min_stars] = positions
+        return positions
+
+    def _get_color_positions(self, color: str) -> FrozenSet[int]:
+        positions = self._color_cache.get(color)
+        if positions is None:
+            positions = self._special.union(self._color_buckets.get(color, ()))
+            self._color_cache[color] = positions
+        return positions
+
+    def _get_text_positions(self, text: str) -> FrozenSet[int]:
+        positions = self._text_cache.get(text)
+        if positions is not None:
+            self._text_cache.move_to_end(text)
+            return positions
+
+        names = self._names
+        if len(text) < NGRAM_SIZE:
+            candidates = range(len(names))
+        else:
+            postings = self._get_ngram_postings()
+            grams = [postings.get(gram) for gram in get_ngrams(text)]
+            if any(gram is None for gram in grams):
+                candidates = ()
+            else:
+                grams.sort(key=len)
+                candidates = grams[0].intersection(*grams[1:])
+        positions = self._special.union(
+            position for position in candidates if text in names[position]
+        )
+
+        self._text_cache[text] = positions
+        if len(self._text_cache) > TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        return positions
+
+    def _get_ngram_postings(self) -> Dict[str, FrozenSet[int]]:
+        """Trigram -> positions, built on the first text query"""
+        if self._ngram_postings is None:
+            postings: Dict[str, List[int]] = {}
+            for position, name in enumerate(self._names):
+                if position in self._special:
+                    continue
+                for gram in get_ngrams(name):
+                    bucket = postings.get(gram)
+                    if bucket is None:
+                        postings[gram] = [position]
+                    else:
+                        bucket.append(position)
+            self._ngram_postings = {
+                gram: frozenset(bucket) for gram, bucket in postings.items()
+            }
+            logger.debug(
+                f"AssetFilterIndex: {len(self._ngram_postings)} trigrams "
+                f"for {len(self._names)} assets"
+            )
+        return self._ngram_postings
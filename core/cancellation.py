@@ -0,0 +1,39 @@
+"""
+Cooperative cancellation for long running scans.
+
+A CancellationToken is created by the worker that owns the operation and
+passed down to AssetRepository. The scanner checks it between pairs, so a
+stopped scan finishes the pair in progress, records a checkpoint and
+returns instead of being terminated with half-written files.
+"""
+
+import threading
+
+
+class ScanCancelledError(Exception):
+    """Raised by CancellationToken.raise_if_cancelled() after cancel()"""
+
+
+class CancellationToken:
+    """Thread-safe cancellation flag shared between a worker and the scanner"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Requests cancellation of the operation"""
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """Checks if cancellation was requested"""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raises ScanCancelledError if cancellation was requested"""
+        if self._event.is_set():
+            raise ScanCancelledError("Operation cancelled")
+
+
+def is_cancelled(cancel_token) -> bool:
+    """Checks an optional token (None means the operation cannot be cancelled)"""
+    return cancel_token is not None and cancel_token.is_cancelled()
@@ -4,7 +4,7 @@ import os
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from core.rules import FolderClickRules
-from core.scanner import find_and_create_assets
+from core.scanner import AssetRepository
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +90,9 @@ class FolderStructureScanner(QThread):
                 logger.debug(f"Scanner progress: {message}")
 
             # Uruchom scanner
-            created_assets = find_and_create_assets(folder_path, progress_callback)
+            created_assets = AssetRepository().find_and_create_assets(
+                folder_path, progress_callback
+            )
 
             if created_assets:
                 logger.info(
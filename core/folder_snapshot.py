@@ -0,0 +1,246 @@
+"""
+FolderSnapshot - Single-pass directory listing shared by the scanner,
+folder rules, folder tree and tools tab.
+
+A folder is listed once with os.scandir and its entries are categorised
+into archives, previews, .asset files, subfolders (including special
+texture folders) and .cache thumbnails. Stat data is taken from the
+DirEntry objects, which on Windows comes with the listing itself, so no
+extra round trips are made on network shares.
+
+Snapshots are kept in a small LRU cache and reused by every consumer
+within a refresh cycle. Code that writes into a folder calls
+invalidate_folder_snapshot() so the next reader lists it again.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Configuration of file extensions supported by the application
+FILE_EXTENSIONS = {
+    "archives": ["zip", "rar", "sbsar", "7z"],
+    "images": ["png", "jpg", "jpeg", "webp"],
+}
+
+ARCHIVE_EXTENSIONS = frozenset(f".{ext}" for ext in FILE_EXTENSIONS["archives"])
+PREVIEW_EXTENSIONS = frozenset(f".{ext}" for ext in FILE_EXTENSIONS["images"])
+ASSET_EXTENSION = ".asset"
+THUMB_EXTENSION = ".thumb"
+CACHE_DIR_NAME = ".cache"
+
+# Subfolders shown as special tiles (textures stored outside the archive)
+SPECIAL_FOLDER_NAMES = ["tex", "textures", "maps"]
+
+# Maximum age of a cached snapshot in seconds (changes made outside the
+# application become visible after this time or after an explicit refresh).
+# Applies to the folder tree, rules and tools tab; asset scans always list
+# the folder again (refresh=True), so they never work from a stale listing.
+SNAPSHOT_TTL = 30.0
+
+# Maximum number of folders kept in the snapshot cache
+SNAPSHOT_CACHE_SIZE = 1024
+
+
+class SnapshotEntry(NamedTuple):
+    """File entry with stat data taken from the directory listing"""
+
+    name: str
+    path: str
+    size: int
+    mtime_ns: int
+
+
+class FolderSnapshot:
+    """Categorised contents of a single folder, listed in one os.scandir pass"""
+
+    def __init__(self, folder_path: str):
+        self.folder_path = folder_path
+        self.created_at = time.monotonic()
+        self.file_names: List[str] = []
+        self.archives: Dict[str, SnapshotEntry] = {}
+        self.previews: Dict[str, SnapshotEntry] = {}
+        self.assets: Dict[str, SnapshotEntry] = {}
+        self.subfolders: List[str] = []
+        self.special_folders: List[str] = []
+        self.cache_exists = False
+        self.cache_thumbs: frozenset = frozenset()
+        self._scan()
+
+    def _scan(self) -> None:
+        """Lists the folder once and categorises its entries"""
+        cache_dir_found = False
+
+        with os.scandir(self.folder_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry.name == CACHE_DIR_NAME:
+                            cache_dir_found = True
+                        self.subfolders.append(entry.name)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError as e:
+                    logger.debug(f"Cannot access {entry.path}: {e}")
+                    continue
+
+                self.file_names.append(entry.name)
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in ARCHIVE_EXTENSIONS:
+                    target = self.archives
+                elif ext in PREVIEW_EXTENSIONS:
+                    target = self.previews
+                elif ext == ASSET_EXTENSION:
+                    target = self.assets
+                else:
+                    continue
+
+                try:
+                    stat_result = entry.stat()
+                except OSError as e:
+                    logger.debug(f"Cannot stat {entry.path}: {e}")
+                    continue
+                target[entry.name] = SnapshotEntry(
+                    entry.name, entry.path, stat_result.st_size, stat_result.st_mtime_ns
+                )
+
+        subfolders_lower = {name.lower(): name for name in self.subfolders}
+        self.special_folders = [
+            subfolders_lower[name]
+            for name in SPECIAL_FOLDER_NAMES
+            if name in subfolders_lower
+        ]
+
+        if cache_dir_found:
+            self.cache_exists = True
+            self.cache_thumbs = self._scan_cache_folder()
+
+    def _scan_cache_folder(self) -> frozenset:
+        """Lists thumbnail file names in the .cache folder"""
+        # Local thumbnail store / packed thumbnails - names come from their
+        # indexes, the .cache folder on the network share is not listed
+        from core.local_thumbnail_store import get_local_thumbnail_store
+        from core.thumbnail_atlas import get_atlas_thumbnail_names
+
+        store = get_local_thumbnail_store()
+        if store is not None:
+            store_thumbs = store.get_thumbnail_names(self.folder_path)
+            if store_thumbs is not None:
+                return store_thumbs
+
+        atlas_thumbs = get_atlas_thumbnail_names(self.folder_path)
+        if atlas_thumbs is not None:
+            return atlas_thumbs
+
+        cache_path = os.path.join(self.folder_path, CACHE_DIR_NAME)
+        try:
+            with os.scandir(cache_path) as entries:
+                return frozenset(
+                    entry.name
+                    for entry in entries
+                    if entry.name.lower().endswith(THUMB_EXTENSION)
+                )
+        except OSError as e:
+            logger.warning(f"Error checking .cache: {e}")
+            return frozenset()
+
+    @property
+    def cache_thumb_count(self) -> int:
+        """Number of thumbnail files in the .cache folder"""
+        return len(self.cache_thumbs)
+
+    def files_with_extensions(self, extensions: Iterable[str]) -> List[str]:
+        """Returns names of files with given extensions (with leading dot)"""
+        ext_set = {ext.lower() for ext in extensions}
+        return [
+            name
+            for name in self.file_names
+            if os.path.splitext(name)[1].lower() in ext_set
+        ]
+
+    def get_file_entry(self, file_name: str) -> Optional[SnapshotEntry]:
+        """Returns the stat'ed entry of an archive, preview or .asset file"""
+        return (
+            self.archives.get(file_name)
+            or self.previews.get(file_name)
+            or self.assets.get(file_name)
+        )
+
+    def is_expired(self) -> bool:
+        """Checks if the snapshot is older than SNAPSHOT_TTL"""
+        return time.monotonic() - self.created_at > SNAPSHOT_TTL
+
+
+class FolderSnapshotCache:
+    """Thread-safe LRU cache of folder snapshots"""
+
+    def __init__(self, max_size: int = SNAPSHOT_CACHE_SIZE):
+        self._max_size = max_size
+        self._snapshots: "OrderedDict[str, FolderSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(folder_path: str) -> str:
+        return os.path.normcase(os.path.abspath(folder_path))
+
+    def get(self, folder_path: str, refresh: bool = False) -> FolderSnapshot:
+        """
+        Returns the snapshot of a folder, listing it only when needed
+
+        Args:
+            folder_path (str): Path to the folder
+            refresh (bool): Whether to ignore the cached snapshot
+
+        Returns:
+            FolderSnapshot: Snapshot of the folder
+
+        Raises:
+            OSError: If the folder cannot be listed
+        """
+        key = self._make_key(folder_path)
+        if not refresh:
+            with self._lock:
+                snapshot = self._snapshots.get(key)
+                if snapshot is not None and not snapshot.is_expired():
+                    self._snapshots.move_to_end(key)
+                    return snapshot
+
+        snapshot = FolderSnapshot(folder_path)
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self._max_size:
+                self._snapshots.popitem(last=False)
+        logger.debug(
+            f"Folder snapshot: {folder_path} | files: {len(snapshot.file_names)} | "
+            f"subfolders: {len(snapshot.subfolders)}"
+        )
+        return snapshot
+
+    def invalidate(self, folder_path: Optional[str] = None) -> None:
+        """Drops the snapshot of a folder, or all snapshots when no path is given"""
+        with self._lock:
+            if folder_path is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(self._make_key(folder_path), None)
+
+
+# Global snapshot cache instance
+_snapshot_cache = FolderSnapshotCache()
+
+
+def get_folder_snapshot(folder_path: str, refresh: bool = False) -> FolderSnapshot:
+    """Gets the (cached) snapshot of a folder"""
+    return _snapshot_cache.get(folder_path, refresh)
+
+
+def invalidate_folder_snapshot(folder_path: Optional[str] = None) -> None:
+    """Invalidates the snapshot of a folder after its contents changed"""
+    _snapshot_cache.invalidate(folder_path)
@@ -3,11 +3,26 @@ JSON utilities with fallback to standard json
 Facilitates migration and ensures compatibility
 """
 
+import json
 import logging
+import os
+import stat
+import tempfile
 
 logger = logging.getLogger(__name__)
 
 
+def _get_default_file_mode() -> int:
+    """Mode of a newly created file (0o666 minus the process umask)"""
+    # Odczyt umask wymaga jej zmiany - raz, przy imporcie
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+DEFAULT_FILE_MODE = _get_default_file_mode()
+
+
 
 
 try:
@@ -16,8 +31,6 @@ try:
     HAS_ORJSON = True
     logger.info("Using orjson for JSON operations")
 except ImportError:
-    import json
-
     HAS_ORJSON = False
     logger.warning("orjson not available, falling back to standard json")
 
@@ -75,8 +88,6 @@ def load_from_file(file_path):
         dict: Decoded data or None on error
     """
     try:
-        import os
-
         # Sprawdź rozmiar pliku przed załadowaniem (limit 100MB)
         file_size = os.path.getsize(file_path)
         max_size = 100 * 1024 * 1024  # 100MB
@@ -110,7 +121,7 @@ def load_from_file(file_path):
         return None
 
 
-def save_to_file(obj, file_path, indent=True):
+def save_to_file(obj, file_path, indent=True, atomic=False):
     """
     Saves JSON to file
 
@@ -118,12 +129,55 @@ def save_to_file(obj, file_path, indent=True):
         obj: Object to save
         file_path: Path to file
         indent: Whether to format with indentation
+        atomic: Whether to write a temporary file and replace the target with
+            it, so an interrupted write never leaves a truncated file
     """
-    if HAS_ORJSON:
-        options = orjson.OPT_INDENT_2 if indent else 0
-        with open(file_path, "wb") as f:
-            f.write(orjson.dumps(obj, option=options))
+    target_path = os.fspath(file_path)
+    if atomic:
+        # Unikalny plik tymczasowy - kilka wątków może zapisywać ten sam cel
+        fd, write_path = make_temp_file(target_path)
+        os.close(fd)
     else:
-        indent_value = 2 if indent else None
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=indent_value, ensure_ascii=False)
+        write_path = target_path
+    try:
+        if HAS_ORJSON:
+            options = orjson.OPT_INDENT_2 if indent else 0
+            with open(write_path, "wb") as f:
+                f.write(orjson.dumps(obj, option=options))
+        else:
+            indent_value = 2 if indent else None
+            with open(write_path, "w", encoding="utf-8") as f:
+                json.dump(obj, f, indent=indent_value, ensure_ascii=False)
+        if atomic:
+            os.replace(write_path, target_path)
+    except BaseException:
+        if atomic and os.path.exists(write_path):
+            os.remove(write_path)
+        raise
+
+
+def make_temp_file(target_path):
+    """
+    Creates a uniquely named temporary file next to the target
+
+    The file gets the permissions of the existing target (or of a newly
+    created file) instead of the 0600 of mkstemp, so replacing the target
+    does not take read access away from other users of a shared folder.
+
+    Returns:
+        tuple: (file descriptor, path), as tempfile.mkstemp
+    """
+    target_path = os.fspath(target_path)
+    directory, name = os.path.split(target_path)
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory or None, prefix=f"{name}.", suffix=".tmp"
+    )
+    try:
+        mode = stat.S_IMODE(os.stat(target_path).st_mode)
+    except OSError:
+        mode = DEFAULT_FILE_MODE
+    try:
+        os.chmod(temp_path, mode)
+    except OSError as e:
+        logger.debug(f"Cannot set permissions of {temp_path}: {e}")
+    return fd, temp_path
@@ -0,0 +1,476 @@
+"""
+LibraryIndex - Search index of the assets of all work folders.
+
+Every folder load (gallery, rescan, headless indexer) passes the folder's
+.asset records to the index; only records whose .asset file size or mtime
+changed are written and records of removed files are dropped, so the
+index stays current without a separate crawl. Searching never touches
+the network shares - only the local SQLite database.
+
+The database lives in the local data folder:
+- the assets table keeps name, archive, preview, stars, color, size and
+  meta (JSON) of each record, with indexes on name, stars and color,
+- an FTS5 table with the trigram tokenizer indexes name, archive, preview
+  and meta for case-insensitive substring search (terms of 1-2 characters
+  are matched against names with LIKE).
+
+Results are ordered by name. Matches are first collected in FTS/index
+order up to SORTED_RESULTS_LIMIT and sorted; a broader query walks the
+name index instead (checking the terms with LIKE), so the first rows
+arrive without collecting everything. LibrarySearch fetches the rows in
+batches (the results view pulls them while scrolling).
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from core.utilities import get_local_data_dir
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_DB_NAME = "library_index.db"
+
+# Queries with more matches walk the name index instead of sorting them
+SORTED_RESULTS_LIMIT = 10000
+
+# .asset files modified this recently (ns) are written again on the next
+# load - a change within the mtime resolution would not be noticed
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# FTS5 trigram tokenizer: shorter terms have no trigrams
+MIN_FTS_TERM_LENGTH = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    folder TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    archive TEXT,
+    preview TEXT,
+    stars INTEGER NOT NULL DEFAULT 0,
+    color TEXT,
+    size_mb REAL,
+    meta TEXT,
+    source_size INTEGER NOT NULL,
+    source_mtime_ns INTEGER NOT NULL,
+    UNIQUE (folder, file_name)
+);
+CREATE INDEX IF NOT EXISTS assets_name ON assets (name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS assets_stars ON assets (stars);
+CREATE INDEX IF NOT EXISTS assets_color ON assets (color);
+CREATE VIRTUAL TABLE IF NOT EXISTS assets_text USING fts5(
+    name, archive, preview, meta,
+    content='assets', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS assets_text_insert AFTER INSERT ON assets BEGIN
+    INSERT INTO assets_text (rowid, name, archive, preview, meta)
+    VALUES (new.id, new.name, new.archive, new.preview, new.meta);
+END;
+CREATE TRIGGER IF NOT EXISTS assets_text_delete AFTER DELETE ON assets BEGIN
+    INSERT INTO assets_text (assets_text, rowid, name, archive, preview, meta)
+    VALUES ('delete', old.id, old.name, old.archive, old.preview, old.meta);
+END;
+CREATE TRIGGER IF NOT EXISTS assets_text_update AFTER UPDATE ON assets BEGIN
+    INSERT INTO assets_text (assets_text, rowid, name, archive, preview, meta)
+    VALUES ('delete', old.id, old.name, old.archive, old.preview, old.meta);
+    INSERT INTO assets_text (rowid, name, archive, preview, meta)
+    VALUES (new.id, new.name, new.archive, new.preview, new.meta);
+END;
+CREATE TABLE IF NOT EXISTS folders (
+    folder TEXT PRIMARY KEY,
+    indexed_at REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO assets (
+    folder, file_name, name, archive, preview, stars, color, size_mb, meta,
+    source_size, source_mtime_ns
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (folder, file_name) DO UPDATE SET
+    name = excluded.name, archive = excluded.archive,
+    preview = excluded.preview, stars = excluded.stars,
+    color = excluded.color, size_mb = excluded.size_mb, meta = excluded.meta,
+    source_size = excluded.source_size, source_mtime_ns = excluded.source_mtime_ns
+"""
+
+RESULT_COLUMNS = ("folder", "name", "archive", "preview", "stars", "color", "size_mb")
+
+
+def _folder_key(folder_path: str) -> str:
+    return os.path.abspath(folder_path)
+
+
+def _get_prefix_range(folder_path: str) -> tuple:
+    """Bounds of the folder paths under a folder (for an indexed range query)"""
+    prefix = os.path.join(_folder_key(folder_path), "")
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _quote_fts_term(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class LibrarySearch:
+    """Rows of one query, fetched in batches (ordered by name)
+
+    Either a sorted list of matching ids (rows are read by id, a batch at
+    a time) or an open cursor walking the name index (broad queries).
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        total: Optional[int],
+        ids: Optional[List[int]] = None,
+        cursor: Optional[sqlite3.Cursor] = None,
+    ):
+        self._connection = connection
+        self._ids = ids
+        self._cursor = cursor
+        # Number of matches; None if more than SORTED_RESULTS_LIMIT
+        self.total = total
+        self.fetched = 0
+        self.exhausted = total == 0
+
+    def fetch(self, count: int) -> List[dict]:
+        """Next rows as dicts (RESULT_COLUMNS); fewer than count at the end"""
+        if self.exhausted:
+            return []
+        if self._ids is not None:
+            batch = self._ids[self.fetched : self.fetched + count]
+            rows_by_id = {
+                row[0]: row[1:]
+                for row in self._connection.execute(
+                    f"SELECT id, {', '.join(RESULT_COLUMNS)} FROM assets "
+                    f"WHERE id IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+            }
+            self.fetched += len(batch)
+            self.exhausted = self.fetched >= len(self._ids)
+            # Rekordy usunięte w międzyczasie są pomijane
+            rows = [rows_by_id[i] for i in batch if i in rows_by_id]
+        else:
+            rows = self._cursor.fetchmany(count)
+            self.fetched += len(rows)
+            if len(rows) < count:
+                self.close()
+        return [dict(zip(RESULT_COLUMNS, row)) for row in rows]
+
+    def close(self):
+        if not self.exhausted:
+            self.exhausted = True
+            if self._cursor is not None:
+                self._cursor.close()
+
+
+class LibraryIndex:
+    """SQLite/FTS5 index of the .asset records of all indexed folders"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            db_path,
+            timeout=30,  # the headless indexer writes from several processes
+            check_same_thread=False,
+        )
+        # WAL - searches read while a scan writes
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+        self._read_connection = None
+
+    def update_folder(self, folder_path: str, records: Dict[str, list]) -> int:
+        """
+        Synchronizes the records of a folder with its .asset files
+
+        Args:
+            folder_path: Asset folder
+            records: .asset file name -> [size, mtime_ns, asset record]
+                (the asset index format of the scanner)
+
+        Returns:
+            int: Number of written or removed records
+        """
+        folder = _folder_key(folder_path)
+        newest_allowed_ns = time.time_ns() - RACY_MTIME_WINDOW_NS
+        with self._lock:
+            stored = {
+                row[0]: (row[1], row[2])
+                for row in self._connection.execute(
+                    "SELECT file_name, source_size, source_mtime_ns FROM assets "
+                    "WHERE folder = ?",
+                    (folder,),
+                )
+            }
+            changed = []
+            for file_name, (size, mtime_ns, asset_data) in records.items():
+                if not isinstance(asset_data, dict):
+                    continue
+                if stored.get(file_name) == (size, mtime_ns):
+                    continue
+                if mtime_ns >= newest_allowed_ns:
+                    mtime_ns = -1
+                changed.append(
+                    self._get_row(folder, file_name, size, mtime_ns, asset_data)
+                )
+            removed = [(folder, name) for name in stored if name not in records]
+            is_new_folder = not stored and (
+                self._connection.execute(
+                    "SELECT 1 FROM folders WHERE folder = ?", (folder,)
+                ).fetchone()
+                is None
+            )
+            if not changed and not removed and not is_new_folder:
+                return 0
+            with self._connection:
+                self._connection.executemany(_UPSERT, changed)
+                self._connection.executemany(
+                    "DELETE FROM assets WHERE folder = ? AND file_name = ?", removed
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO folders VALUES (?, ?)", (folder, time.time())
+                )
+        logger.debug(
+            f"Library index: {len(changed)} updated, {len(removed)} removed in {folder}"
+        )
+        return len(changed) + len(removed)
+
+    def update_asset(self, folder_path: str, asset: dict) -> None:
+        """Writes user data of an asset at once (the .asset file is saved later)"""
+        stars = asset.get("stars")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE assets SET stars = ?, color = ?, source_mtime_ns = -1 "
+                "WHERE folder = ? AND name = ?",
+                (
+                    int(stars or 0),
+                    asset.get("color"),
+                    _folder_key(folder_path),
+                    asset.get("name", ""),
+                ),
+            )
+
+    def remove_folder(self, folder_path: str) -> None:
+        folder = _folder_key(folder_path)
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM assets WHERE folder = ?", (folder,))
+            self._connection.execute("DELETE FROM folders WHERE folder = ?", (folder,))
+
+    def remove_missing_folders(
+        self, root_paths: Iterable[str], folder_paths: Iterable[str]
+    ) -> int:
+        """Drops indexed folders under the roots that are not in folder_paths"""
+        keep = {_folder_key(path) for path in folder_paths}
+        missing = []
+        with self._lock:
+            for root_path in root_paths:
+                root = _folder_key(root_path)
+                low, high = _get_prefix_range(root)
+                missing.extend(
+                    folder
+                    for (folder,) in self._connection.execute(
+                        "SELECT folder FROM folders "
+                        "WHERE folder = ? OR (folder >= ? AND folder < ?)",
+                        (root, low, high),
+                    )
+                    if folder not in keep
+                )
+        for folder in missing:
+            self.remove_folder(folder)
+        if missing:
+            logger.info(f"Library index: removed {len(missing)} missing folders")
+        return len(missing)
+
+    def search(
+        self,
+        text: str = "",
+        min_stars: int = 0,
+        color: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> LibrarySearch:
+        """
+        Searches the library; call from one thread (the GUI thread)
+
+        Args:
+            text: Space separated terms; each must occur in the name, archive,
+                preview or meta (terms shorter than 3 characters - in the name)
+            min_stars: Minimum rating (0 - any)
+            color: Color label (None - any)
+            folder_path: Only assets in this folder and its subfolders
+
+        Returns:
+            LibrarySearch: Rows ordered by name, fetched in batches
+        """
+        terms = text.split()
+        fts_terms = [t for t in terms if len(t) >= MIN_FTS_TERM_LENGTH]
+        conditions = []
+        args = []
+        for term in terms:
+            if len(term) < MIN_FTS_TERM_LENGTH:
+                conditions.append("a.name LIKE ? ESCAPE '\\'")
+                args.append(f"%{_escape_like(term)}%")
+        if min_stars > 0:
+            conditions.append("a.stars >= ?")
+            args.append(min_stars)
+        if color is not None:
+            conditions.append("a.color = ?")
+            args.append(color)
+        if folder_path:
+            low, high = _get_prefix_range(folder_path)
+            conditions.append("(a.folder = ? OR (a.folder >= ? AND a.folder < ?))")
+            args.extend((_folder_key(folder_path), low, high))
+
+        connection = self._get_read_connection()
+        if not fts_terms and not conditions:
+            total = connection.execute("SELECT count(*) FROM assets").fetchone()[0]
+            return LibrarySearch(connection, total, cursor=self._walk_names(connection))
+
+        # Dopasowania w kolejności FTS/indeksów, najwyżej do limitu
+        if fts_terms:
+            # CROSS JOIN - FTS zawsze w pętli zewnętrznej (planer wybierał
+            # indeks gwiazdek/koloru i dopasowanie FTS dla każdego wiersza)
+            source = "assets_text CROSS JOIN assets a ON a.id = assets_text.rowid"
+            where = ["assets_text MATCH ?"] + conditions
+            candidate_args = [" AND ".join(_quote_fts_term(t) for t in fts_terms)]
+        else:
+            source, where, candidate_args = "assets a", conditions, []
+        candidates = connection.execute(
+            f"SELECT a.id, a.name FROM {source} WHERE {' AND '.join(where)} LIMIT ?",
+            candidate_args + args + [SORTED_RESULTS_LIMIT + 1],
+        ).fetchall()
+        if len(candidates) <= SORTED_RESULTS_LIMIT:
+            candidates.sort(key=lambda row: (row[1].lower(), row[0]))
+            return LibrarySearch(
+                connection, len(candidates), ids=[row[0] for row in candidates]
+            )
+
+        # Szerokie zapytanie: co najmniej co 50. rekord pasuje - przejście
+        # indeksu nazw z LIKE znajduje pierwsze wiersze bez sortowania
+        for term in fts_terms:
+            pattern = f"%{_escape_like(term)}%"
+            conditions.append(
+                "(" + " OR ".join(
+                    f"a.{column} LIKE ? ESCAPE '\\'"
+                    for column in ("name", "archive", "preview", "meta")
+                ) + ")"
+            )
+            args.extend([pattern] * 4)
+        return LibrarySearch(
+            connection, None, cursor=self._walk_names(connection, conditions, args)
+        )
+
+    @staticmethod
+    def _walk_names(connection, conditions=(), args=()) -> sqlite3.Cursor:
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return connection.execute(
+            f"SELECT a.{', a.'.join(RESULT_COLUMNS)} FROM assets a "
+            f"INDEXED BY assets_name{where} ORDER BY a.name COLLATE NOCASE",
+            list(args),
+        )
+
+    def get_colors(self) -> List[str]:
+        """Color labels used by indexed assets (for the color filter)"""
+        return [
+            row[0]
+            for row in self._get_read_connection().execute(
+                "SELECT DISTINCT color FROM assets WHERE color IS NOT NULL "
+                "AND color != '' ORDER BY color"
+            )
+        ]
+
+    def get_stats(self) -> dict:
+        connection = self._get_read_connection()
+        return {
+            "assets": connection.execute("SELECT count(*) FROM assets").fetchone()[0],
+            "folders": connection.execute("SELECT count(*) FROM folders").fetchone()[0],
+        }
+
+    def _get_read_connection(self) -> sqlite3.Connection:
+        if self._read_connection is None:
+            self._read_connection = sqlite3.connect(
+                self.db_path, timeout=30, check_same_thread=False
+            )
+        return self._read_connection
+
+    @staticmethod
+    def _get_row(folder, file_name, size, mtime_ns, asset_data) -> tuple:
+        meta = asset_data.get("meta")
+        try:
+            stars = int(asset_data.get("stars") or 0)
+        except (TypeError, ValueError):
+            stars = 0
+        return (
+            folder,
+            file_name,
+            asset_data.get("name") or os.path.splitext(file_name)[0],
+            asset_data.get("archive"),
+            asset_data.get("preview"),
+            stars,
+            asset_data.get("color"),
+            asset_data.get("size_mb"),
+            json.dumps(meta, ensure_ascii=False, sort_keys=True) if meta else None,
+            size,
+            mtime_ns,
+        )
+
+
+# Index instance per process
+_index = None
+_index_initialized = False
+_index_lock = threading.Lock()
+
+
+def get_library_index() -> Optional[LibraryIndex]:
+    """Gets the index, None if "library_index" is disabled in config.json"""
+    global _index, _index_initialized
+    if _index_initialized:
+        return _index
+    with _index_lock:
+        if not _index_initialized:
+            from core.thumbnail import get_config
+
+            if get_config().get("library_index", True):
+                try:
+                    _index = LibraryIndex(
+                        os.path.join(get_local_data_dir(), LIBRARY_DB_NAME)
+                    )
+                except sqlite3.Error as e:
+                    logger.error(f"Cannot open library index: {e}")
+                    _index = None
+            _index_initialized = True
+    return _index
+
+
+def update_library_folder(folder_path: str, records: Dict[str, list]) -> None:
+    """Passes the .asset records of a loaded folder to the index (if enabled)"""
+    index = get_library_index()
+    if index is None:
+        return
+    try:
+        index.update_folder(folder_path, records)
+    except sqlite3.Error as e:
+        logger.error(f"Library index error for {folder_path}: {e}")
+
+
+def update_library_asset(folder_path: str, asset: dict) -> None:
+    """Writes changed stars/color of an asset to the index (if enabled)"""
+    index = get_library_index()
+    if index is None or not folder_path:
+        return
+    try:
+        index.update_asset(folder_path, asset)
+    except sqlite3.Error as e:
+        logger.error(f"Library index error for {folder_path}: {e}")
@@ -0,0 +1,247 @@
+"""
+LibrarySearchDialog - Search across all indexed work folders.
+
+Queries go to the library index (core.library_index), not to the folders on
+disk. The result table asks for rows in batches as it is scrolled
+(canFetchMore/fetchMore), so a broad query shows its first rows at once
+and never materializes the whole result.
+"""
+
+import logging
+import os
+from typing import List, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QPixmap
+from PyQt6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QTableView,
+    QVBoxLayout,
+)
+
+from core.library_index import SORTED_RESULTS_LIMIT, LibrarySearch, get_library_index
+
+logger = logging.getLogger(__name__)
+
+# Rows read from the index per fetchMore
+FETCH_BATCH_SIZE = 200
+
+# Delay after the last keystroke before querying (ms)
+SEARCH_DELAY_MS = 250
+
+
+class LibrarySearchModel(QAbstractTableModel):
+    """Rows of a LibrarySearch, read on demand"""
+
+    COLUMNS = ("Name", "Stars", "Size MB", "Folder")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search: Optional[LibrarySearch] = None
+        self._rows: List[dict] = []
+
+    def set_search(self, search: Optional[LibrarySearch]) -> None:
+        self.beginResetModel()
+        if self._search is not None:
+            self._search.close()
+        self._search = search
+        self._rows = []
+        self.endResetModel()
+
+    def get_row(self, row: int) -> dict:
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return (
+            not parent.isValid()
+            and self._search is not None
+            and not self._search.exhausted
+        )
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        rows = self._search.fetch(FETCH_BATCH_SIZE)
+        if not rows:
+            return
+        self.beginInsertRows(
+            QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1
+        )
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return row["name"]
+            if column == 1:
+                return "★" * (row["stars"] or 0)
+            if column == 2:
+                size_mb = row["size_mb"]
+                return f"{size_mb:.2f}" if isinstance(size_mb, (int, float)) else ""
+            return row["folder"]
+        if role == Qt.ItemDataRole.ToolTipRole and column == 3:
+            return row["folder"]
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 2:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return self.COLUMNS[section]
+        return None
+
+
+class LibrarySearchDialog(QDialog):
+    """Non-modal search window; double-click opens the folder of an asset"""
+
+    asset_activated = pyqtSignal(str, str)  # folder, asset name
+
+    def __init__(self, workspace_folders: Optional[list] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Search library")
+        self.resize(900, 550)
+
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Name, archive or metadata...")
+        self.search_edit.setClearButtonEnabled(True)
+
+        self.stars_combo = QComboBox()
+        self.stars_combo.addItem("Any rating", 0)
+        for stars in range(1, 6):
+            self.stars_combo.addItem("★" * stars + "+", stars)
+
+        # Kolory z indeksu - etykiety kolorów assetów nie mają stałej palety
+        self.color_combo = QComboBox()
+        self.color_combo.addItem("Any color", None)
+
+        self.folder_combo = QComboBox()
+        self.folder_combo.addItem("All work folders", None)
+        for folder in workspace_folders or []:
+            path = folder.get("path")
+            if path:
+                self.folder_combo.addItem(folder.get("name") or path, path)
+
+        filters_layout = QHBoxLayout()
+        filters_layout.addWidget(self.search_edit, 1)
+        filters_layout.addWidget(self.stars_combo)
+        filters_layout.addWidget(self.color_combo)
+        filters_layout.addWidget(self.folder_combo)
+
+        self.results_model = LibrarySearchModel(self)
+        self.results_view = QTableView()
+        self.results_view.setModel(self.results_model)
+        self.results_view.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self.results_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.results_view.verticalHeader().setVisible(False)
+        header = self.results_view.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        self.results_view.doubleClicked.connect(self._on_result_activated)
+
+        self.status_label = QLabel("")
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(filters_layout)
+        layout.addWidget(self.results_view, 1)
+        layout.addWidget(self.status_label)
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self.run_search)
+        self.search_edit.textChanged.connect(self._search_timer.start)
+        self.stars_combo.currentIndexChanged.connect(self.run_search)
+        self.color_combo.currentIndexChanged.connect(self.run_search)
+        self.folder_combo.currentIndexChanged.connect(self.run_search)
+
+        self.run_search()
+
+    def run_search(self) -> None:
+        self._search_timer.stop()
+        index = get_library_index()
+        if index is None:
+            self.results_model.set_search(None)
+            self.status_label.setText('Library index is disabled ("library_index")')
+            return
+        try:
+            search = index.search(
+                text=self.search_edit.text(),
+                min_stars=self.stars_combo.currentData() or 0,
+                color=self.color_combo.currentData(),
+                folder_path=self.folder_combo.currentData(),
+            )
+        except Exception as e:
+            logger.error(f"Library search failed: {e}")
+            self.results_model.set_search(None)
+            self.status_label.setText(f"Search failed: {e}")
+            return
+        self.results_model.set_search(search)
+        self.results_model.fetchMore()
+        if search.total is None:
+            self.status_label.setText(f"{SORTED_RESULTS_LIMIT}+ results")
+        else:
+            self.status_label.setText(f"{search.total} results")
+
+    def _load_colors(self) -> None:
+        """Fills the color filter with the colors in the index (keeps the choice)"""
+        index = get_library_index()
+        if index is None:
+            return
+        try:
+            colors = index.get_colors()
+        except Exception as e:
+            logger.error(f"Cannot read library colors: {e}")
+            return
+        selected = self.color_combo.currentData()
+        self.color_combo.blockSignals(True)
+        while self.color_combo.count() > 1:
+            self.color_combo.removeItem(1)
+        for color in colors:
+            swatch = QColor(color)
+            if swatch.isValid():
+                pixmap = QPixmap(12, 12)
+                pixmap.fill(swatch)
+                self.color_combo.addItem(QIcon(pixmap), color, color)
+            else:
+                self.color_combo.addItem(color, color)
+        self.color_combo.setCurrentIndex(max(0, self.color_combo.findData(selected)))
+        self.color_combo.blockSignals(False)
+
+    def showEvent(self, event):
+        # Kolory mogły dojść od ostatniego otwarcia okna
+        self._load_colors()
+        super().showEvent(event)
+
+    def _on_result_activated(self, index: QModelIndex) -> None:
+        row = self.results_model.get_row(index.row())
+        folder = row["folder"]
+        if not os.path.isdir(folder):
+            self.status_label.setText(f"Folder does not exist: {folder}")
+            return
+        self.asset_activated.emit(folder, row["name"])
+
+    def closeEvent(self, event):
+        self.results_model.set_search(None)
+        super().closeEvent(event)
@@ -0,0 +1,354 @@
+"""
+LocalThumbnailStore - Local copy of thumbnails of network work folders.
+
+Thumbnails are still generated next to the data (<folder>/.cache), but
+with config.json "local_thumbnail_store" enabled they are also copied into
+a content-addressed directory tree on the local disk. An SQLite database
+keeps the metadata: which thumbnails a folder has and where their local
+copies are. The gallery and the folder rules then read from the local
+disk instead of going over the network.
+
+A local copy is keyed by the source thumbnail path, size and mtime, so a
+regenerated thumbnail gets a new file. The store is limited by total bytes
+("local_thumbnail_store_limit_mb") and evicts least recently used entries.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from core.folder_snapshot import CACHE_DIR_NAME, THUMB_EXTENSION
+from core.thumbnail_atlas import is_thumbnail_file_name
+from core.utilities import get_local_data_dir
+
+logger = logging.getLogger(__name__)
+
+STORE_DB_NAME = "thumbnails.db"
+STORE_FILES_DIR = "thumbs"
+DEFAULT_STORE_LIMIT_MB = 2048
+
+# Eviction frees space down to this fraction of the limit
+STORE_EVICT_TARGET = 0.9
+
+# Access times are written in batches of this many lookups
+ACCESS_FLUSH_INTERVAL = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS thumbnails (
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    source_size INTEGER NOT NULL,
+    source_mtime_ns INTEGER NOT NULL,
+    bytes INTEGER NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (folder, name)
+);
+CREATE INDEX IF NOT EXISTS thumbnails_last_access ON thumbnails (last_access);
+CREATE TABLE IF NOT EXISTS folders (
+    folder TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def _folder_key(folder_path: str) -> str:
+    return os.path.normcase(os.path.abspath(folder_path))
+
+
+def make_content_key(source_path: str, size: int, mtime_ns: int) -> str:
+    """Content address of a thumbnail version (source path, size and mtime)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{_folder_key(source_path)}|{size}|{mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class LocalThumbnailStore:
+    """SQLite-indexed, content-addressed local thumbnail store with LRU eviction"""
+
+    def __init__(self, store_dir: str, limit_bytes: int):
+        self.store_dir = store_dir
+        self.files_dir = os.path.join(store_dir, STORE_FILES_DIR)
+        self.limit_bytes = limit_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.path.join(store_dir, STORE_DB_NAME),
+            timeout=30,  # the headless indexer writes from several processes
+            check_same_thread=False,
+        )
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+        # folder key -> {thumbnail name: local path}
+        self._folder_cache: Dict[str, Dict[str, str]] = {}
+        self._accessed: Dict[tuple, float] = {}
+
+    def get_local_path(self, folder_path: str, name: str) -> Optional[str]:
+        """Returns the local copy of <folder>/.cache/<name>, None if not stored"""
+        folder = _folder_key(folder_path)
+        with self._lock:
+            paths = self._get_folder_paths(folder)
+            if paths is None:
+                return None
+            path = paths.get(name)
+            if path is not None:
+                self._accessed[(folder, name)] = time.time()
+                if len(self._accessed) >= ACCESS_FLUSH_INTERVAL:
+                    self._flush_access_times()
+            return path
+
+    def get_thumbnail_names(self, folder_path: str) -> Optional[frozenset]:
+        """Names of stored .thumb files of a folder, None if the folder was never synced"""
+        folder = _folder_key(folder_path)
+        with self._lock:
+            paths = self._get_folder_paths(folder)
+            if paths is None:
+                return None
+            return frozenset(
+                name for name in paths if name.lower().endswith(THUMB_EXTENSION)
+            )
+
+    def is_folder_synced(self, folder_path: str) -> bool:
+        with self._lock:
+            return self._get_folder_paths(_folder_key(folder_path)) is not None
+
+    def sync_folder(self, folder_path: str) -> None:
+        """Copies new or changed thumbnails of a folder and drops removed ones"""
+        folder = _folder_key(folder_path)
+        cache_dir = os.path.join(folder_path, CACHE_DIR_NAME)
+        try:
+            with os.scandir(cache_dir) as entries:
+                files = {
+                    entry.name: entry
+                    for entry in entries
+                    if is_thumbnail_file_name(entry.name) and entry.is_file()
+                }
+        except OSError as e:
+            logger.debug(f"Cannot list {cache_dir}: {e}")
+            files = {}
+
+        with self._lock:
+            stored = {
+                row[0]: row[1:]
+                for row in self._connection.execute(
+                    "SELECT name, key, source_size, source_mtime_ns FROM thumbnails "
+                    "WHERE folder = ?",
+                    (folder,),
+                )
+            }
+
+        now = time.time()
+        rows = []
+        copied = 0
+        for name, entry in files.items():
+            try:
+                stat_result = entry.stat()
+            except OSError as e:
+                logger.debug(f"Cannot stat {entry.path}: {e}")
+                continue
+            current = stored.get(name)
+            if current is not None and tuple(current[1:]) == (
+                stat_result.st_size,
+                stat_result.st_mtime_ns,
+            ):
+                continue
+            key = make_content_key(
+                entry.path, stat_result.st_size, stat_result.st_mtime_ns
+            )
+            local_path = self._get_file_path(key, name)
+            try:
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                shutil.copyfile(entry.path, local_path)
+            except OSError as e:
+                logger.debug(f"Cannot copy thumbnail {entry.path}: {e}")
+                continue
+            copied += 1
+            rows.append(
+                (folder, name, key, stat_result.st_size, stat_result.st_mtime_ns,
+                 stat_result.st_size, now)
+            )
+
+        removed = [name for name in stored if name not in files]
+        stale_files = [
+            self._get_file_path(stored[name][0], name)
+            for name in removed
+        ] + [
+            self._get_file_path(stored[row[1]][0], row[1])
+            for row in rows
+            if row[1] in stored
+        ]
+
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._connection.executemany(
+                "DELETE FROM thumbnails WHERE folder = ? AND name = ?",
+                [(folder, name) for name in removed],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO folders VALUES (?, ?)", (folder, now)
+            )
+            self._connection.commit()
+            self._folder_cache.pop(folder, None)
+
+        self._remove_files(stale_files)
+        if copied or removed:
+            logger.debug(
+                f"Local thumbnail store synced: {folder_path} | "
+                f"{copied} copied, {len(removed)} removed"
+            )
+            self.evict()
+
+    def evict(self) -> int:
+        """Removes least recently used thumbnails above the size limit"""
+        with self._lock:
+            self._flush_access_times()
+            total = self._connection.execute(
+                "SELECT COALESCE(SUM(bytes), 0) FROM thumbnails"
+            ).fetchone()[0]
+            if total <= self.limit_bytes:
+                return 0
+
+            target = int(self.limit_bytes * STORE_EVICT_TARGET)
+            evicted = []
+            for folder, name, key, size in self._connection.execute(
+                "SELECT folder, name, key, bytes FROM thumbnails ORDER BY last_access"
+            ):
+                if total <= target:
+                    break
+                evicted.append((folder, name, key))
+                total -= size
+
+            self._connection.executemany(
+                "DELETE FROM thumbnails WHERE folder = ? AND name = ?",
+                [(folder, name) for folder, name, _ in evicted],
+            )
+            # Folders with evicted thumbnails are no longer complete
+            folders = {folder for folder, _, _ in evicted}
+            self._connection.executemany(
+                "DELETE FROM folders WHERE folder = ?", [(f,) for f in folders]
+            )
+            self._connection.commit()
+            for folder in folders:
+                self._folder_cache.pop(folder, None)
+
+        self._remove_files(
+            self._get_file_path(key, name) for _, name, key in evicted
+        )
+        logger.info(f"Local thumbnail store: evicted {len(evicted)} thumbnails")
+        return len(evicted)
+
+    def forget_folder(self, folder_path: str) -> None:
+        """Drops all thumbnails of a folder (e.g. before its .cache is rebuilt)"""
+        folder = _folder_key(folder_path)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name, key FROM thumbnails WHERE folder = ?", (folder,)
+            ).fetchall()
+            self._connection.execute("DELETE FROM thumbnails WHERE folder = ?", (folder,))
+            self._connection.execute("DELETE FROM folders WHERE folder = ?", (folder,))
+            self._connection.commit()
+            self._folder_cache.pop(folder, None)
+        self._remove_files(self._get_file_path(key, name) for name, key in rows)
+
+    def _get_folder_paths(self, folder: str) -> Optional[Dict[str, str]]:
+        """Local paths of a folder's thumbnails (caller holds the lock)"""
+        paths = self._folder_cache.get(folder)
+        if paths is not None:
+            return paths
+        if self._connection.execute(
+            "SELECT 1 FROM folders WHERE folder = ?", (folder,)
+        ).fetchone() is None:
+            return None
+        paths = {
+            name: self._get_file_path(key, name)
+            for name, key in self._connection.execute(
+                "SELECT name, key FROM thumbnails WHERE folder = ?", (folder,)
+            )
+        }
+        self._folder_cache[folder] = paths
+        return paths
+
+    def _flush_access_times(self) -> None:
+        """Writes batched access times (caller holds the lock)"""
+        if not self._accessed:
+            return
+        self._connection.executemany(
+            "UPDATE thumbnails SET last_access = ? WHERE folder = ? AND name = ?",
+            [(t, folder, name) for (folder, name), t in self._accessed.items()],
+        )
+        self._connection.commit()
+        self._accessed.clear()
+
+    def _get_file_path(self, key: str, name: str) -> str:
+        # Extension kept for readability (.thumb, .thumb128, ...)
+        ext = os.path.splitext(name)[1]
+        return os.path.join(self.files_dir, key[:2], f"{key}{ext}")
+
+    @staticmethod
+    def _remove_files(paths: Iterable[str]) -> None:
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.debug(f"Cannot remove {path}: {e}")
+
+
+# Global store instance (None when the mode is disabled)
+_store = None
+_store_initialized = False
+_store_init_lock = threading.Lock()
+
+
+def get_local_thumbnail_store() -> Optional[LocalThumbnailStore]:
+    """Gets the global store, None if "local_thumbnail_store" is disabled"""
+    global _store, _store_initialized
+    if _store_initialized:
+        return _store
+    with _store_init_lock:
+        if not _store_initialized:
+            from core.thumbnail import get_config
+
+            config = get_config()
+            if config.get("local_store"):
+                try:
+                    _store = LocalThumbnailStore(
+                        get_local_data_dir("thumbnail_store"),
+                        int(config.get("local_store_limit_mb", DEFAULT_STORE_LIMIT_MB))
+                        * 1024 * 1024,
+                    )
+                    logger.info(f"Local thumbnail store: {_store.store_dir}")
+                except (OSError, sqlite3.Error) as e:
+                    logger.error(f"Cannot open local thumbnail store: {e}")
+                    _store = None
+            _store_initialized = True
+    return _store
+
+
+def sync_local_thumbnails(folder_paths: Iterable[str]) -> None:
+    """Copies thumbnails of the folders into the local store (if enabled)"""
+    store = get_local_thumbnail_store()
+    if store is None:
+        return
+    for folder_path in folder_paths:
+        if folder_path:
+            try:
+                store.sync_folder(folder_path)
+            except sqlite3.Error as e:
+                logger.error(f"Local thumbnail store error for {folder_path}: {e}")
+
+
+def resolve_local_thumbnail(thumbnail_path: str) -> Optional[str]:
+    """Local copy of <folder>/.cache/<name>, None if not stored or disabled"""
+    store = get_local_thumbnail_store()
+    if store is None or not thumbnail_path:
+        return None
+    cache_dir, name = os.path.split(thumbnail_path)
+    return store.get_local_path(os.path.dirname(cache_dir), name)
@@ -47,6 +47,9 @@ class MainWindow(QMainWindow):
         # Initialize SelectionCounter (will be properly set up after AMV tab creation)
         self.selection_counter = None
 
+        # Library search window (created on first use)
+        self.library_search_dialog = None
+
         # Default configuration as class field
         self.default_config = {
             "logger_level": "INFO",
@@ -170,6 +173,11 @@ class MainWindow(QMainWindow):
         try:
             menu_bar = QMenuBar(self)
             file_menu = QMenu("File", self)
+            search_action = QAction("Search library...", self)
+            search_action.setShortcut("Ctrl+Shift+F")
+            search_action.triggered.connect(self._show_library_search)
+            file_menu.addAction(search_action)
+            file_menu.addSeparator()
             exit_action = QAction("Exit", self)
             exit_action.triggered.connect(self.close)
             file_menu.addAction(exit_action)
@@ -181,6 +189,29 @@ class MainWindow(QMainWindow):
             self.logger.error(f"Error creating menu bar: {e}")
             # Menu bar is not critical - application can work without it
 
+    def _show_library_search(self):
+        """Shows the library search window (created on first use)"""
+        try:
+            if self.library_search_dialog is None:
+                from core.library_search_dialog import LibrarySearchDialog
+
+                controller = self._get_amv_controller()
+                self.library_search_dialog = LibrarySearchDialog(
+                    controller.model.workspace_folders_model.get_folders(), self
+                )
+                self.library_search_dialog.asset_activated.connect(
+                    lambda folder, name: controller.folder_tree_controller.open_folder(
+                        folder
+                    )
+                )
+            else:
+                self.library_search_dialog.run_search()
+            self.library_search_dialog.show()
+            self.library_search_dialog.raise_()
+            self.library_search_dialog.activateWindow()
+        except Exception as e:
+            self.logger.error(f"Error opening library search: {e}")
+
     def _createTabs(self):
         """Creates application tabs with comprehensive error handling"""
         try:
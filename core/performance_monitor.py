@@ -96,8 +96,26 @@ class PerformanceMonitor:
         self.log_file = log_file
         self.enable_console_logging = enable_console_logging
         self.metrics_history: list[PerformanceMetrics] = []
+        # name -> callable returning a dict of counters (e.g. cache statistics)
+        self.stats_providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
         self._setup_logging()
 
+    def register_stats_provider(
+        self, name: str, provider: Callable[[], Dict[str, Any]]
+    ):
+        """Registers a source of statistics logged together with the metrics"""
+        self.stats_providers[name] = provider
+
+    def collect_stats(self) -> Dict[str, Any]:
+        """Collects statistics from all registered providers"""
+        stats = {}
+        for name, provider in list(self.stats_providers.items()):
+            try:
+                stats[name] = provider()
+            except Exception as e:
+                logger.debug(f"Could not collect {name} statistics: {e}")
+        return stats
+
     def _setup_logging(self):
         """Configures logging system"""
         if self.log_file:
@@ -107,6 +125,8 @@ class PerformanceMonitor:
     def _log_metrics(self, metrics: PerformanceMetrics):
         """Logs metrics to file and/or console"""
         metrics_dict = metrics.to_dict()
+        if self.stats_providers:
+            metrics_dict["stats"] = self.collect_stats()
 
         # Logowanie do pliku
         if self.log_file:
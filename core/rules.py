@@ -23,6 +23,7 @@ import time
 from typing import Dict, Optional, Set
 
 from core.performance_monitor import measure_operation
+from core.folder_snapshot import get_folder_snapshot
 from core.json_utils import load_from_file
 
 logger = logging.getLogger(__name__)
@@ -450,19 +451,12 @@ class FolderClickRules:
             int: Number of thumbnail files
         """
         try:
-            if not os.path.exists(cache_folder_path) or not os.path.isdir(
-                cache_folder_path
-            ):
+            if not os.path.isdir(cache_folder_path):
                 return 0
 
-            cache_items = os.listdir(cache_folder_path)
-            thumb_count = sum(
-                1
-                for item in cache_items
-                if item.lower().endswith(FolderClickRules.THUMB_EXTENSION)
-            )
-
-            return thumb_count
+            # Thumbnails are listed together with the parent folder snapshot
+            snapshot = get_folder_snapshot(os.path.dirname(cache_folder_path))
+            return snapshot.cache_thumb_count
 
         except (OSError, PermissionError) as e:
             logger.warning(f"Error checking .cache: {e}")
@@ -534,9 +528,9 @@ class FolderClickRules:
                     f"Folder does not exist: {folder_path}"
                 )
 
-            # Get list of all items in the folder
+            # Get the folder snapshot (shared with the scanner and tools tab)
             try:
-                items = os.listdir(folder_path)
+                snapshot = get_folder_snapshot(folder_path)
             except (OSError, PermissionError) as e:
                 return FolderClickRules._create_error_result(
                     f"No read permission for folder: {e}"
@@ -546,25 +540,16 @@ class FolderClickRules:
             asset_files = []
             preview_archive_files = []
 
-            for item in items:
+            for item in snapshot.file_names:
                 category = FolderClickRules._categorize_file(item)
                 if category == "asset":
                     asset_files.append(item)
                 elif category in ("archive", "preview"):
                     preview_archive_files.append(item)
 
-            # Check for existence and contents of .cache folder
-            cache_folder_path = os.path.join(
-                folder_path, FolderClickRules.CACHE_FOLDER_NAME
-            )
-            cache_exists = os.path.exists(cache_folder_path) and os.path.isdir(
-                cache_folder_path
-            )
-
-            # Count thumbnail files in .cache folder
-            cache_thumb_count = FolderClickRules._analyze_cache_folder(
-                cache_folder_path
-            )
+            # Existence and contents of .cache folder come from the snapshot
+            cache_exists = snapshot.cache_exists
+            cache_thumb_count = snapshot.cache_thumb_count
 
             # Prepare result
             result = {
@@ -1,19 +1,62 @@
 import logging
 import os
-
+import time
+import uuid
+from contextlib import closing
+from concurrent.futures import (
+    BrokenExecutor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+
+from core.cancellation import is_cancelled
+from core.folder_snapshot import (
+    CACHE_DIR_NAME,
+    FILE_EXTENSIONS,  # noqa: F401 - re-exported for existing imports
+    SPECIAL_FOLDER_NAMES,
+    get_folder_snapshot,
+    invalidate_folder_snapshot,
+)
 from core.json_utils import load_from_file, save_to_file
 from core.performance_monitor import measure_operation
-from core.thumbnail import generate_thumbnail
+from core.thumbnail import generate_thumbnail, get_thumbnail_levels, get_thumbnail_size
+from core.library_index import update_library_folder
+from core.local_thumbnail_store import get_local_thumbnail_store
+from core.thumbnail_atlas import (
+    ATLAS_INDEX_NAME,
+    is_atlas_enabled,
+    sync_thumbnail_atlas,
+)
 from core.utilities import get_file_size_mb
 
 # Adding logger for the module
 logger = logging.getLogger(__name__)
 
-# Configuration of file extensions supported by the application
-FILE_EXTENSIONS = {
-    "archives": ["zip", "rar", "sbsar", "7z"],
-    "images": ["png", "jpg", "jpeg", "webp"],
-}
+# Upper bound for thumbnail worker processes (Windows limits wait handles to 61)
+MAX_THUMBNAIL_PROCESSES = 61
+
+# Upper bound for I/O threads reading .asset files concurrently
+MAX_ASSET_LOAD_THREADS = 16
+# Number of loaded .asset files between progress reports
+ASSET_LOAD_PROGRESS_STEP = 100
+
+# Per-folder manifest used by incremental scans (stored in the .cache folder)
+SCAN_MANIFEST_NAME = "scan_manifest.json"
+SCAN_MANIFEST_VERSION = 1
+UNPAIR_FILES_NAME = "unpair_files.json"
+# Completed pairs are checkpointed in the manifest at this interval (seconds)
+SCAN_CHECKPOINT_INTERVAL = 2.0
+# Marker of a stopped rebuild (stored in the .cache folder); valid only while
+# its checkpoint id matches the checkpoint recorded in the scan manifest
+REBUILD_CHECKPOINT_NAME = "rebuild.checkpoint"
+
+# Consolidated per-folder index of .asset records (stored in the .cache folder)
+ASSET_INDEX_NAME = "assets.idx"
+ASSET_INDEX_VERSION = 1
+# .asset files modified this close to the index write are not cached, because
+# a later change within the same mtime tick would not be detected
+ASSET_INDEX_RACY_WINDOW_NS = 2_000_000_000
 
 
 class AssetRepository:
@@ -26,7 +69,15 @@ class AssetRepository:
 
     def __init__(self):
         """Initializes the asset repository."""
-        pass
+        # Thumbnails created by this repository / reused from identical images
+        self.thumbnail_stats = {"thumbnails": 0, "reused": 0}
+        # Archive/preview pairs found / selected for processing by scans
+        self.scan_stats = {"pairs": 0, "to_process": 0}
+
+    def get_dedup_ratio(self) -> float:
+        """Fraction of thumbnails reused from identical images (0.0 - 1.0)"""
+        total = self.thumbnail_stats["thumbnails"]
+        return self.thumbnail_stats["reused"] / total if total else 0.0
 
     @staticmethod
     def _validate_folder_path_static(folder_path: str) -> bool:
@@ -50,27 +101,6 @@ class AssetRepository:
         
         return None
 
-    def _get_files_by_extensions(self, folder_path: str, extensions: list) -> list:
-        """
-        Helper function for finding files with specific extensions
-
-        Args:
-            folder_path (str): Path to the folder
-            extensions (list): List of extensions (without dot)
-
-        Returns:
-            list: List of found file paths
-        """
-        files = []
-        ext_set = set(ext.lower() for ext in extensions)
-        for entry in os.listdir(folder_path):
-            full_path = os.path.join(folder_path, entry)
-            if os.path.isfile(full_path):
-                _, ext = os.path.splitext(entry)
-                if ext and ext[1:].lower() in ext_set:
-                    files.append(full_path)
-        return files
-
     def _scan_folder_for_files(self, folder_path: str) -> tuple:
         """
         Scans the folder for archive and image files
@@ -81,37 +111,26 @@ class AssetRepository:
         Returns:
             tuple: (archive_by_name, image_by_name) - dictionaries of files by name
         """
-        # Find all archive and image files
-        archive_files = self._get_files_by_extensions(
-            folder_path, FILE_EXTENSIONS["archives"]
-        )
-        image_files = self._get_files_by_extensions(
-            folder_path, FILE_EXTENSIONS["images"]
-        )
+        # Archives and images come from the shared folder snapshot
+        snapshot = get_folder_snapshot(folder_path)
 
         # Dictionary to store files by name (without extension) - case-insensitive
         archive_by_name = {}
         image_by_name = {}
 
         # Group archive files by name (case-insensitive)
-        for archive_file in archive_files:
-            name_without_ext = os.path.splitext(os.path.basename(archive_file))[0]
-            name_lower = (
-                name_without_ext.lower()
-            )  # Convert to lowercase for comparison
-            archive_by_name[name_lower] = archive_file
+        for file_name, entry in snapshot.archives.items():
+            name_lower = os.path.splitext(file_name)[0].lower()
+            archive_by_name[name_lower] = entry.path
 
         # Group image files by name (case-insensitive)
-        for image_file in image_files:
-            name_without_ext = os.path.splitext(os.path.basename(image_file))[0]
-            name_lower = (
-                name_without_ext.lower()
-            )  # Convert to lowercase for comparison
-            image_by_name[name_lower] = image_file
+        for file_name, entry in snapshot.previews.items():
+            name_lower = os.path.splitext(file_name)[0].lower()
+            image_by_name[name_lower] = entry.path
 
         logger.debug(
-            f"Found {len(archive_files)} archive files and "
-            f"{len(image_files)} image files"
+            f"Found {len(snapshot.archives)} archive files and "
+            f"{len(snapshot.previews)} image files"
         )
         return archive_by_name, image_by_name
 
@@ -135,16 +154,12 @@ class AssetRepository:
             logger.warning(f"Folder does not exist: {folder_path}")
             return True
 
-        # List of folder names to check
-        texture_folder_names = ["tex", "textures", "maps"]
-
         try:
-            # Check each texture folder
-            for folder_name in texture_folder_names:
-                texture_folder_path = os.path.join(folder_path, folder_name)
-                if os.path.isdir(texture_folder_path):
-                    logger.debug(f"Found texture folder: {folder_name}")
-                    return False  # Found texture folder - textures are external
+            # Check texture folders found in the folder snapshot
+            special_folders = get_folder_snapshot(folder_path).special_folders
+            if special_folders:
+                logger.debug(f"Found texture folder: {special_folders[0]}")
+                return False  # Found texture folder - textures are external
 
             logger.debug("No texture folders found - textures are in archive")
             return True  # No texture folders found - textures are in archive
@@ -167,9 +182,17 @@ class AssetRepository:
     ) -> list:
         """Scans the folder for subfolders with given names."""
         found_folders = []
+        try:
+            subfolders = {
+                name.lower(): name
+                for name in get_folder_snapshot(folder_path).subfolders
+            }
+        except OSError as e:
+            logger.error(f"Cannot list subfolders of {folder_path}: {e}")
+            return found_folders
         for folder_name in folder_names:
-            full_path = os.path.join(folder_path, folder_name)
-            if os.path.isdir(full_path):
+            if folder_name.lower() in subfolders:
+                full_path = os.path.join(folder_path, subfolders[folder_name.lower()])
                 found_folders.append(
                     {
                         "type": "special_folder",
@@ -182,11 +205,16 @@ class AssetRepository:
 
     def _scan_for_special_folders(self, folder_path: str) -> list:
         """Scans the folder for special folders (tex, textures, maps)."""
-        special_folder_names = ["tex", "textures", "maps"]
-        return self._scan_for_named_folders(folder_path, special_folder_names)
+        return self._scan_for_named_folders(folder_path, SPECIAL_FOLDER_NAMES)
 
     def _create_single_asset(
-        self, name: str, archive_path: str, image_path: str, folder_path: str
+        self,
+        name: str,
+        archive_path: str,
+        image_path: str,
+        folder_path: str,
+        thumbnail: str | None = None,
+        textures_in_archive: bool | None = None,
     ) -> dict | None:
         """
         Creates a single .asset file
@@ -196,6 +224,10 @@ class AssetRepository:
             archive_path (str): Path to archive file
             image_path (str): Path to image file
             folder_path (str): Path to target folder
+            thumbnail (str|None): Thumbnail file name generated for this asset,
+                written in the same save as the rest of the data
+            textures_in_archive (bool|None): Result of the texture folder check
+                computed once per scan; checked here when None
 
         Returns:
             dict|None: Asset data dictionary or None on error
@@ -216,8 +248,9 @@ class AssetRepository:
             # Get archive file size in MB
             archive_size_mb = self._get_file_size_mb(archive_path)
 
-            # Check for texture folder presence
-            textures_in_archive = self._check_texture_folders_presence(folder_path)
+            # Check for texture folder presence (once per scan when provided)
+            if textures_in_archive is None:
+                textures_in_archive = self._check_texture_folders_presence(folder_path)
 
             # Create new asset data
             asset_data = {
@@ -226,7 +259,13 @@ class AssetRepository:
                 "archive": os.path.basename(archive_path),
                 "preview": os.path.basename(image_path),
                 "size_mb": archive_size_mb,
-                "thumbnail": None,
+                "thumbnail": thumbnail,
+                "thumbnail_levels": list(get_thumbnail_levels()) if thumbnail else [],
+                # Nazwy plików poziomów zależą od rozmiaru .thumb
+                "thumbnail_size": get_thumbnail_size() if thumbnail else None,
+                "thumbnail_source": (
+                    self._get_thumbnail_source(image_path) if thumbnail else None
+                ),
                 "stars": None,
                 "color": None,
                 "textures_in_the_archive": textures_in_archive,
@@ -254,12 +293,22 @@ class AssetRepository:
                         f"Preserved color: {existing_asset_data['color']} for {name}"
                     )
 
-                # Preserve thumbnail if exists
+                # Preserve thumbnail if exists and no new one was generated
                 if (
-                    "thumbnail" in existing_asset_data
+                    thumbnail is None
+                    and "thumbnail" in existing_asset_data
                     and existing_asset_data["thumbnail"] is not None
                 ):
                     asset_data["thumbnail"] = existing_asset_data["thumbnail"]
+                    asset_data["thumbnail_levels"] = existing_asset_data.get(
+                        "thumbnail_levels", []
+                    )
+                    asset_data["thumbnail_size"] = existing_asset_data.get(
+                        "thumbnail_size"
+                    )
+                    asset_data["thumbnail_source"] = existing_asset_data.get(
+                        "thumbnail_source"
+                    )
                     logger.debug(
                         f"Preserved thumbnail: {existing_asset_data['thumbnail']} for {name}"
                     )
@@ -268,9 +317,10 @@ class AssetRepository:
                 if "meta" in existing_asset_data:
                     asset_data["meta"] = existing_asset_data["meta"]
 
-            # Save .asset file
-            save_to_file(asset_data, asset_file_path)
-            logger.debug(f"Created .asset file: {name}.asset")
+            # Save .asset file (unchanged files keep their asset index record)
+            if asset_data != existing_asset_data:
+                save_to_file(asset_data, asset_file_path, atomic=True)
+                logger.debug(f"Created .asset file: {name}.asset")
 
             return asset_data
 
@@ -291,9 +341,28 @@ class AssetRepository:
             return None
 
     def _get_file_size_mb(self, file_path: str) -> float:
-        """Gets file size in megabytes"""
+        """Gets file size in megabytes (from the folder snapshot when available)"""
+        entry = self._get_snapshot_entry(file_path)
+        if entry is not None:
+            return round(entry.size / (1024 * 1024), 2)
         return get_file_size_mb(file_path)
 
+    def _get_thumbnail_source(self, image_path: str) -> list | None:
+        """Returns [size, mtime_ns] of the preview a thumbnail is generated from"""
+        try:
+            return self._get_file_fingerprint(image_path)[1:]
+        except OSError:
+            return None
+
+    @staticmethod
+    def _get_snapshot_entry(file_path: str):
+        """Returns the folder snapshot entry of a file, None if not listed"""
+        try:
+            snapshot = get_folder_snapshot(os.path.dirname(file_path))
+        except OSError:
+            return None
+        return snapshot.get_file_entry(os.path.basename(file_path))
+
     def create_thumbnail_for_asset(
         self, asset_path: str, image_path: str
     ) -> str | None:
@@ -320,13 +389,7 @@ class AssetRepository:
             # Generate thumbnail
             result = generate_thumbnail(image_path)
             logger.debug(f"generate_thumbnail result: {result}")
-
-            if isinstance(result, tuple) and len(result) >= 1:
-                thumbnail_path = result[0]  # First element is thumbnail path
-                logger.debug(f"Extracted thumbnail path: {thumbnail_path}")
-            else:
-                thumbnail_path = None
-                logger.warning(f"Invalid result from generate_thumbnail: {result}")
+            thumbnail_path = self._extract_thumbnail_name(result)
 
             if thumbnail_path:
                 logger.debug(f"Created thumbnail: {thumbnail_path}")
@@ -335,10 +398,16 @@ class AssetRepository:
                 asset_data = load_from_file(asset_path)
                 if asset_data:
                     asset_data["thumbnail"] = thumbnail_path
-                    save_to_file(asset_data, asset_path)
+                    asset_data["thumbnail_levels"] = list(get_thumbnail_levels())
+                    asset_data["thumbnail_size"] = get_thumbnail_size()
+                    asset_data["thumbnail_source"] = self._get_thumbnail_source(
+                        image_path
+                    )
+                    save_to_file(asset_data, asset_path, atomic=True)
                     logger.debug(
                         f"Updated .asset file with thumbnail: {asset_path}"
                     )
+                self._publish_thumbnails(os.path.dirname(asset_path), True)
 
                 return thumbnail_path
             else:
@@ -386,8 +455,8 @@ class AssetRepository:
             }
 
             # Save to JSON file
-            unpaired_file_path = os.path.join(folder_path, "unpair_files.json")
-            save_to_file(unpaired_data, unpaired_file_path)
+            unpaired_file_path = os.path.join(folder_path, UNPAIR_FILES_NAME)
+            save_to_file(unpaired_data, unpaired_file_path, atomic=True)
 
             logger.info(
                 f"Created unpair_files.json: "
@@ -403,7 +472,14 @@ class AssetRepository:
             self._handle_error("creating unpair_files.json - unexpected error", e)
 
     def find_and_create_assets(
-        self, folder_path: str, progress_callback=None, use_async_thumbnails=False
+        self,
+        folder_path: str,
+        progress_callback=None,
+        use_async_thumbnails=False,
+        parallel_thumbnails=False,
+        incremental=False,
+        cancel_token=None,
+        scan_id=None,
     ) -> list:
         """
         Finds and creates assets in the specified folder
@@ -412,13 +488,29 @@ class AssetRepository:
             folder_path (str): Path to the folder to scan
             progress_callback (callable): Optional callback function to report progress
             use_async_thumbnails (bool): Whether to use asynchronous thumbnail generation
+            parallel_thumbnails (bool): Whether to generate thumbnails in a process
+                pool sized to the number of CPU cores
+            incremental (bool): Whether to process only pairs added or modified
+                since the last scan, according to the folder's scan manifest.
+                Unchanged .asset files are not touched on disk.
+            cancel_token (CancellationToken): Optional token stopping the scan
+                after the pairs in progress; completed pairs are checkpointed,
+                so the next incremental scan resumes with the remaining ones
+            scan_id (str): Optional id recorded with the checkpoint of a stopped
+                scan (see get_scan_checkpoint); a new one is generated if None
 
         Returns:
             list: List of dictionaries representing found assets
+                (in incremental mode only the assets that were (re)created)
         """
         with measure_operation(
             "scanner.find_and_create_assets",
-            {"folder_path": folder_path, "use_async_thumbnails": use_async_thumbnails},
+            {
+                "folder_path": folder_path,
+                "use_async_thumbnails": use_async_thumbnails,
+                "parallel_thumbnails": parallel_thumbnails,
+                "incremental": incremental,
+            },
         ):
             # Folder path validation
             if not AssetRepository._validate_folder_path_static(folder_path):
@@ -427,20 +519,27 @@ class AssetRepository:
             try:
                 logger.info(f"Starting folder scan: {folder_path}")
 
-                # Scan and group files
-                file_groups = self._scan_and_group_files(folder_path)
+                # Skan zawsze listuje folder od nowa (pliki skopiowane spoza
+                # aplikacji nie mogą czekać na wygaśnięcie snapshotu)
+                get_folder_snapshot(folder_path, refresh=True)
 
                 # Scan special folders
                 special_folders = self._scan_for_special_folders(folder_path)
 
+                # Scan and group files, compare with the scan manifest
+                scan_plan = self._plan_scan(folder_path, incremental, scan_id)
+
                 # Create assets from file groups
-                created_assets = self._create_assets_from_groups(
-                    file_groups, folder_path, progress_callback
+                created_assets = list(
+                    self._run_scan_plan(
+                        folder_path,
+                        scan_plan,
+                        progress_callback,
+                        parallel_thumbnails,
+                        cancel_token,
+                    )
                 )
 
-                # Create file with unpaired files
-                self._create_unpair_files_json(folder_path, *file_groups)
-
                 # Combine special folders with created assets
                 all_assets = special_folders + created_assets
 
@@ -460,6 +559,341 @@ class AssetRepository:
                 logger.error(f"Unexpected error while scanning folder {folder_path}: {e}")
                 return []
 
+    def iter_assets(
+        self,
+        folder_path: str,
+        progress_callback=None,
+        parallel_thumbnails=False,
+        concurrent=False,
+        cancel_token=None,
+    ):
+        """
+        Streams asset records of the folder as they become available
+
+        Runs an incremental scan and yields the same records as
+        find_and_create_assets followed by load_existing_assets, in order:
+        special folders, assets already up to date on disk (served from the
+        asset index), then assets (re)created by the scan as soon as each
+        .asset file is written.
+
+        Args:
+            folder_path (str): Path to the folder to scan
+            progress_callback (callable): Optional callback reporting created pairs
+            parallel_thumbnails (bool): Whether to generate thumbnails in a process pool
+            concurrent (bool): Whether to read .asset files on a thread pool
+            cancel_token (CancellationToken): Optional token stopping the scan
+                (completed pairs are checkpointed, as in find_and_create_assets)
+
+        Yields:
+            dict: Asset or special folder record
+        """
+        if not AssetRepository._validate_folder_path_static(folder_path):
+            logger.error(f"Invalid folder path: {folder_path}")
+            return
+        with measure_operation(
+            "scanner.iter_assets",
+            {
+                "folder_path": folder_path,
+                "parallel_thumbnails": parallel_thumbnails,
+                "concurrent": concurrent,
+            },
+        ):
+            try:
+                logger.info(f"Streaming assets from: {folder_path}")
+
+                # Jak w find_and_create_assets - aktualny listing folderu
+                get_folder_snapshot(folder_path, refresh=True)
+
+                yield from self._scan_for_special_folders(folder_path)
+
+                scan_plan = self._plan_scan(folder_path, incremental=True)
+                names_to_process = scan_plan["names_to_process"]
+
+                # Assets of pairs being (re)created are replaced by the new records
+                outdated_assets = {}
+                for asset_data in self._load_asset_files(folder_path, None, concurrent):
+                    name_lower = str(asset_data.get("name", "")).lower()
+                    if name_lower in names_to_process:
+                        outdated_assets[name_lower] = asset_data
+                    else:
+                        yield asset_data
+
+                created_count = 0
+                with closing(
+                    self._run_scan_plan(
+                        folder_path,
+                        scan_plan,
+                        progress_callback,
+                        parallel_thumbnails,
+                        cancel_token,
+                    )
+                ) as created_assets:
+                    for asset_data in created_assets:
+                        created_count += 1
+                        outdated_assets.pop(
+                            str(asset_data.get("name", "")).lower(), None
+                        )
+                        yield asset_data
+
+                # Pairs that failed (or were not reached) keep their previous record
+                yield from outdated_assets.values()
+
+                logger.info(
+                    f"Streaming scan completed. Created {created_count} assets."
+                )
+
+            except PermissionError as e:
+                logger.error(f"Permission denied while scanning folder {folder_path}: {e}")
+            except OSError as e:
+                logger.error(f"System error while scanning folder {folder_path}: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error while scanning folder {folder_path}: {e}")
+
+    def _plan_scan(
+        self, folder_path: str, incremental: bool, scan_id: str | None = None
+    ) -> dict:
+        """Groups files of the folder and decides which pairs need processing
+
+        Returns:
+            dict: file_groups, textures_in_archive, fingerprints,
+                previous_manifest, names_to_process, thumbnail_check,
+                incremental flag and checkpoint (id and start of the scan)
+        """
+        file_groups = self._scan_and_group_files(folder_path)
+
+        # Texture folders are the same for every asset in the folder
+        textures_in_archive = self._check_texture_folders_presence(folder_path)
+
+        # Fingerprints (name, size, mtime) of every paired file
+        archive_by_name, image_by_name, common_names = file_groups
+        fingerprints = self._get_pair_fingerprints(
+            common_names, archive_by_name, image_by_name
+        )
+
+        previous_manifest = self._load_scan_manifest(folder_path)
+        if incremental and previous_manifest is not None:
+            names_to_process = self._get_changed_pairs(
+                folder_path, fingerprints, textures_in_archive, previous_manifest
+            )
+        else:
+            names_to_process = set(common_names)
+        self.scan_stats["pairs"] += len(common_names)
+        self.scan_stats["to_process"] += len(names_to_process)
+
+        return {
+            "file_groups": file_groups,
+            "textures_in_archive": textures_in_archive,
+            "fingerprints": fingerprints,
+            "previous_manifest": previous_manifest,
+            "names_to_process": names_to_process,
+            "thumbnail_check": self._check_thumbnails(
+                folder_path, names_to_process, image_by_name
+            ),
+            "incremental": incremental,
+            "checkpoint": {"id": scan_id or uuid.uuid4().hex, "started": time.time()},
+        }
+
+    def _check_thumbnails(
+        self, folder_path: str, names: set, image_by_name: dict
+    ) -> dict:
+        """Validates existing thumbnails in bulk against recorded source fingerprints
+
+        The preview size and mtime recorded in .asset ("thumbnail_source") are
+        compared with the folder snapshot, and thumbnail presence with its
+        .cache listing, so no file is stat'ed per thumbnail. Thumbnails made
+        with another size or other levels are stale. Records come from
+        the asset index; names without a current index record or without a
+        recorded source are left to the generator's own check.
+
+        Returns:
+            dict: "current" - name -> thumbnail file name to reuse as is,
+                "stale" - names whose thumbnails must be regenerated
+        """
+        current = {}
+        stale = set()
+        thumbnail_check = {"current": current, "stale": stale}
+        if not names:
+            return thumbnail_check
+
+        try:
+            snapshot = get_folder_snapshot(folder_path)
+        except OSError as e:
+            logger.debug(f"Cannot list folder for thumbnail check {folder_path}: {e}")
+            return thumbnail_check
+        indexed = self._load_asset_index(folder_path)
+        levels = list(get_thumbnail_levels())
+        thumbnail_size = get_thumbnail_size()
+
+        for name in names:
+            asset_file_name = f"{name}.asset"
+            entry = snapshot.assets.get(asset_file_name)
+            record = indexed.get(asset_file_name)
+            if entry is None or not self._is_index_record_current(record, entry):
+                continue
+            asset_data = record[2]
+            source = asset_data.get("thumbnail_source")
+            if not source:
+                continue
+
+            preview_name = os.path.basename(image_by_name[name])
+            preview = snapshot.previews.get(preview_name)
+            if preview is None:
+                continue
+            thumbnail = asset_data.get("thumbnail")
+            if (
+                asset_data.get("preview") == preview_name
+                and list(source) == [preview.size, preview.mtime_ns]
+                and thumbnail in snapshot.cache_thumbs
+                and asset_data.get("thumbnail_levels") == levels
+                and asset_data.get("thumbnail_size") == thumbnail_size
+            ):
+                current[name] = thumbnail
+            else:
+                stale.add(name)
+
+        if stale and not snapshot.cache_exists:
+            # Forced generation does not create the .cache folder itself
+            try:
+                os.makedirs(os.path.join(folder_path, CACHE_DIR_NAME), exist_ok=True)
+            except OSError as e:
+                self._handle_error("creating .cache folder", e, folder_path)
+                stale.clear()
+
+        logger.debug(
+            f"Thumbnail check: {len(current)} current, {len(stale)} stale, "
+            f"{len(names) - len(current) - len(stale)} unchecked: {folder_path}"
+        )
+        return thumbnail_check
+
+    def _run_scan_plan(
+        self,
+        folder_path: str,
+        scan_plan: dict,
+        progress_callback=None,
+        parallel_thumbnails=False,
+        cancel_token=None,
+    ):
+        """Creates the assets of a scan plan, yielding each one once it is written
+
+        Completed pairs are checkpointed in the scan manifest every
+        SCAN_CHECKPOINT_INTERVAL seconds and when the scan stops early
+        (cancellation, error or closed generator), so an interrupted scan
+        resumes where it stopped instead of starting over.
+        """
+        archive_by_name, image_by_name, _ = scan_plan["file_groups"]
+        created_assets = []
+        completed = False
+        last_checkpoint = time.monotonic()
+        try:
+            for asset_data in self._iter_assets_from_groups(
+                (archive_by_name, image_by_name, scan_plan["names_to_process"]),
+                folder_path,
+                progress_callback,
+                parallel_thumbnails,
+                scan_plan["textures_in_archive"],
+                cancel_token,
+                scan_plan.get("thumbnail_check"),
+            ):
+                created_assets.append(asset_data)
+                yield asset_data
+                if time.monotonic() - last_checkpoint >= SCAN_CHECKPOINT_INTERVAL:
+                    self._save_scan_checkpoint(folder_path, scan_plan, created_assets)
+                    last_checkpoint = time.monotonic()
+            completed = not is_cancelled(cancel_token)
+        finally:
+            if completed:
+                self._complete_scan(folder_path, scan_plan, created_assets)
+            else:
+                logger.info(
+                    f"Scan stopped after {len(created_assets)} assets, "
+                    f"checkpoint saved: {folder_path}"
+                )
+                self._save_scan_checkpoint(folder_path, scan_plan, created_assets)
+
+    def _save_scan_checkpoint(
+        self, folder_path: str, scan_plan: dict, created_assets: list
+    ) -> None:
+        """Records pairs completed so far in the scan manifest"""
+        # unpair_files.json is written only when the scan completes
+        self._save_scan_manifest(
+            folder_path,
+            scan_plan["fingerprints"],
+            created_assets,
+            scan_plan["names_to_process"],
+            scan_plan["textures_in_archive"],
+            None,
+            scan_plan["checkpoint"],
+        )
+        if created_assets:
+            invalidate_folder_snapshot(folder_path)
+
+    def _complete_scan(
+        self, folder_path: str, scan_plan: dict, created_assets: list
+    ) -> None:
+        """Writes unpair_files.json and the scan manifest after assets were created"""
+        file_groups = scan_plan["file_groups"]
+        previous_manifest = scan_plan["previous_manifest"]
+
+        # Create file with unpaired files (only when it changed)
+        unpaired = self._get_unpaired_names(file_groups)
+        unpaired_changed = (
+            not scan_plan["incremental"]
+            or previous_manifest is None
+            or previous_manifest.get("unpaired") != unpaired
+            or not os.path.exists(os.path.join(folder_path, UNPAIR_FILES_NAME))
+        )
+        if unpaired_changed:
+            self._create_unpair_files_json(folder_path, *file_groups)
+
+        self._publish_thumbnails(folder_path, bool(scan_plan["names_to_process"]))
+
+        # Written .asset/.thumb files make the folder snapshot stale
+        if scan_plan["names_to_process"] or unpaired_changed:
+            invalidate_folder_snapshot(folder_path)
+
+        # Record what was processed so the next scan can skip it
+        self._save_scan_manifest(
+            folder_path,
+            scan_plan["fingerprints"],
+            created_assets,
+            scan_plan["names_to_process"],
+            scan_plan["textures_in_archive"],
+            unpaired,
+            previous_manifest=previous_manifest,
+        )
+
+        # A completed scan makes a marker of a stopped rebuild obsolete
+        if previous_manifest is None or previous_manifest.get("checkpoint"):
+            self._remove_rebuild_checkpoint(folder_path)
+
+    @staticmethod
+    def _remove_rebuild_checkpoint(folder_path: str) -> None:
+        try:
+            os.remove(os.path.join(folder_path, CACHE_DIR_NAME, REBUILD_CHECKPOINT_NAME))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove rebuild checkpoint in {folder_path}: {e}")
+
+    def _publish_thumbnails(self, folder_path: str, changed: bool) -> None:
+        """Updates the thumbnail atlas and the local thumbnail store (if enabled)
+
+        Args:
+            folder_path (str): Asset folder
+            changed (bool): Whether thumbnails were written; if not, only
+                stores that do not know the folder yet are updated
+        """
+        atlas_index_path = os.path.join(folder_path, CACHE_DIR_NAME, ATLAS_INDEX_NAME)
+        if is_atlas_enabled() and (changed or not os.path.exists(atlas_index_path)):
+            sync_thumbnail_atlas(folder_path)
+
+        store = get_local_thumbnail_store()
+        if store is not None and (changed or not store.is_folder_synced(folder_path)):
+            try:
+                store.sync_folder(folder_path)
+            except Exception as e:
+                self._handle_error("syncing local thumbnail store", e, folder_path)
+
     def _scan_and_group_files(self, folder_path: str) -> tuple:
         """Scans the folder and groups files by name"""
         # Scan folder for files
@@ -474,38 +908,419 @@ class AssetRepository:
         return archive_by_name, image_by_name, common_names
 
     def _create_assets_from_groups(
-        self, file_groups: tuple, folder_path: str, progress_callback=None
+        self,
+        file_groups: tuple,
+        folder_path: str,
+        progress_callback=None,
+        parallel_thumbnails=False,
+        textures_in_archive=None,
     ) -> list:
         """Creates assets from grouped files"""
+        return list(
+            self._iter_assets_from_groups(
+                file_groups,
+                folder_path,
+                progress_callback,
+                parallel_thumbnails,
+                textures_in_archive,
+            )
+        )
+
+    def _iter_assets_from_groups(
+        self,
+        file_groups: tuple,
+        folder_path: str,
+        progress_callback=None,
+        parallel_thumbnails=False,
+        textures_in_archive=None,
+        cancel_token=None,
+        thumbnail_check=None,
+    ):
+        """Creates assets from grouped files, yielding each one once it is written
+
+        Args:
+            thumbnail_check: Optional result of _check_thumbnails; current
+                thumbnails are reused without calling the generator, stale
+                ones are regenerated without per-file checks
+        """
         archive_by_name, image_by_name, common_names = file_groups
 
         if not common_names:
-            return []
+            return
 
-        created_assets = []
-        total_assets = len(common_names)
+        current_thumbnails = thumbnail_check["current"] if thumbnail_check else {}
+        stale_thumbnails = thumbnail_check["stale"] if thumbnail_check else set()
+
+        # Thumbnails validated in bulk - only the .asset files are written
+        for name in sorted(common_names & current_thumbnails.keys()):
+            if is_cancelled(cancel_token):
+                return
+            self.thumbnail_stats["thumbnails"] += 1
+            asset_data = self._create_single_asset(
+                name,
+                archive_by_name[name],
+                image_by_name[name],
+                folder_path,
+                current_thumbnails[name],
+                textures_in_archive,
+            )
+            if asset_data:
+                yield asset_data
+
+        names = sorted(common_names - current_thumbnails.keys())
+        if is_cancelled(cancel_token):
+            # Pula procesów nie sprawdza tokenu przed pierwszą gotową parą
+            logger.info(f"Scan cancelled, {len(names)} pairs left: {folder_path}")
+            return
+        if parallel_thumbnails and len(names) > 1:
+            finished_names = set()
+            try:
+                for name, asset_data in self._iter_assets_parallel(
+                    names,
+                    archive_by_name,
+                    image_by_name,
+                    folder_path,
+                    progress_callback,
+                    textures_in_archive,
+                    cancel_token,
+                    stale_thumbnails,
+                ):
+                    finished_names.add(name)
+                    if asset_data:
+                        yield asset_data
+                return
+            except (OSError, RuntimeError) as e:
+                # Process pool unavailable (e.g. restricted environment) or broken
+                # mid-scan (BrokenProcessPool is a RuntimeError) - fall back
+                logger.warning(f"Parallel thumbnails unavailable, using serial mode: {e}")
+                names = [name for name in names if name not in finished_names]
+
+        total_assets = len(names)
+
+        for i, name in enumerate(names):
+            if is_cancelled(cancel_token):
+                logger.info(f"Scan cancelled, {total_assets - i} pairs left: {folder_path}")
+                return
 
-        for i, name in enumerate(common_names):
             if progress_callback:
                 progress_callback(i + 1, total_assets, f"Creating asset: {name}")
 
-            archive_path = archive_by_name[name]
             image_path = image_by_name[name]
-
-            # Create asset
+            thumbnail = self._generate_thumbnail_for_image(
+                image_path, name in stale_thumbnails
+            )
             asset_data = self._create_single_asset(
-                name, archive_path, image_path, folder_path
+                name,
+                archive_by_name[name],
+                image_path,
+                folder_path,
+                thumbnail,
+                textures_in_archive,
             )
 
             if asset_data:
-                created_assets.append(asset_data)
                 logger.debug(f"Created asset: {name}")
+                yield asset_data
+
+    def _iter_assets_parallel(
+        self,
+        names: list,
+        archive_by_name: dict,
+        image_by_name: dict,
+        folder_path: str,
+        progress_callback=None,
+        textures_in_archive=None,
+        cancel_token=None,
+        stale_names=frozenset(),
+    ):
+        """Generates thumbnails in a process pool and writes each .asset once
+
+        On cancellation pending thumbnails are dropped; thumbnails already
+        being generated are finished and their .asset files written.
+
+        Args:
+            names: Sorted list of paired names (lowercase)
+            archive_by_name: Dictionary of archive files by name
+            image_by_name: Dictionary of image files by name
+            folder_path: Path to target folder
+            progress_callback: Optional callback reporting completed pairs
+            textures_in_archive: Texture folder check result for the folder
+            cancel_token: Optional CancellationToken
+            stale_names: Names whose thumbnails are regenerated without checks
+
+        Yields:
+            tuple: (name, asset data or None) in completion order
+        """
+        total_assets = len(names)
+        max_workers = min(os.cpu_count() or 1, MAX_THUMBNAIL_PROCESSES, total_assets)
+        logger.info(
+            f"Generating {total_assets} thumbnails in {max_workers} processes"
+        )
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    generate_thumbnail, image_by_name[name], name in stale_names
+                ): name
+                for name in names
+            }
+            try:
+                yield from self._iter_completed_thumbnails(
+                    futures,
+                    archive_by_name,
+                    image_by_name,
+                    folder_path,
+                    progress_callback,
+                    textures_in_archive,
+                    cancel_token,
+                )
+            finally:
+                # Closed generator or error - do not wait for pending thumbnails
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _iter_completed_thumbnails(
+        self,
+        futures: dict,
+        archive_by_name: dict,
+        image_by_name: dict,
+        folder_path: str,
+        progress_callback=None,
+        textures_in_archive=None,
+        cancel_token=None,
+    ):
+        """Writes .asset files for thumbnail futures in completion order"""
+        total_assets = len(futures)
+        cancel_requested = False
+        for done, future in enumerate(as_completed(futures), start=1):
+            name = futures[future]
+            if future.cancelled():
+                continue
+
+            try:
+                thumbnail = self._extract_thumbnail_name(future.result())
+            except BrokenExecutor:
+                # Pula procesów padła - pozostałe pary generuje tryb szeregowy
+                raise
+            except Exception as e:
+                self._handle_error("thumbnail creation", e, image_by_name[name])
+                thumbnail = None
+
+            asset_data = self._create_single_asset(
+                name,
+                archive_by_name[name],
+                image_by_name[name],
+                folder_path,
+                thumbnail,
+                textures_in_archive,
+            )
+            if asset_data:
+                logger.debug(f"Created asset: {name}")
+
+            if progress_callback:
+                progress_callback(done, total_assets, f"Creating asset: {name}")
+
+            yield name, asset_data
+
+            if not cancel_requested and is_cancelled(cancel_token):
+                cancel_requested = True
+                logger.info("Scan cancelled, finishing thumbnails in progress")
+                for pending in futures:
+                    pending.cancel()
+
+    def _generate_thumbnail_for_image(
+        self, image_path: str, force: bool = False
+    ) -> str | None:
+        """Generates a thumbnail in the current process and returns its file name"""
+        # A forced (known stale) thumbnail comes from a listed preview
+        if not image_path or (not force and not os.path.exists(image_path)):
+            logger.error(f"Image file does not exist: {image_path}")
+            return None
+        try:
+            return self._extract_thumbnail_name(generate_thumbnail(image_path, force))
+        except Exception as e:
+            return self._handle_error("thumbnail creation", e, image_path)
+
+    def _extract_thumbnail_name(self, result) -> str | None:
+        """Extracts the thumbnail file name from a generate_thumbnail result"""
+        if isinstance(result, tuple) and len(result) >= 1:
+            self.thumbnail_stats["thumbnails"] += 1
+            if len(result) >= 3 and result[2]:
+                self.thumbnail_stats["reused"] += 1
+            return result[0]
+        logger.warning(f"Invalid result from generate_thumbnail: {result}")
+        return None
+
+    # ===============================================
+    # INCREMENTAL SCAN - PER-FOLDER MANIFEST
+    # ===============================================
+
+    @staticmethod
+    def _get_manifest_path(folder_path: str) -> str:
+        """Returns the path of the scan manifest for the folder"""
+        return os.path.join(folder_path, CACHE_DIR_NAME, SCAN_MANIFEST_NAME)
+
+    @staticmethod
+    def _get_thumbnail_settings() -> list:
+        """[thumbnail size, pyramid levels] the thumbnails are generated with"""
+        return [get_thumbnail_size(), list(get_thumbnail_levels())]
+
+    def _get_file_fingerprint(self, file_path: str) -> list:
+        """Returns [file name, size, mtime_ns] used to detect file changes"""
+        entry = self._get_snapshot_entry(file_path)
+        if entry is not None:
+            return [entry.name, entry.size, entry.mtime_ns]
+        stat_result = os.stat(file_path)
+        return [
+            os.path.basename(file_path),
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        ]
+
+    def _get_pair_fingerprints(
+        self, common_names: set, archive_by_name: dict, image_by_name: dict
+    ) -> dict:
+        """Builds manifest entries for all archive/preview pairs
+
+        Returns:
+            dict: name -> {"archive": fingerprint, "preview": fingerprint}
+        """
+        fingerprints = {}
+        for name in common_names:
+            try:
+                fingerprints[name] = {
+                    "archive": self._get_file_fingerprint(archive_by_name[name]),
+                    "preview": self._get_file_fingerprint(image_by_name[name]),
+                }
+            except OSError as e:
+                logger.warning(f"Cannot stat files of pair {name}: {e}")
+        return fingerprints
+
+    @staticmethod
+    def _get_unpaired_names(file_groups: tuple) -> dict:
+        """Returns sorted unpaired file names, as recorded in the manifest"""
+        archive_by_name, image_by_name, common_names = file_groups
+        return {
+            "archives": sorted(
+                os.path.basename(archive_by_name[name])
+                for name in set(archive_by_name) - common_names
+            ),
+            "images": sorted(
+                os.path.basename(image_by_name[name])
+                for name in set(image_by_name) - common_names
+            ),
+        }
+
+    def get_scan_checkpoint(self, folder_path: str) -> dict | None:
+        """Checkpoint (id, started) of a stopped scan of the folder, None if
+        the last scan completed or there is no manifest"""
+        manifest = self._load_scan_manifest(folder_path)
+        checkpoint = manifest.get("checkpoint") if manifest else None
+        return checkpoint if isinstance(checkpoint, dict) else None
+
+    def _load_scan_manifest(self, folder_path: str) -> dict | None:
+        """Loads the folder scan manifest, None if missing or incompatible"""
+        manifest_path = self._get_manifest_path(folder_path)
+        if not os.path.exists(manifest_path):
+            return None
+        manifest = load_from_file(manifest_path)
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != SCAN_MANIFEST_VERSION
+            or not isinstance(manifest.get("pairs"), dict)
+        ):
+            logger.debug(f"Ignoring invalid scan manifest: {manifest_path}")
+            return None
+        return manifest
 
-                # Create thumbnail
-                asset_file_path = os.path.join(folder_path, f"{name}.asset")
-                self.create_thumbnail_for_asset(asset_file_path, image_path)
+    def _get_changed_pairs(
+        self,
+        folder_path: str,
+        fingerprints: dict,
+        textures_in_archive: bool,
+        manifest: dict,
+    ) -> set:
+        """Compares current pairs with the manifest
 
-        return created_assets
+        Returns:
+            set: Names of added or modified pairs (or pairs whose .asset is missing)
+        """
+        if manifest.get("textures_in_archive") != textures_in_archive:
+            logger.debug("Texture folders changed - all pairs will be processed")
+            return set(fingerprints)
+        if manifest.get("thumbnails") != self._get_thumbnail_settings():
+            # Miniaturki sprawdzi _check_thumbnails (rozmiar/poziomy w .asset)
+            logger.debug("Thumbnail settings changed - all pairs will be processed")
+            return set(fingerprints)
+
+        recorded_pairs = manifest["pairs"]
+        existing_asset_files = get_folder_snapshot(folder_path).assets
+
+        changed = {
+            name
+            for name, fingerprint in fingerprints.items()
+            if recorded_pairs.get(name) != fingerprint
+            or f"{name}.asset" not in existing_asset_files
+        }
+        removed = set(recorded_pairs) - set(fingerprints)
+
+        logger.info(
+            f"Incremental scan: {len(changed)} added/modified, "
+            f"{len(removed)} removed, "
+            f"{len(fingerprints) - len(changed)} unchanged pairs"
+        )
+        return changed
+
+    def _save_scan_manifest(
+        self,
+        folder_path: str,
+        fingerprints: dict,
+        created_assets: list,
+        processed_names: set,
+        textures_in_archive: bool,
+        unpaired: dict,
+        checkpoint: dict | None = None,
+        previous_manifest: dict | None = None,
+    ) -> None:
+        """Saves the manifest of pairs that are up to date on disk
+
+        Pairs that were processed but failed (no .asset or no thumbnail) are
+        left out, so they are retried by the next scan. checkpoint (id and
+        start of the scan) is recorded only for a scan that was stopped.
+        Nothing is written when the manifest equals previous_manifest (an
+        unchanged folder is opened without writing to its share).
+        """
+        has_unpaired = bool(unpaired and (unpaired["archives"] or unpaired["images"]))
+        if not fingerprints and not has_unpaired:
+            return
+
+        created_names = {
+            asset["name"] for asset in created_assets if asset.get("thumbnail")
+        }
+        pairs = {
+            name: fingerprint
+            for name, fingerprint in fingerprints.items()
+            if name not in processed_names or name in created_names
+        }
+        manifest = {
+            "version": SCAN_MANIFEST_VERSION,
+            "textures_in_archive": textures_in_archive,
+            "thumbnails": self._get_thumbnail_settings(),
+            "pairs": pairs,
+            "unpaired": unpaired,
+            "checkpoint": checkpoint,
+        }
+        if manifest == previous_manifest:
+            logger.debug(f"Scan manifest unchanged: {folder_path}")
+            return
+
+        try:
+            os.makedirs(os.path.join(folder_path, CACHE_DIR_NAME), exist_ok=True)
+            save_to_file(
+                manifest, self._get_manifest_path(folder_path), indent=False, atomic=True
+            )
+            logger.debug(f"Saved scan manifest with {len(pairs)} pairs: {folder_path}")
+        except Exception as e:
+            self._handle_error("saving scan manifest", e, folder_path)
 
     # ===============================================
     # NOWE METODY POMOCNICZE - REFAKTORYZACJA load_existing_assets
@@ -562,26 +1377,154 @@ class AssetRepository:
             self._handle_asset_loading_errors(e, entry)
             return None
     
-    def _load_asset_files(self, folder_path: str) -> list:
+    def _load_asset_files(
+        self, folder_path: str, progress_callback=None, concurrent: bool = False
+    ) -> list:
         """Load all .asset files from folder
         
+        Records are served from the folder's asset index when the .asset
+        file size and mtime still match; only new or modified files are
+        parsed, after which the index is rewritten.
+        
         Args:
             folder_path: Path to folder containing .asset files
+            progress_callback: Optional callback (current, total, message)
+            concurrent: Whether to read the files on a bounded thread pool
             
         Returns:
-            list: List of successfully loaded asset data dictionaries
+            list: List of successfully loaded asset data dictionaries,
+                ordered by .asset file name
         """
         assets = []
+        asset_entries = get_folder_snapshot(folder_path).assets
+        indexed = self._load_asset_index(folder_path)
+        index_records = {}
+        index_changed = set(indexed) != set(asset_entries)
         
-        for entry in os.listdir(folder_path):
-            if entry.endswith(".asset"):
-                asset_file_path = os.path.join(folder_path, entry)
-                asset_data = self._load_single_asset_file(asset_file_path)
-                
-                if asset_data:
-                    assets.append(asset_data)
+        file_names = sorted(asset_entries)
+        stale_names = [
+            file_name
+            for file_name in file_names
+            if not self._is_index_record_current(
+                indexed.get(file_name), asset_entries[file_name]
+            )
+        ]
+        loaded = dict(
+            zip(
+                stale_names,
+                self._read_asset_files(
+                    [asset_entries[name].path for name in stale_names],
+                    progress_callback,
+                    concurrent,
+                ),
+            )
+        )
+        if loaded:
+            index_changed = True
+        
+        for file_name in file_names:
+            entry = asset_entries[file_name]
+            if file_name in loaded:
+                asset_data = loaded[file_name]
+            else:
+                asset_data = indexed[file_name][2]
+            
+            if asset_data:
+                assets.append(asset_data)
+                index_records[file_name] = [entry.size, entry.mtime_ns, asset_data]
+        
+        if index_changed:
+            self._save_asset_index(folder_path, index_records)
+        else:
+            logger.debug(f"Loaded {len(assets)} assets from index: {folder_path}")
+
+        # Library-wide search index (writes only changed records)
+        update_library_folder(folder_path, index_records)
         
         return assets
+
+    @staticmethod
+    def _is_index_record_current(record, entry) -> bool:
+        """Checks if an index record matches the .asset file size and mtime"""
+        return bool(record) and record[0] == entry.size and record[1] == entry.mtime_ns
+
+    def _read_asset_files(
+        self, asset_file_paths: list, progress_callback=None, concurrent: bool = False
+    ) -> list:
+        """Reads .asset files, serially or on a bounded I/O thread pool
+
+        Returns:
+            list: Loaded data (None for failed files), in the order of the paths
+        """
+        total = len(asset_file_paths)
+        if concurrent and total > 1:
+            max_workers = min(MAX_ASSET_LOAD_THREADS, total)
+            logger.debug(f"Reading {total} .asset files on {max_workers} threads")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # executor.map keeps results in input order
+                results = executor.map(self._load_single_asset_file, asset_file_paths)
+                return self._collect_loaded_assets(results, total, progress_callback)
+        results = map(self._load_single_asset_file, asset_file_paths)
+        return self._collect_loaded_assets(results, total, progress_callback)
+
+    @staticmethod
+    def _collect_loaded_assets(results, total: int, progress_callback=None) -> list:
+        """Collects loaded .asset data while reporting partial progress"""
+        loaded = []
+        for done, asset_data in enumerate(results, 1):
+            loaded.append(asset_data)
+            if progress_callback and (
+                done % ASSET_LOAD_PROGRESS_STEP == 0 or done == total
+            ):
+                progress_callback(done, total, f"Loading assets: {done}/{total}")
+        return loaded
+
+    @staticmethod
+    def _get_asset_index_path(folder_path: str) -> str:
+        """Returns the path of the asset index for the folder"""
+        return os.path.join(folder_path, CACHE_DIR_NAME, ASSET_INDEX_NAME)
+
+    def _load_asset_index(self, folder_path: str) -> dict:
+        """Loads the asset index, empty if missing or incompatible
+
+        Returns:
+            dict: .asset file name -> [size, mtime_ns, asset record]
+        """
+        index_path = self._get_asset_index_path(folder_path)
+        if not os.path.exists(index_path):
+            return {}
+        index = load_from_file(index_path)
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != ASSET_INDEX_VERSION
+            or not isinstance(index.get("assets"), dict)
+        ):
+            logger.debug(f"Ignoring invalid asset index: {index_path}")
+            return {}
+        return index["assets"]
+
+    def _save_asset_index(self, folder_path: str, index_records: dict) -> None:
+        """Saves the asset index; the .asset files remain the source of truth"""
+        newest_allowed_ns = time.time_ns() - ASSET_INDEX_RACY_WINDOW_NS
+        index = {
+            "version": ASSET_INDEX_VERSION,
+            "assets": {
+                file_name: record
+                for file_name, record in index_records.items()
+                if record[1] < newest_allowed_ns
+            },
+        }
+
+        try:
+            os.makedirs(os.path.join(folder_path, CACHE_DIR_NAME), exist_ok=True)
+            save_to_file(
+                index, self._get_asset_index_path(folder_path), indent=False, atomic=True
+            )
+            logger.debug(
+                f"Saved asset index with {len(index['assets'])} records: {folder_path}"
+            )
+        except Exception as e:
+            self._handle_error("saving asset index", e, folder_path)
     
     def _combine_with_special_folders(self, assets: list, folder_path: str) -> list:
         """Add special folders at the beginning of assets list
@@ -602,12 +1545,18 @@ class AssetRepository:
         
         return combined_assets
 
-    def load_existing_assets(self, folder_path: str) -> list:
+    def load_existing_assets(
+        self, folder_path: str, progress_callback=None, concurrent: bool = False
+    ) -> list:
         """
         Loads existing assets from the specified folder
 
         Args:
             folder_path (str): Path to the folder
+            progress_callback (callable): Optional callback function to report
+                progress of reading .asset files missing from the asset index
+            concurrent (bool): Whether to read .asset files on a bounded I/O
+                thread pool (results keep the deterministic file name order)
 
         Returns:
             list: List of dictionaries representing loaded assets
@@ -617,12 +1566,15 @@ class AssetRepository:
             logger.error(f"Invalid folder path: {folder_path}")
             return []
         with measure_operation(
-            "scanner.load_existing_assets", {"folder_path": folder_path}
+            "scanner.load_existing_assets",
+            {"folder_path": folder_path, "concurrent": concurrent},
         ):
             try:
                 logger.info(f"Loading existing assets from: {folder_path}")
 
-                assets = self._load_asset_files(folder_path)
+                assets = self._load_asset_files(
+                    folder_path, progress_callback, concurrent
+                )
 
                 # Add special folders (textures, tex, maps) AT THE BEGINNING
                 assets = self._combine_with_special_folders(assets, folder_path)
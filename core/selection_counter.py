@@ -63,6 +63,15 @@ class SelectionCounter:
             
             asset_grid_controller = self.amv_controller.asset_grid_controller
             
+            # Virtualized gallery - no tiles, selection state is in SelectionModel
+            if getattr(asset_grid_controller, "gallery_view", None) is not None:
+                selection_model = self.amv_controller.model.selection_model
+                return sum(
+                    1
+                    for asset_id in asset_grid_controller.get_displayed_asset_ids()
+                    if selection_model.is_selected(asset_id)
+                )
+            
             if not hasattr(asset_grid_controller, "asset_tiles"):
                 logger.debug("No asset_tiles found in asset_grid_controller")
                 return 0
@@ -92,6 +101,9 @@ class SelectionCounter:
             
             asset_grid_controller = self.amv_controller.asset_grid_controller
             
+            if getattr(asset_grid_controller, "gallery_view", None) is not None:
+                return len(asset_grid_controller.get_displayed_asset_ids())
+            
             if not hasattr(asset_grid_controller, "asset_tiles"):
                 logger.debug("No asset_tiles found for visible count")
                 return 0
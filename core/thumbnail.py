@@ -1,10 +1,11 @@
 import logging
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, Tuple
 
 from PIL import Image, ImageFile
 
 from core.json_utils import load_from_file
+from core.thumbnail_dedup import compute_content_fingerprint, get_dedup_registry
 
 
 # =============================================================================
@@ -24,6 +25,33 @@ from core.json_utils import load_from_file
 # AKTUALIZACJA 2025-01-07: Dodano obsługę przezroczystości
 # - Obrazy z przezroczystością zapisywane jako PNG
 # - Obrazy bez przezroczystości zapisywane jako JPEG (większa wydajność)
+#
+# AKTUALIZACJA: Szybkie dekodowanie dużych podglądów
+# - JPEG dekodowany w zmniejszonej rozdzielczości (draft, skalowanie DCT)
+# - Pozostałe formaty zmniejszane przez reduce() przed LANCZOS
+# - Oba kroki zostawiają min. DECODE_OVERSAMPLE x rozmiar miniaturki,
+#   logika przycinania _resize_to_square() bez zmian
+#
+# AKTUALIZACJA: Piramida miniaturek (THUMBNAIL_LEVELS)
+# - Z jednego dekodowania powstaje .thumb (rozmiar z config.json) oraz
+#   poziomy <nazwa>.thumb64/.thumb128; poziomem 256 jest sam plik .thumb
+# - Poziom 512 tylko gdy ustawiony w "thumbnail_levels" (ogranicza draft())
+# - Nazwy poziomów zależą od rozmiaru .thumb, więc .asset zapisuje go jako
+#   "thumbnail_size"; inny rozmiar lub poziomy = miniaturki nieaktualne
+# - Galeria wybiera najbliższy poziom zamiast skalować duży pixmap
+# - Poziomy to kolejne zmniejszenia kwadratu z _resize_to_square(),
+#   więc przycinanie od górnego lewego rogu jest zachowane
+#
+# AKTUALIZACJA: Deduplikacja miniaturek (core/thumbnail_dedup.py)
+# - Ten sam obraz w innym folderze (odcisk: rozmiar + hash próbek pliku)
+#   dostaje hardlink/kopię istniejących miniaturek zamiast dekodowania
+# - generate_thumbnail() zwraca trzeci element: czy miniaturka była użyta ponownie
+#
+# AKTUALIZACJA: Parametr force w generate_thumbnail()
+# - Skaner sprawdza aktualność miniaturek zbiorczo (rozmiar i mtime podglądu
+#   zapisane w .asset jako "thumbnail_source" + jeden listing folderu)
+# - force=True pomija exists()/mkdir()/stat() - miniaturka jest już znana
+#   jako nieaktualna, a folder .cache tworzy skaner raz na folder
 # =============================================================================
 
 # Logger dla modułu
@@ -37,18 +65,62 @@ SUPPORTED_FORMATS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".tga"}
 
 # Usunięty niepotrzebny alias LANCZOS - używany tylko raz
 
+# Szybkie dekodowanie zostawia co najmniej tyle razy większy obraz niż
+# miniaturka, żeby końcowy LANCZOS miał z czego próbkować
+DECODE_OVERSAMPLE = 2
+
+# Rozmiary poziomów piramidy miniaturek (config.json: "thumbnail_levels").
+# Poziom 512 tylko z konfiguracji - wymusza dekodowanie JPEG w co najmniej
+# 1024 px, więc duże podglądy traciłyby skalowanie DCT 1/8
+THUMBNAIL_LEVELS = (64, 128, 256)
+THUMB_EXTENSION = ".thumb"
+
+
+def get_level_thumbnail_name(name: str, level: int, base_size: int | None = None) -> str:
+    """
+    Returns the file name of a pyramid level, e.g. 'Item.thumb128'
+
+    The level of the base thumbnail size is the .thumb file itself (no
+    separate file). base_size defaults to the size of the global generator;
+    readers of existing thumbnails pass the size recorded in .asset
+    ("thumbnail_size"), which names the files until the next scan.
+    """
+    if base_size is None:
+        base_size = get_thumbnail_size()
+    if level == base_size:
+        return f"{name}{THUMB_EXTENSION}"
+    return f"{name}{THUMB_EXTENSION}{level}"
+
+
+def select_thumbnail_level(levels: Iterable[int], display_size: int) -> int | None:
+    """
+    Picks the pyramid level for the display size
+
+    Returns the smallest level not smaller than display_size (no upscaling),
+    or the largest level when all are smaller. None if there are no levels.
+    """
+    levels = sorted(levels)
+    if not levels:
+        return None
+    for level in levels:
+        if level >= display_size:
+            return level
+    return levels[-1]
+
 
 class ThumbnailGenerator:
     """Simple image thumbnail generator with transparency support"""
 
-    def __init__(self, thumbnail_size: int = 256):
+    def __init__(self, thumbnail_size: int = 256, levels: Iterable[int] = THUMBNAIL_LEVELS):
         """
         Initializes the thumbnail generator
 
         Args:
             thumbnail_size (int): Thumbnail size (default 256px)
+            levels (Iterable[int]): Sizes of the thumbnail pyramid levels
         """
         self.thumbnail_size = thumbnail_size
+        self.levels = tuple(sorted(set(levels)))
         self.cache_dir_name = ".cache"
 
     def _has_transparency(self, img: Image.Image) -> bool:
@@ -95,15 +167,20 @@ class ThumbnailGenerator:
         
         return thumbnail_path, format_name, save_kwargs
 
-    def generate_thumbnail(self, image_path: str) -> Tuple[str, int]:
+    def generate_thumbnail(
+        self, image_path: str, force: bool = False
+    ) -> Tuple[str, int, bool]:
         """
         Generates a thumbnail for an image with transparency support
 
         Args:
             image_path (str): Path to the image file
+            force (bool): Thumbnail is known to be stale and the .cache folder
+                exists - skip the per-file existence and mtime checks
 
         Returns:
-            Tuple[str, int]: (thumbnail filename, thumbnail size)
+            Tuple[str, int, bool]: (thumbnail filename, thumbnail size,
+                whether thumbnails of an identical image were reused)
 
         Raises:
             FileNotFoundError: If the file does not exist
@@ -115,7 +192,7 @@ class ThumbnailGenerator:
             raise ValueError(msg)
 
         path = Path(image_path)
-        if not path.exists():
+        if not force and not path.exists():
             raise FileNotFoundError(f"Plik nie istnieje: {image_path}")
 
         if path.suffix.lower() not in SUPPORTED_FORMATS:
@@ -123,19 +200,53 @@ class ThumbnailGenerator:
 
         # Utwórz katalog cache jeśli nie istnieje
         cache_dir = path.parent / self.cache_dir_name
-        cache_dir.mkdir(exist_ok=True)
+        if not force:
+            cache_dir.mkdir(exist_ok=True)
 
         # Sprawdź czy miniaturka już istnieje (WebP z .thumb)
         thumbnail_path = cache_dir / f"{path.stem}.thumb"
         
-        if thumbnail_path.exists() and self._is_thumbnail_current(path, thumbnail_path):
+        # Poziom równy rozmiarowi miniaturki to sam plik .thumb
+        level_paths = {
+            level: cache_dir
+            / get_level_thumbnail_name(path.stem, level, self.thumbnail_size)
+            for level in self.levels
+            if level != self.thumbnail_size
+        }
+
+        if not force and all(
+            self._is_thumbnail_current(path, p)
+            for p in (thumbnail_path, *level_paths.values())
+        ):
             msg = f"Używam istniejącej miniaturki: {thumbnail_path}"
             logger.debug(msg)
-            return thumbnail_path.name, self.thumbnail_size
+            return thumbnail_path.name, self.thumbnail_size, False
+
+        # Ten sam obraz w innym folderze - użyj jego miniaturek
+        dedup_registry = get_dedup_registry()
+        fingerprint = None
+        target_files = {THUMB_EXTENSION: str(thumbnail_path)}
+        target_files.update(
+            {f"{THUMB_EXTENSION}{level}": str(p) for level, p in level_paths.items()}
+        )
+        if dedup_registry is not None:
+            try:
+                fingerprint = compute_content_fingerprint(str(path))
+                if dedup_registry.reuse(fingerprint, self._dedup_variant(), target_files):
+                    logger.debug(f"Użyto miniaturek identycznego obrazu: {thumbnail_path}")
+                    return thumbnail_path.name, self.thumbnail_size, True
+            except Exception as e:
+                logger.debug(f"Deduplikacja miniaturki niedostępna dla {path}: {e}")
+
+        # Wszystkie poziomy piramidy z jednego dekodowania
+        largest_size = max(self.thumbnail_size, *self.levels)
 
         # Generuj miniaturkę
         try:
             with Image.open(path) as img:
+                # JPEG: dekoduj od razu w zmniejszonej rozdzielczości
+                self._draft_for_size(img, largest_size)
+
                 # Sprawdź czy obraz ma przezroczystość
                 has_alpha = self._has_transparency(img)
                 
@@ -157,24 +268,116 @@ class ThumbnailGenerator:
                         img = img.convert(target_mode)
 
                 # Przeskaluj do kwadratu
-                thumbnail = self._resize_to_square(img, self.thumbnail_size)
+                img = self._reduce_for_size(img, largest_size)
+                largest = self._resize_to_square(img, largest_size)
+                pyramid = self._build_pyramid(
+                    largest, {self.thumbnail_size, *self.levels}
+                )
 
                 # Pobierz ścieżkę i format (zawsze WebP .thumb)
                 final_thumbnail_path, format_name, save_kwargs = self._get_optimal_format_and_path(
                     thumbnail_path, has_alpha
                 )
 
+                # Pliki mogą być hardlinkami do miniaturek innego folderu -
+                # nowe pliki, zamiast nadpisywania wspólnej zawartości.
+                # Poziom o nazwie obecnego rozmiaru został po innym
+                # rozmiarze .thumb - teraz jest nim sam .thumb
+                self._unlink_thumbnail_files(
+                    final_thumbnail_path,
+                    *level_paths.values(),
+                    cache_dir / f"{path.stem}{THUMB_EXTENSION}{self.thumbnail_size}",
+                )
+
                 # Zapisz miniaturkę w formacie WebP
+                thumbnail = pyramid[self.thumbnail_size]
                 thumbnail.save(final_thumbnail_path, format_name, **save_kwargs)
 
+                # Zapisz pozostałe poziomy piramidy
+                for level, level_path in level_paths.items():
+                    pyramid[level].save(level_path, format_name, **save_kwargs)
+
+            if fingerprint is not None:
+                try:
+                    dedup_registry.register(
+                        fingerprint, self._dedup_variant(), str(cache_dir), path.stem
+                    )
+                except Exception as e:
+                    logger.debug(f"Nie zarejestrowano miniaturki {path}: {e}")
+
             logger.debug(f"Wygenerowano miniaturkę ({format_name}): {final_thumbnail_path}")
-            return final_thumbnail_path.name, self.thumbnail_size
+            return final_thumbnail_path.name, self.thumbnail_size, False
 
         except Exception as e:
             msg = f"Błąd generowania miniaturki dla {image_path}: {e}"
             logger.error(msg)
             raise
 
+    def _draft_for_size(self, img: Image.Image, size: int) -> None:
+        """
+        Configures the JPEG decoder to decode close to the target size
+
+        Uses DCT scaling (1/2, 1/4, 1/8), so most pixels of large previews
+        are never decoded. Other formats ignore draft() and are left as is.
+        """
+        if img.format != "JPEG":
+            return
+
+        width, height = img.size
+        scale = size * DECODE_OVERSAMPLE / min(width, height)
+        if scale >= 1:
+            return
+
+        # draft() chooses the largest reduction that keeps at least this size
+        requested_size = (int(width * scale) + 1, int(height * scale) + 1)
+        try:
+            img.draft(img.mode, requested_size)
+        except Exception as e:
+            logger.debug(f"Draft decode not available: {e}")
+
+    def _reduce_for_size(self, img: Image.Image, size: int) -> Image.Image:
+        """
+        Reduces large images by an integer factor before the final resample
+
+        reduce() is a fast box filter; LANCZOS then works on an image at most
+        a few times larger than the thumbnail instead of the full resolution.
+        """
+        factor = min(img.size) // (size * DECODE_OVERSAMPLE)
+        if factor < 2:
+            return img
+        try:
+            return img.reduce(factor)
+        except ValueError:
+            # Tryby nieobsługiwane przez reduce() - pełny LANCZOS
+            return img
+
+    @staticmethod
+    def _unlink_thumbnail_files(*paths: Path) -> None:
+        for thumb_path in paths:
+            try:
+                thumb_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _dedup_variant(self) -> str:
+        """Thumbnail settings - only thumbnails made with the same ones are reused"""
+        return f"{self.thumbnail_size}:{','.join(map(str, self.levels))}"
+
+    def _build_pyramid(self, largest: Image.Image, sizes: set) -> dict:
+        """
+        Builds square thumbnails of all sizes from the largest one
+
+        Each level is resampled from the next larger one, so the cost of the
+        pyramid is dominated by the largest level.
+        """
+        pyramid = {}
+        source = largest
+        for size in sorted(sizes, reverse=True):
+            if source.size != (size, size):
+                source = source.resize((size, size), Image.Resampling.LANCZOS)
+            pyramid[size] = source
+        return pyramid
+
     def _is_thumbnail_current(self, image_path: Path, thumbnail_path: Path) -> bool:
         """Checks if the thumbnail is up to date"""
         if not thumbnail_path.exists():
@@ -232,18 +435,36 @@ def get_config() -> dict: # Gets thumbnail configuration (EXTENDED)
             return {
                 "size": 256, 
                 "cache_dir_name": ".cache",
-                "fast_mode": False  # Nowa opcja
+                "fast_mode": False,  # Nowa opcja
+                "levels": THUMBNAIL_LEVELS,
+                "atlas": False,
+                "local_store": False,
+                "local_store_limit_mb": 2048,
+                "dedup": True,
+                "library_index": True,
             }
         return {
             "size": config.get("thumbnail", 256),
             "cache_dir_name": config.get("cache_dir_name", ".cache"),
             "fast_mode": config.get("fast_mode", False),  # Nowa opcja
+            "levels": tuple(config.get("thumbnail_levels", THUMBNAIL_LEVELS)),
+            "atlas": config.get("thumbnail_atlas", False),
+            "local_store": config.get("local_thumbnail_store", False),
+            "local_store_limit_mb": config.get("local_thumbnail_store_limit_mb", 2048),
+            "dedup": config.get("thumbnail_dedup", True),
+            "library_index": config.get("library_index", True),
         }
     except Exception:
         return {
             "size": 256, 
             "cache_dir_name": ".cache",
-            "fast_mode": False
+            "fast_mode": False,
+            "levels": THUMBNAIL_LEVELS,
+            "atlas": False,
+            "local_store": False,
+            "local_store_limit_mb": 2048,
+            "dedup": True,
+            "library_index": True,
         }
 
 
@@ -256,19 +477,31 @@ def get_generator() -> ThumbnailGenerator:
     global _generator
     if _generator is None:
         config = get_config()
-        _generator = ThumbnailGenerator(config["size"])
+        _generator = ThumbnailGenerator(config["size"], config["levels"])
     return _generator
 
 
-def generate_thumbnail(image_path: str) -> Tuple[str, int]:
+def get_thumbnail_levels() -> Tuple[int, ...]:
+    """Gets the pyramid levels produced by the global generator"""
+    return get_generator().levels
+
+
+def get_thumbnail_size() -> int:
+    """Gets the size of the .thumb file of the global generator"""
+    return get_generator().thumbnail_size
+
+
+def generate_thumbnail(image_path: str, force: bool = False) -> Tuple[str, int, bool]:
     """
     Main function for generating thumbnails
 
     Args:
         image_path (str): Path to the image file
+        force (bool): Regenerate without checking the existing thumbnail
 
     Returns:
-        Tuple[str, int]: (thumbnail filename, thumbnail size)
+        Tuple[str, int, bool]: (thumbnail filename, thumbnail size,
+            whether thumbnails of an identical image were reused)
     """
     generator = get_generator()
-    return generator.generate_thumbnail(image_path)
+    return generator.generate_thumbnail(image_path, force)
@@ -0,0 +1,433 @@
+"""
+ThumbnailAtlas - Packed per-folder thumbnail store.
+
+All thumbnails of a folder (.thumb files and pyramid levels) are packed
+into a single .cache/thumbs.atlas file with an offset table kept in
+.cache/thumbs.atlas.json. The atlas is memory-mapped and thumbnails are
+returned as memoryview slices of the mapping (no copy on the Python side;
+the Qt decoder copies each one into its QByteArray), so opening a folder
+with thousands of assets on a network share costs one open instead of one
+per thumbnail.
+
+The store is optional (config.json: "thumbnail_atlas"). Loose files stay
+the source of truth: code writing thumbnails calls sync_thumbnail_atlas()
+afterwards, which appends new or changed files, drops removed ones and
+compacts the atlas when too much of it is dead space. The atlas therefore
+doubles the space thumbnails take in .cache - it trades share space for
+fewer file opens.
+"""
+
+import logging
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from core.folder_snapshot import CACHE_DIR_NAME, THUMB_EXTENSION
+from core.json_utils import load_from_file, make_temp_file, save_to_file
+
+logger = logging.getLogger(__name__)
+
+ATLAS_FILE_NAME = "thumbs.atlas"
+ATLAS_INDEX_NAME = "thumbs.atlas.json"
+ATLAS_INDEX_VERSION = 1
+ATLAS_MAGIC = b"CFABATL1"
+
+# Atlas is compacted when dead (replaced/removed) bytes exceed this fraction
+ATLAS_COMPACT_RATIO = 0.5
+
+# Index of an opened atlas is re-read when changed on disk, checked at most
+# this often (seconds) - e.g. after the headless indexer updated the folder
+ATLAS_RECHECK_INTERVAL = 30.0
+
+# Maximum number of opened (memory-mapped) atlases
+ATLAS_CACHE_SIZE = 64
+
+
+def is_thumbnail_file_name(file_name: str) -> bool:
+    """Checks for .thumb files and pyramid levels (.thumb64, .thumb128, ...)"""
+    _, ext = os.path.splitext(file_name.lower())
+    return ext == THUMB_EXTENSION or (
+        ext.startswith(THUMB_EXTENSION) and ext[len(THUMB_EXTENSION):].isdigit()
+    )
+
+
+class ThumbnailAtlas:
+    """Memory-mapped pack of the thumbnails of one .cache folder"""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.atlas_path = os.path.join(cache_dir, ATLAS_FILE_NAME)
+        self.index_path = os.path.join(cache_dir, ATLAS_INDEX_NAME)
+        # name -> [offset, length, source size, source mtime_ns]
+        self._entries: Dict[str, list] = {}
+        self._data_size = len(ATLAS_MAGIC)
+        self._dead_bytes = 0
+        self._index_mtime_ns = None
+        self._checked_at = 0.0
+        self._mmap: Optional[mmap.mmap] = None
+        self._lock = threading.RLock()
+        self._load_index()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def names(self) -> list:
+        with self._lock:
+            return list(self._entries)
+
+    def exists(self) -> bool:
+        return self._index_mtime_ns is not None
+
+    def get(self, name: str) -> Optional[memoryview]:
+        """Returns the thumbnail bytes as a slice of the mapped atlas (no copy)"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return None
+            data = self._get_mapping()
+            if data is None:
+                return None
+            offset, length = entry[0], entry[1]
+            if offset + length > len(data):
+                logger.warning(f"Atlas entry out of range: {name} in {self.atlas_path}")
+                return None
+            return memoryview(data)[offset:offset + length]
+
+    def sync(self, files: Dict[str, os.DirEntry]) -> bool:
+        """
+        Updates the atlas to match loose thumbnail files
+
+        Args:
+            files: Thumbnail file name -> DirEntry of the file in the .cache folder
+
+        Returns:
+            bool: True if the atlas was changed
+        """
+        with self._lock:
+            self._reload_if_changed(force=True)
+            if not os.path.exists(self.atlas_path):
+                # Index without data (atlas file removed) - pack everything again
+                self._entries = {}
+                self._dead_bytes = 0
+            removed = [name for name in self._entries if name not in files]
+            changed = {}
+            for name, entry in files.items():
+                try:
+                    stat_result = entry.stat()
+                except OSError as e:
+                    logger.debug(f"Cannot stat {entry.path}: {e}")
+                    continue
+                fingerprint = [stat_result.st_size, stat_result.st_mtime_ns]
+                current = self._entries.get(name)
+                if current is None or current[2:] != fingerprint:
+                    changed[name] = (entry.path, fingerprint)
+
+            if not removed and not changed and (self.exists() or not files):
+                return False
+
+            for name in removed:
+                self._dead_bytes += self._entries.pop(name)[1]
+            self._append(changed)
+
+            if self._dead_bytes > self._data_size * ATLAS_COMPACT_RATIO:
+                self.compact()
+            else:
+                self._save_index()
+            logger.debug(
+                f"Atlas synced: {self.atlas_path} | {len(changed)} added/changed, "
+                f"{len(removed)} removed, {len(self._entries)} entries"
+            )
+            return True
+
+    def compact(self) -> None:
+        """Rewrites the atlas without dead space"""
+        with self._lock:
+            entries = {}
+            data = self._get_mapping()
+            if data is None:
+                return
+            temp_path = None
+            try:
+                fd, temp_path = make_temp_file(self.atlas_path)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(ATLAS_MAGIC)
+                    offset = len(ATLAS_MAGIC)
+                    for name, entry in sorted(
+                        self._entries.items(), key=lambda item: item[1][0]
+                    ):
+                        f.write(data[entry[0]:entry[0] + entry[1]])
+                        entries[name] = [offset, entry[1], entry[2], entry[3]]
+                        offset += entry[1]
+                # Slices handed out earlier keep the old mapping alive
+                self._mmap = None
+                os.replace(temp_path, self.atlas_path)
+            except OSError as e:
+                logger.warning(f"Cannot compact atlas {self.atlas_path}: {e}")
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+                self._save_index()
+                return
+
+            self._entries = entries
+            self._data_size = offset
+            self._dead_bytes = 0
+            self._save_index()
+            logger.debug(f"Atlas compacted: {self.atlas_path} ({offset} bytes)")
+
+    def close(self) -> None:
+        """Releases the mapping (the atlas can be removed afterwards)"""
+        with self._lock:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    # Slices still in use - mapping is released with them
+                    pass
+                self._mmap = None
+
+    def check_for_changes(self) -> None:
+        """Re-reads the index if it was changed by another process"""
+        with self._lock:
+            self._reload_if_changed()
+
+    def _append(self, changed: Dict[str, tuple]) -> None:
+        """Appends thumbnail files at the end of the valid data"""
+        if not changed and os.path.exists(self.atlas_path):
+            return
+        mode = "r+b" if os.path.exists(self.atlas_path) else "wb"
+        with open(self.atlas_path, mode) as f:
+            if mode == "wb":
+                f.write(ATLAS_MAGIC)
+                self._data_size = len(ATLAS_MAGIC)
+            # Anything after the indexed data is an interrupted append
+            f.seek(self._data_size)
+            for name, (path, fingerprint) in changed.items():
+                try:
+                    with open(path, "rb") as thumb_file:
+                        blob = thumb_file.read()
+                except OSError as e:
+                    logger.debug(f"Cannot read thumbnail {path}: {e}")
+                    continue
+                f.write(blob)
+                old_entry = self._entries.get(name)
+                if old_entry is not None:
+                    self._dead_bytes += old_entry[1]
+                self._entries[name] = [self._data_size, len(blob), *fingerprint]
+                self._data_size += len(blob)
+        # The mapping does not cover appended data
+        self._mmap = None
+
+    def _get_mapping(self) -> Optional[mmap.mmap]:
+        if self._mmap is None:
+            try:
+                with open(self.atlas_path, "rb") as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Cannot map atlas {self.atlas_path}: {e}")
+                return None
+        return self._mmap
+
+    def _load_index(self) -> None:
+        try:
+            self._index_mtime_ns = os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            self._index_mtime_ns = None
+            return
+        self._checked_at = time.monotonic()
+
+        index = load_from_file(self.index_path)
+        if (
+            not isinstance(index, dict)
+            or index.get("version") != ATLAS_INDEX_VERSION
+            or not isinstance(index.get("entries"), dict)
+        ):
+            logger.warning(f"Invalid atlas index, ignoring: {self.index_path}")
+            self._entries = {}
+            self._data_size = len(ATLAS_MAGIC)
+            self._dead_bytes = 0
+            return
+        self._entries = index["entries"]
+        self._data_size = index.get("size", len(ATLAS_MAGIC))
+        self._dead_bytes = index.get("dead", 0)
+        self._mmap = None
+
+    def _reload_if_changed(self, force: bool = False) -> None:
+        if not force and time.monotonic() - self._checked_at < ATLAS_RECHECK_INTERVAL:
+            return
+        self._checked_at = time.monotonic()
+        try:
+            mtime_ns = os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns != self._index_mtime_ns:
+            self._load_index()
+
+    def _save_index(self) -> None:
+        index = {
+            "version": ATLAS_INDEX_VERSION,
+            "size": self._data_size,
+            "dead": self._dead_bytes,
+            "entries": self._entries,
+        }
+        try:
+            save_to_file(index, self.index_path, indent=False, atomic=True)
+            self._index_mtime_ns = os.stat(self.index_path).st_mtime_ns
+        except Exception as e:
+            logger.warning(f"Cannot save atlas index {self.index_path}: {e}")
+
+
+class ThumbnailAtlasCache:
+    """Thread-safe LRU of opened atlases, keyed by .cache folder"""
+
+    def __init__(self, max_size: int = ATLAS_CACHE_SIZE):
+        self._max_size = max_size
+        self._atlases: "OrderedDict[str, ThumbnailAtlas]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _make_key(cache_dir: str) -> str:
+        return os.path.normcase(os.path.abspath(cache_dir))
+
+    def get(self, cache_dir: str) -> ThumbnailAtlas:
+        key = self._make_key(cache_dir)
+        with self._lock:
+            atlas = self._atlases.get(key)
+            if atlas is not None:
+                self._atlases.move_to_end(key)
+        if atlas is not None:
+            atlas.check_for_changes()
+            return atlas
+
+        atlas = ThumbnailAtlas(cache_dir)
+        with self._lock:
+            atlas = self._atlases.setdefault(key, atlas)
+            self._atlases.move_to_end(key)
+            while len(self._atlases) > self._max_size:
+                _, evicted = self._atlases.popitem(last=False)
+                evicted.close()
+        return atlas
+
+    def close(self, cache_dir: Optional[str] = None) -> None:
+        with self._lock:
+            if cache_dir is None:
+                atlases = list(self._atlases.values())
+                self._atlases.clear()
+            else:
+                atlas = self._atlases.pop(self._make_key(cache_dir), None)
+                atlases = [atlas] if atlas is not None else []
+        for atlas in atlases:
+            atlas.close()
+
+
+# Global atlas cache instance
+_atlas_cache = ThumbnailAtlasCache()
+
+# Config flag, read once per process
+_atlas_enabled = None
+
+
+def is_atlas_enabled() -> bool:
+    """Checks config.json "thumbnail_atlas" flag"""
+    global _atlas_enabled
+    if _atlas_enabled is None:
+        from core.thumbnail import get_config
+
+        _atlas_enabled = bool(get_config().get("atlas", False))
+    return _atlas_enabled
+
+
+def get_thumbnail_atlas(folder_path: str) -> ThumbnailAtlas:
+    """Gets the (opened) atlas of an asset folder"""
+    return _atlas_cache.get(os.path.join(folder_path, CACHE_DIR_NAME))
+
+
+def close_thumbnail_atlas(folder_path: Optional[str] = None) -> None:
+    """Unmaps the atlas of a folder (all atlases when no path is given)
+
+    Must be called before the .cache folder is removed - a mapped file
+    cannot be deleted on Windows.
+    """
+    if folder_path is None:
+        _atlas_cache.close()
+    else:
+        _atlas_cache.close(os.path.join(folder_path, CACHE_DIR_NAME))
+
+
+def sync_thumbnail_atlas(folder_path: str) -> Optional[ThumbnailAtlas]:
+    """
+    Packs the loose thumbnails of a folder into its atlas (if enabled)
+
+    Lists the .cache folder once; only new or changed files are read.
+    """
+    if not is_atlas_enabled():
+        return None
+    cache_dir = os.path.join(folder_path, CACHE_DIR_NAME)
+    try:
+        with os.scandir(cache_dir) as entries:
+            files = {
+                entry.name: entry
+                for entry in entries
+                if is_thumbnail_file_name(entry.name) and entry.is_file()
+            }
+    except OSError as e:
+        logger.debug(f"Cannot list {cache_dir}: {e}")
+        return None
+
+    atlas = get_thumbnail_atlas(folder_path)
+    try:
+        atlas.sync(files)
+    except OSError as e:
+        logger.warning(f"Cannot update thumbnail atlas {atlas.atlas_path}: {e}")
+    return atlas
+
+
+def sync_thumbnail_atlases(folder_paths: Iterable[str]) -> None:
+    for folder_path in folder_paths:
+        if folder_path:
+            sync_thumbnail_atlas(folder_path)
+
+
+def _get_atlas_for_thumbnail(thumbnail_path: str) -> Optional[ThumbnailAtlas]:
+    if not is_atlas_enabled() or not thumbnail_path:
+        return None
+    cache_dir = os.path.dirname(thumbnail_path)
+    if os.path.basename(cache_dir) != CACHE_DIR_NAME:
+        # e.g. a copy in the local thumbnail store
+        return None
+    folder_path = os.path.dirname(cache_dir)
+    atlas = get_thumbnail_atlas(folder_path)
+    return atlas if atlas.exists() else None
+
+
+def read_thumbnail_bytes(thumbnail_path: str) -> Optional[memoryview]:
+    """Reads a thumbnail from the folder atlas, None if it is not packed"""
+    atlas = _get_atlas_for_thumbnail(thumbnail_path)
+    if atlas is None:
+        return None
+    return atlas.get(os.path.basename(thumbnail_path))
+
+
+def thumbnail_exists(thumbnail_path: str) -> bool:
+    """Checks the atlas first, then the loose thumbnail file"""
+    atlas = _get_atlas_for_thumbnail(thumbnail_path)
+    if atlas is not None and os.path.basename(thumbnail_path) in atlas:
+        return True
+    return bool(thumbnail_path) and os.path.exists(thumbnail_path)
+
+
+def get_atlas_thumbnail_names(folder_path: str) -> Optional[frozenset]:
+    """Names of packed .thumb files (without pyramid levels), None without atlas"""
+    if not is_atlas_enabled():
+        return None
+    atlas = get_thumbnail_atlas(folder_path)
+    if not atlas.exists():
+        return None
+    return frozenset(
+        name for name in atlas.names() if name.lower().endswith(THUMB_EXTENSION)
+    )
@@ -1,16 +1,111 @@
 """
 ThumbnailCache - Manages in-memory thumbnail caching.
+
+The byte budget follows the available RAM (psutil, when installed): it is
+a fraction of the memory currently available, kept between a lower and an
+upper limit and re-checked every few seconds while thumbnails are added.
+Hit, miss and eviction counters are reported to the performance monitor.
+
+Below the QPixmap LRU there is a second tier with the compressed .thumb
+bytes (roughly 10-20x smaller than decoded pixmaps) under its own budget:
+thumbnails evicted from the first tier are decoded again from memory
+instead of being read over the network.
+
+Tiles keep display-ready variants in the first tier, keyed by
+(thumbnail path, display size), so showing a cached thumbnail does not
+crop or scale anything; variants of other sizes are dropped when the
+thumbnail size changes.
 """
 
 import logging
 import threading
+import time
 from collections import OrderedDict
-from typing import Optional
+from typing import Optional, Union
 
 from PyQt6.QtGui import QPixmap
 
+try:
+    import psutil
+
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Share of the currently available RAM used by the cache
+MEMORY_BUDGET_FRACTION = 0.15
+MIN_CACHE_SIZE_MB = 64
+
+# How often (seconds) the budget is recomputed from the available RAM
+BUDGET_CHECK_INTERVAL = 5.0
+
+# Budget of the compressed tier
+COMPRESSED_CACHE_SIZE_MB = 256
+
+
+def get_pixmap_size_bytes(pixmap: QPixmap) -> int:
+    """Memory used by a pixmap, computed without copying its pixels"""
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class CompressedThumbnailCache:
+    """Second cache tier: compressed thumbnail file contents (LRU, thread-safe)"""
+
+    def __init__(self, max_size_mb: int = COMPRESSED_CACHE_SIZE_MB):
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+        self.current_size_bytes = 0
+        self.cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str) -> Optional[bytes]:
+        with self._cache_lock:
+            data = self.cache.get(path)
+            if data is not None:
+                self.cache.move_to_end(path)
+                self.hits += 1
+                return data
+            self.misses += 1
+            return None
+
+    def put(self, path: str, data: Union[bytes, memoryview]):
+        size = len(data)
+        if size > self.max_size_bytes // 4:
+            return  # Not a thumbnail - would push out everything else
+        data = bytes(data)  # memoryview of the atlas must not be kept
+        with self._cache_lock:
+            previous = self.cache.pop(path, None)
+            if previous is not None:
+                self.current_size_bytes -= len(previous)
+            while self.cache and self.current_size_bytes + size > self.max_size_bytes:
+                _, oldest = self.cache.popitem(last=False)
+                self.current_size_bytes -= len(oldest)
+                self.evictions += 1
+            self.cache[path] = data
+            self.current_size_bytes += size
+
+    def get_stats(self) -> dict:
+        with self._cache_lock:
+            lookups = self.hits + self.misses
+            return {
+                "items": len(self.cache),
+                "size_mb": round(self.current_size_bytes / (1024 * 1024), 1),
+                "budget_mb": round(self.max_size_bytes / (1024 * 1024), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._cache_lock:
+            self.cache.clear()
+            self.current_size_bytes = 0
+
 
 class ThumbnailCache:
     """
@@ -32,81 +127,208 @@ class ThumbnailCache:
         Initializes the cache.
 
         Args:
-            max_size_mb (int): Maximum cache size in megabytes.
+            max_size_mb (int): Upper limit of the cache size in megabytes;
+                the actual budget may be lower when little RAM is available.
         """
         if not hasattr(self, "_initialized"):  # Prevents re-initialization
-            self.max_size_bytes = max_size_mb * 1024 * 1024
+            self.max_limit_bytes = max_size_mb * 1024 * 1024
             self.max_single_item_size = 50 * 1024 * 1024  # 50MB max per item
             self.current_size_bytes = 0
             self.cache = OrderedDict()
+            self.sizes = {}  # path -> size in bytes
+            self._cache_lock = threading.RLock()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            # Display variants are counted separately - a tile tries the
+            # variant first and falls back to the base pixmap
+            self.variant_hits = 0
+            self.variant_misses = 0
+            self._budget_checked_at = 0.0
+            self.max_size_bytes = self.max_limit_bytes
+            self.compressed = CompressedThumbnailCache()
+            self._update_budget(force=True)
+            self._register_stats()
             self._initialized = True
-            logger.info(f"ThumbnailCache initialized with limit {max_size_mb} MB.")
+            logger.info(
+                f"ThumbnailCache initialized with budget "
+                f"{self.max_size_bytes / (1024*1024):.0f} MB (limit {max_size_mb} MB)."
+            )
 
-    def get(self, path: str) -> Optional[QPixmap]:
+    def get(self, path) -> Optional[QPixmap]:
         """
         Retrieves QPixmap from cache.
 
         Args:
-            path (str): Key (thumbnail path).
+            path: Key (thumbnail path or (path, display size) variant key).
 
         Returns:
             Optional[QPixmap]: Returns QPixmap if exists, otherwise None.
         """
-        if path in self.cache:
+        with self._cache_lock:
+            pixmap = self._lookup(path)
+            if pixmap is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return pixmap
+
+    def _lookup(self, key) -> Optional[QPixmap]:
+        """LRU lookup without statistics (caller holds the lock)."""
+        pixmap = self.cache.get(key)
+        if pixmap is not None:
             # Move element to end to mark as recently used (LRU)
-            self.cache.move_to_end(path)
-            logger.debug(f"Cache HIT for: {path}")
-            return self.cache[path]
-        logger.debug(f"Cache MISS for: {path}")
-        return None
+            self.cache.move_to_end(key)
+        return pixmap
 
-    def put(self, path: str, pixmap: QPixmap):
+    def put(self, path, pixmap: QPixmap):
         """
         Adds QPixmap to cache.
 
         Args:
-            path (str): Key (thumbnail path).
+            path: Key (thumbnail path or (path, display size) variant key).
             pixmap (QPixmap): Thumbnail to cache.
         """
-        if path in self.cache:
-            return  # Already in cache
+        pixmap_size = get_pixmap_size_bytes(pixmap)
 
-        pixmap_size = pixmap.toImage().sizeInBytes()
-        
         # Check if single item is too large
         if pixmap_size > self.max_single_item_size:
             logger.warning(f"Pixmap too large for cache: {pixmap_size / (1024*1024):.1f} MB > {self.max_single_item_size / (1024*1024):.1f} MB")
             return
 
-        # Check if there is enough space
-        while self.current_size_bytes + pixmap_size > self.max_size_bytes:
-            self._evict_oldest()
+        with self._cache_lock:
+            if path in self.cache:
+                return  # Already in cache
+
+            self._update_budget()
+
+            # Check if there is enough space
+            while self.cache and self.current_size_bytes + pixmap_size > self.max_size_bytes:
+                self._evict_oldest()
 
-        # Add new item
-        self.cache[path] = pixmap
-        self.current_size_bytes += pixmap_size
-        logger.debug(
-            f"Added to cache: {path} ({pixmap_size / 1024:.1f} KB)."
-            f" Current cache size: {self.current_size_bytes / (1024*1024):.1f} MB"
-        )
+            # Add new item
+            self.cache[path] = pixmap
+            self.sizes[path] = pixmap_size
+            self.current_size_bytes += pixmap_size
 
     def _evict_oldest(self):
-        """Removes the oldest item from the cache (LRU)."""
+        """Removes the oldest item from the cache (LRU, caller holds the lock)."""
         if not self.cache:
             return
 
-        oldest_path, oldest_pixmap = self.cache.popitem(last=False)
-        pixmap_size = oldest_pixmap.toImage().sizeInBytes()
-        self.current_size_bytes -= pixmap_size
-        logger.debug(
-            f"Removed from cache (LRU): {oldest_path}."
-            f" Current cache size: {self.current_size_bytes / (1024*1024):.1f} MB"
-        )
+        oldest_path, _ = self.cache.popitem(last=False)
+        self.current_size_bytes -= self.sizes.pop(oldest_path, 0)
+        self.evictions += 1
+
+    def _update_budget(self, force: bool = False):
+        """Recomputes the byte budget from the available RAM (caller holds the lock)."""
+        now = time.monotonic()
+        if not force and now - self._budget_checked_at < BUDGET_CHECK_INTERVAL:
+            return
+        self._budget_checked_at = now
+        if not PSUTIL_AVAILABLE:
+            return
+
+        try:
+            available = psutil.virtual_memory().available
+        except Exception as e:
+            logger.debug(f"Could not get available memory: {e}")
+            return
+
+        # Memory already held by the cache can be reused by it
+        budget = int((available + self.current_size_bytes) * MEMORY_BUDGET_FRACTION)
+        # The floor applies to low RAM, never above the configured limit
+        budget = min(max(budget, MIN_CACHE_SIZE_MB * 1024 * 1024), self.max_limit_bytes)
+        if budget != self.max_size_bytes:
+            logger.debug(
+                f"ThumbnailCache budget: {budget / (1024*1024):.0f} MB "
+                f"(available RAM: {available / (1024*1024):.0f} MB)"
+            )
+            self.max_size_bytes = budget
+            while self.cache and self.current_size_bytes > self.max_size_bytes:
+                self._evict_oldest()
+
+    def get_variant(self, path: str, size: int) -> Optional[QPixmap]:
+        """Display-ready pixmap of a thumbnail at the given square size."""
+        with self._cache_lock:
+            pixmap = self._lookup((path, size))
+            if pixmap is not None:
+                self.variant_hits += 1
+            else:
+                self.variant_misses += 1
+            return pixmap
+
+    def put_variant(self, path: str, size: int, pixmap: QPixmap):
+        """Stores a display-ready (cropped and scaled) pixmap of a thumbnail."""
+        self.put((path, size), pixmap)
+
+    def invalidate_variants(self, keep_size: Optional[int] = None):
+        """Drops display variants of other sizes (e.g. after the size slider moved)."""
+        with self._cache_lock:
+            stale_keys = [
+                key
+                for key in self.cache
+                if isinstance(key, tuple) and key[1] != keep_size
+            ]
+            for key in stale_keys:
+                del self.cache[key]
+                self.current_size_bytes -= self.sizes.pop(key, 0)
+        if stale_keys:
+            logger.debug(f"Dropped {len(stale_keys)} thumbnail variants (size {keep_size})")
+
+    def get_compressed(self, path: str) -> Optional[bytes]:
+        """Compressed thumbnail bytes from the second tier (thread-safe)."""
+        return self.compressed.get(path)
+
+    def put_compressed(self, path: str, data: Union[bytes, memoryview]):
+        """Stores compressed thumbnail bytes in the second tier (thread-safe)."""
+        self.compressed.put(path, data)
+
+    def get_stats(self) -> dict:
+        """Returns statistics of both tiers (sizes, budget, hit/miss/eviction counters;
+        display variants have their own hit/miss counters)."""
+        with self._cache_lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "items": len(self.cache),
+                "size_mb": round(self.current_size_bytes / (1024 * 1024), 1),
+                "budget_mb": round(self.max_size_bytes / (1024 * 1024), 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+            variant_lookups = self.variant_hits + self.variant_misses
+            stats["variants"] = {
+                "hits": self.variant_hits,
+                "misses": self.variant_misses,
+                "hit_ratio": (
+                    round(self.variant_hits / variant_lookups, 3)
+                    if variant_lookups
+                    else 0.0
+                ),
+            }
+        stats["compressed"] = self.compressed.get_stats()
+        return stats
+
+    def _register_stats(self):
+        """Reports the cache statistics with the performance metrics."""
+        try:
+            from core.performance_monitor import get_performance_monitor
+
+            get_performance_monitor().register_stats_provider(
+                "thumbnail_cache", self.get_stats
+            )
+        except Exception as e:
+            logger.debug(f"Could not register thumbnail cache statistics: {e}")
 
     def clear(self):
         """Clears the entire cache."""
-        self.cache.clear()
-        self.current_size_bytes = 0
+        with self._cache_lock:
+            self.cache.clear()
+            self.sizes.clear()
+            self.current_size_bytes = 0
+        self.compressed.clear()
         logger.info("ThumbnailCache has been cleared.")
 
 
@@ -0,0 +1,206 @@
+"""
+ThumbnailDedup - Reuse of thumbnails of identical preview images.
+
+The same preview often exists in several work folders (V1/V2 libraries,
+__duplicates__). Every generated thumbnail is registered under a fast
+content fingerprint of its source image (file size plus a hash of sampled
+blocks); when another copy of the image is thumbnailed, the registered
+thumbnail files are hardlinked (or copied, across drives) instead of
+decoding and encoding the image again.
+
+The registry is an SQLite database in the local data folder, shared by
+the gallery, the rebuild worker and the headless indexer processes.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from core.utilities import get_local_data_dir
+
+logger = logging.getLogger(__name__)
+
+DEDUP_DB_NAME = "thumbnail_dedup.db"
+
+# Size of each sampled block; files up to FINGERPRINT_SAMPLES blocks are
+# hashed whole
+FINGERPRINT_BLOCK_SIZE = 64 * 1024
+FINGERPRINT_SAMPLES = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS thumbnails (
+    fingerprint TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    cache_dir TEXT NOT NULL,
+    stem TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, variant)
+);
+CREATE INDEX IF NOT EXISTS thumbnails_files ON thumbnails (cache_dir, stem);
+"""
+
+
+def compute_content_fingerprint(file_path: str) -> str:
+    """
+    Computes a fast content fingerprint: file size + blake2b of sampled blocks
+
+    Blocks are read from the start, middle and end of the file, so the cost
+    does not depend on the image size.
+    """
+    size = os.path.getsize(file_path)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(size.to_bytes(8, "little"))
+    with open(file_path, "rb") as f:
+        if size <= FINGERPRINT_BLOCK_SIZE * FINGERPRINT_SAMPLES:
+            digest.update(f.read())
+        else:
+            last_offset = size - FINGERPRINT_BLOCK_SIZE
+            for i in range(FINGERPRINT_SAMPLES):
+                f.seek(last_offset * i // (FINGERPRINT_SAMPLES - 1))
+                digest.update(f.read(FINGERPRINT_BLOCK_SIZE))
+    return f"{size:x}-{digest.hexdigest()}"
+
+
+def link_or_copy(source_path: str, target_path: str) -> bool:
+    """Hardlinks a file, copying it when linking is not possible
+
+    Only a copy gets a new mtime (newer than the copied source image, so it
+    counts as current). A hardlink shares the inode with the thumbnail of
+    the other folder; touching it would make that folder's atlas, local
+    store copies and thumbnail checks see a changed file.
+    """
+    try:
+        if os.path.lexists(target_path):
+            os.remove(target_path)
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            # Different drive or no hardlink support (e.g. some SMB shares)
+            shutil.copyfile(source_path, target_path)
+            os.utime(target_path)
+        return True
+    except OSError as e:
+        logger.debug(f"Cannot reuse thumbnail {source_path} -> {target_path}: {e}")
+        return False
+
+
+class ThumbnailDedupRegistry:
+    """Fingerprint -> generated thumbnail files of the first copy of an image"""
+
+    def __init__(self, db_path: str):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            db_path, timeout=30, check_same_thread=False
+        )
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    def find(self, fingerprint: str, variant: str) -> Optional[tuple]:
+        """Returns (cache_dir, stem) of the registered thumbnails"""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT cache_dir, stem FROM thumbnails "
+                "WHERE fingerprint = ? AND variant = ?",
+                (fingerprint, variant),
+            ).fetchone()
+
+    def register(self, fingerprint: str, variant: str, cache_dir: str, stem: str):
+        """Registers generated thumbnail files under the fingerprint of their image
+
+        The files were rewritten, so an entry of the image they were made
+        from before (changed preview) no longer describes them.
+        """
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM thumbnails "
+                "WHERE cache_dir = ? AND stem = ? AND variant = ?",
+                (cache_dir, stem, variant),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO thumbnails VALUES (?, ?, ?, ?)",
+                (fingerprint, variant, cache_dir, stem),
+            )
+            self._connection.commit()
+
+    def forget(self, fingerprint: str, variant: str):
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM thumbnails WHERE fingerprint = ? AND variant = ?",
+                (fingerprint, variant),
+            )
+            self._connection.commit()
+
+    def reuse(
+        self, fingerprint: str, variant: str, target_files: Dict[str, str]
+    ) -> bool:
+        """
+        Links registered thumbnail files to the target paths
+
+        Args:
+            fingerprint: Content fingerprint of the source image
+            variant: Thumbnail settings the files were generated with
+            target_files: Suffix (".thumb", ".thumb64", ...) -> target path
+
+        Returns:
+            bool: True if all files were reused
+        """
+        found = self.find(fingerprint, variant)
+        if found is None:
+            return False
+        cache_dir, stem = found
+        source_files = {
+            suffix: os.path.join(cache_dir, f"{stem}{suffix}") for suffix in target_files
+        }
+        if not all(os.path.exists(path) for path in source_files.values()):
+            # Registered copy was removed - the next generated one replaces it
+            self.forget(fingerprint, variant)
+            return False
+        return all(
+            self._reuse_file(source_files[suffix], target)
+            for suffix, target in target_files.items()
+        )
+
+    @staticmethod
+    def _reuse_file(source_path: str, target_path: str) -> bool:
+        if os.path.normcase(os.path.abspath(source_path)) != os.path.normcase(
+            os.path.abspath(target_path)
+        ):
+            return link_or_copy(source_path, target_path)
+        # Same image touched without changes - the thumbnail is still valid;
+        # a file linked into other folders keeps its mtime (shared inode)
+        try:
+            if os.stat(target_path).st_nlink <= 1:
+                os.utime(target_path)
+            return True
+        except OSError:
+            return False
+
+
+# Registry instance per process
+_registry = None
+_registry_initialized = False
+_registry_lock = threading.Lock()
+
+
+def get_dedup_registry() -> Optional[ThumbnailDedupRegistry]:
+    """Gets the registry, None if "thumbnail_dedup" is disabled in config.json"""
+    global _registry, _registry_initialized
+    if _registry_initialized:
+        return _registry
+    with _registry_lock:
+        if not _registry_initialized:
+            from core.thumbnail import get_config
+
+            if get_config().get("dedup", True):
+                try:
+                    _registry = ThumbnailDedupRegistry(
+                        os.path.join(get_local_data_dir(), DEDUP_DB_NAME)
+                    )
+                except (OSError, sqlite3.Error) as e:
+                    logger.error(f"Cannot open thumbnail dedup registry: {e}")
+                    _registry = None
+            _registry_initialized = True
+    return _registry
@@ -7,13 +7,16 @@ import logging
 import os
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from core.workers.signal_batcher import SignalBatcher
+
 logger = logging.getLogger(__name__)
 
 
 class BaseWorker(QThread):
     """Base class for file operation workers."""
 
-    progress_updated = pyqtSignal(int, int, str)  # current, total, message
+    # [(current, total, message), ...] - progress steps of one time slice
+    progress_batch = pyqtSignal(list)
     finished = pyqtSignal(str)  # message
     error_occurred = pyqtSignal(str)  # error message
 
@@ -22,6 +25,18 @@ class BaseWorker(QThread):
         self.folder_path = folder_path
         self._should_stop = False
 
+        # Progress steps are delivered in batches (one event per time slice)
+        self._progress_batcher = SignalBatcher()
+        self._progress_batcher.batch_ready.connect(self.progress_batch)
+        # Steps not delivered before the end are dropped (connected first,
+        # so the button state is not overwritten after finishing)
+        self.finished.connect(self._progress_batcher.discard)
+        self.error_occurred.connect(self._progress_batcher.discard)
+
+    def report_progress(self, current: int, total: int, message: str):
+        """Reports a progress step (thread-safe, batched)"""
+        self._progress_batcher.add((current, total, message))
+
     def run(self):
         try:
             if not self.folder_path or not os.path.exists(self.folder_path):
@@ -84,7 +84,7 @@ class DuplicateFinderWorker(BaseWorker):
                 if self._should_stop:
                     break
                     
-                self.progress_updated.emit(
+                self.report_progress(
                     i, total_files, f"Calculating SHA-256: {os.path.basename(file_path)}"
                 )
                 
@@ -70,7 +70,7 @@ class FileRenamerWorker(BaseWorker):
 
             # First, pairs
             if self.files_info and self.files_info["pairs"]:
-                self.progress_updated.emit(
+                self.report_progress(
                     0, len(self.files_info["pairs"]), "Randomizing pair names..."
                 )
                 for i, (archive_file, preview_file) in enumerate(
@@ -99,7 +99,7 @@ class FileRenamerWorker(BaseWorker):
                                 f"Skipped pair (name within limits): {archive_name}"
                             )
 
-                        self.progress_updated.emit(
+                        self.report_progress(
                             i + 1,
                             len(self.files_info["pairs"]),
                             f"Randomized pair: {new_name if len(archive_name) > self.max_name_length else archive_name}",
@@ -111,7 +111,7 @@ class FileRenamerWorker(BaseWorker):
 
             # Then unpaired files
             if self.files_info and self.files_info["unpaired"]:
-                self.progress_updated.emit(
+                self.report_progress(
                     0,
                     len(self.files_info["unpaired"]),
                     "Randomizing unpaired file names...",
@@ -131,7 +131,7 @@ class FileRenamerWorker(BaseWorker):
                         else:
                             logger.debug(f"Skipped (name within limits): {filename}")
 
-                        self.progress_updated.emit(
+                        self.report_progress(
                             i + 1,
                             len(self.files_info["unpaired"]),
                             f"Processing: {filename}",
@@ -68,7 +68,7 @@ class FileShortenerWorker(BaseWorker):
 
             # First, pairs
             if self.files_info and self.files_info["pairs"]:
-                self.progress_updated.emit(
+                self.report_progress(
                     0, len(self.files_info["pairs"]), "Shortening pair names..."
                 )
                 for i, (archive_file, preview_file) in enumerate(
@@ -95,7 +95,7 @@ class FileShortenerWorker(BaseWorker):
                         else:
                             logger.debug(f"Skipped pair (name within limits): {archive_name}")
 
-                        self.progress_updated.emit(
+                        self.report_progress(
                             i + 1,
                             len(self.files_info["pairs"]),
                             f"Shortened pair: {archive_name[:20]}...",
@@ -107,7 +107,7 @@ class FileShortenerWorker(BaseWorker):
 
             # Then unpaired files
             if self.files_info and self.files_info["unpaired"]:
-                self.progress_updated.emit(
+                self.report_progress(
                     0,
                     len(self.files_info["unpaired"]),
                     "Shortening unpaired file names...",
@@ -129,7 +129,7 @@ class FileShortenerWorker(BaseWorker):
                         else:
                             logger.debug(f"Skipped (name within limits): {filename}")
 
-                        self.progress_updated.emit(
+                        self.report_progress(
                             i + 1,
                             len(self.files_info["unpaired"]),
                             f"Processing: {filename[:20]}...",
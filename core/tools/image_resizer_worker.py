@@ -47,8 +47,8 @@ class ImageResizerWorker(BaseWorker):
                     )
                     logger.debug(f"[Resize] {i+1}/{len(files_to_resize)}: {filename}")
 
-                    logger.info(f"[Resize] Emitting progress_updated for {filename}")
-                    self.progress_updated.emit(
+                    logger.info(f"[Resize] Reporting progress for {filename}")
+                    self.report_progress(
                         i, len(files_to_resize), f"Resizing: {filename}"
                     )
 
@@ -78,8 +78,8 @@ class ImageResizerWorker(BaseWorker):
             if error_count > 0:
                 message += f", {error_count} errors"
 
-            logger.info(f"[Resize] Emitting final progress_updated")
-            self.progress_updated.emit(
+            logger.info(f"[Resize] Reporting final progress")
+            self.report_progress(
                 len(files_to_resize), len(files_to_resize), "Resizing completed"
             )
             logger.info(f"[Resize] Emitting finished: {message}")
@@ -85,7 +85,7 @@ class PrefixSuffixRemoverWorker(BaseWorker):
                             f"Zmieniono: '{filename_with_ext}' -> '{new_full_filename}'"
                         )
 
-                    self.progress_updated.emit(
+                    self.report_progress(
                         i + 1,
                         len(files_to_process),
                         f"Przetwarzanie: {filename_with_ext}",
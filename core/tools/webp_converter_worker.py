@@ -46,8 +46,8 @@ class WebPConverterWorker(BaseWorker):
                         f"[WebP] {i+1}/{len(files_to_convert)}: {original_path} -> {webp_path}"
                     )
 
-                    logger.info(f"[WebP] Emitting progress_updated for {original_path}")
-                    self.progress_updated.emit(
+                    logger.info(f"[WebP] Reporting progress for {original_path}")
+                    self.report_progress(
                         i,
                         len(files_to_convert),
                         f"Converting: {os.path.basename(original_path)}",
@@ -103,8 +103,8 @@ class WebPConverterWorker(BaseWorker):
             if error_count > 0:
                 message += f", {error_count} errors"
 
-            logger.info(f"[WebP] Emitting final progress_updated")
-            self.progress_updated.emit(
+            logger.info(f"[WebP] Reporting final progress")
+            self.report_progress(
                 len(files_to_convert), len(files_to_convert), "Conversion completed"
             )
             logger.info(f"[WebP] Emitting finished: {message}")
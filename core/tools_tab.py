@@ -23,6 +23,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from core.folder_snapshot import get_folder_snapshot, invalidate_folder_snapshot
 from core.workers.asset_rebuilder_worker import AssetRebuilderWorker
 from core.workers.worker_manager import WorkerManager
 # thumbnail_cache imported w utilities.clear_thumbnail_cache_after_rebuild()
@@ -93,8 +94,9 @@ class ToolsTab(QWidget):
             button.setText(f"{original_text}...")
 
             # Connect signals
-            worker.progress_updated.connect(
-                lambda c, t, m: self._handle_worker_progress(button, c, t, m)
+            # Progress arrives in batches - only the latest step is shown
+            worker.progress_batch.connect(
+                lambda batch: self._handle_worker_progress(button, *batch[-1])
             )
             worker.finished.connect(
                 lambda m: self._handle_worker_finished(button, m, original_text)
@@ -281,18 +283,10 @@ class ToolsTab(QWidget):
                 ".webp",
             }
 
-            # Scan files
-            archive_files = []
-            preview_files = []
-
-            for item in os.listdir(directory_path):
-                item_path = os.path.join(directory_path, item)
-                if os.path.isfile(item_path):
-                    file_ext = os.path.splitext(item)[1].lower()
-                    if file_ext in archive_extensions:
-                        archive_files.append(item)
-                    elif file_ext in preview_extensions:
-                        preview_files.append(item)
+            # Scan files (shared folder snapshot, listed once per refresh)
+            snapshot = get_folder_snapshot(directory_path)
+            archive_files = snapshot.files_with_extensions(archive_extensions)
+            preview_files = snapshot.files_with_extensions(preview_extensions)
 
             # Sort files alphabetically
             archive_files.sort(key=str.lower)
@@ -390,6 +384,10 @@ class ToolsTab(QWidget):
     def _handle_worker_finished(
         self, button: QPushButton, message: str, original_text: str
     ):
+        # Tools change files in the working folder - drop its snapshot
+        if self.current_working_directory:
+            invalidate_folder_snapshot(self.current_working_directory)
+
         # CATEGORICAL CLEARING OF RAM CACHE FOR ASSET REBUILD!!!
         if hasattr(self, "asset_rebuilder") and self.asset_rebuilder and hasattr(button, 'objectName'):
             # Check if it's the asset rebuild button
@@ -466,6 +464,10 @@ class ToolsTab(QWidget):
     def _handle_worker_error(
         self, button: QPushButton, error_message: str, original_text: str
     ):
+        # A failed tool may still have changed some files
+        if self.current_working_directory:
+            invalidate_folder_snapshot(self.current_working_directory)
+
         # CATEGORICAL CLEARING OF RAM CACHE EVEN AFTER ASSET REBUILD ERROR!!!
         if hasattr(self, "asset_rebuilder") and self.asset_rebuilder and hasattr(button, 'objectName'):
             # Check if it's the asset rebuild button
@@ -797,9 +799,9 @@ class ToolsTab(QWidget):
             )
 
             # Połącz sygnały
-            self.remove_worker.progress_updated.connect(
-                lambda c, t, m: self._handle_worker_progress(
-                    self.remove_button, c, t, m
+            self.remove_worker.progress_batch.connect(
+                lambda batch: self._handle_worker_progress(
+                    self.remove_button, *batch[-1]
                 )
             )
             self.remove_worker.finished.connect(
@@ -854,9 +856,9 @@ class ToolsTab(QWidget):
             self.duplicate_finder = DuplicateFinderWorker(self.current_working_directory)
 
             # Połącz sygnały
-            self.duplicate_finder.progress_updated.connect(
-                lambda c, t, m: self._handle_worker_progress(
-                    self.find_duplicates_button, c, t, m
+            self.duplicate_finder.progress_batch.connect(
+                lambda batch: self._handle_worker_progress(
+                    self.find_duplicates_button, *batch[-1]
                 )
             )
             self.duplicate_finder.finished.connect(
@@ -76,3 +76,26 @@ def update_main_window_status(widget):
         
     except Exception as e:
         logger.debug(f"Exception updating main window status: {e}")
+
+
+def get_local_data_dir(*subdirs: str) -> str:
+    """
+    Zwraca (i tworzy) katalog danych aplikacji na dysku lokalnym.
+
+    Windows: %LOCALAPPDATA%/CFAB_Browser, pozostałe systemy:
+    $XDG_CACHE_HOME/cfab_browser (domyślnie ~/.cache/cfab_browser).
+
+    Args:
+        *subdirs (str): Opcjonalne podkatalogi
+
+    Returns:
+        str: Ścieżka do katalogu
+    """
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        data_dir = os.path.join(base_dir, "CFAB_Browser", *subdirs)
+    else:
+        base_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        data_dir = os.path.join(base_dir, "cfab_browser", *subdirs)
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
@@ -1,14 +1,28 @@
 """
 AssetRebuilderWorker - Worker for rebuilding assets in a folder.
 Moved from AmvController for better separation of concerns.
+
+A stopped rebuild leaves a checkpoint marker in the .cache folder; the next
+rebuild of the folder resumes from the scan checkpoint instead of removing
+the assets created so far. The marker holds the id of its scan and is
+honored only while the scan manifest still records that checkpoint, so a
+scan run in between (completed or stopped) makes the next rebuild a full one.
 """
 
 import logging
 import os
+import time
+import uuid
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
-from ..scanner import AssetRepository
+from ..cancellation import CancellationToken
+from ..folder_snapshot import CACHE_DIR_NAME, invalidate_folder_snapshot
+from ..json_utils import load_from_file, save_to_file
+from ..scanner import REBUILD_CHECKPOINT_NAME, AssetRepository
+from ..local_thumbnail_store import get_local_thumbnail_store
+from ..thumbnail_atlas import close_thumbnail_atlas
+from .signal_batcher import SignalBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +30,8 @@ logger = logging.getLogger(__name__)
 class AssetRebuilderWorker(QThread):
     """Worker for rebuilding assets in a folder"""
 
-    progress_updated = pyqtSignal(int, int, str)  # current, total, message
+    # [(current, total, message), ...] - progress steps of one time slice
+    progress_batch = pyqtSignal(list)
     finished = pyqtSignal(str)  # message
     error_occurred = pyqtSignal(str)  # error message
 
@@ -24,10 +39,21 @@ class AssetRebuilderWorker(QThread):
         super().__init__()
         self.folder_path = folder_path
         self._should_stop = False
+        self._cancel_token = CancellationToken()
+
+        # Progress steps are delivered in batches (one event per time slice)
+        self._progress_batcher = SignalBatcher()
+        self._progress_batcher.batch_ready.connect(self.progress_batch)
+        self.finished.connect(self._progress_batcher.discard)
+        self.error_occurred.connect(self._progress_batcher.discard)
+
+    def _report_progress(self, current: int, total: int, message: str):
+        self._progress_batcher.add((current, total, message))
 
     def request_stop(self):
         """Safely requests the operation to stop"""
         self._should_stop = True
+        self._cancel_token.cancel()
         self.requestInterruption()
 
     def run(self):
@@ -38,38 +64,53 @@ class AssetRebuilderWorker(QThread):
                 self.error_occurred.emit(error_msg)
                 return
 
-            logger.info(
-                "Starting asset rebuild in folder: %s", self.folder_path
-            )
+            scan_id = self._get_resumable_scan_id()
+            resume = scan_id is not None
+            if resume:
+                logger.info(
+                    "Resuming interrupted asset rebuild in folder: %s",
+                    self.folder_path,
+                )
+            else:
+                logger.info(
+                    "Starting asset rebuild in folder: %s", self.folder_path
+                )
 
-            # Step 1: Removing .asset files
-            if self._should_stop or self.isInterruptionRequested():
-                logger.debug("Rebuild was interrupted by the user")
-                return
-            self.progress_updated.emit(0, 100, "Removing old .asset files...")
-            self._remove_asset_files()
+                # Step 1: Removing .asset files
+                if self._should_stop or self.isInterruptionRequested():
+                    logger.debug("Rebuild was interrupted by the user")
+                    return
+                self._report_progress(0, 100, "Removing old .asset files...")
+                self._remove_asset_files()
 
-            # Step 2: Removing .cache folder
-            if self._should_stop or self.isInterruptionRequested():
-                logger.debug("Rebuild was interrupted by the user")
-                return
-            self.progress_updated.emit(20, 100, "Removing .cache folder...")
-            self._remove_cache_folder()
+                # Step 2: Removing .cache folder
+                if self._should_stop or self.isInterruptionRequested():
+                    logger.debug("Rebuild was interrupted by the user")
+                    return
+                self._report_progress(20, 100, "Removing .cache folder...")
+                self._remove_cache_folder()
+                invalidate_folder_snapshot(self.folder_path)
+                scan_id = uuid.uuid4().hex
+                self._write_checkpoint(scan_id)
 
             # Step 3: Running scanner.py
             if self._should_stop or self.isInterruptionRequested():
                 logger.debug("Rebuild was interrupted by the user")
                 return
-            self.progress_updated.emit(
+            self._report_progress(
                 40, 100, "Scanning and creating new assets..."
             )
-            self._run_scanner()
+            stats = self._run_scanner(incremental=resume, scan_id=scan_id)
 
             # Finish only if not stopped
             if not self._should_stop:
-                self.progress_updated.emit(100, 100, "Rebuild finished!")
+                self._remove_checkpoint()
+                self._report_progress(100, 100, "Rebuild finished!")
                 self.finished.emit(
-                    f"Successfully rebuilt assets in folder: {self.folder_path}"
+                    f"Successfully rebuilt assets in folder: {self.folder_path} "
+                    f"(thumbnails: {stats['thumbnails']}, "
+                    f"reused: {stats['reused']}, "
+                    f"dedup ratio: {stats['dedup_ratio']:.0%})"
                 )
 
         except Exception as e:
@@ -104,6 +145,12 @@ class AssetRebuilderWorker(QThread):
             import shutil
 
             cache_folder = os.path.join(self.folder_path, ".cache")
+            # A memory-mapped atlas cannot be removed on Windows
+            close_thumbnail_atlas(self.folder_path)
+            # Local copies of the old thumbnails are not valid anymore
+            store = get_local_thumbnail_store()
+            if store is not None:
+                store.forget_folder(self.folder_path)
 
             # ABSOLUTELY remove the .cache folder - its contents don't matter
             if os.path.exists(cache_folder):
@@ -116,8 +163,57 @@ class AssetRebuilderWorker(QThread):
             # Even if there's an error - continue, the cache folder must be deleted
             raise
 
-    def _run_scanner(self):
-        """Runs scanner.py in the folder"""
+    def _get_checkpoint_path(self) -> str:
+        return os.path.join(self.folder_path, CACHE_DIR_NAME, REBUILD_CHECKPOINT_NAME)
+
+    def _get_resumable_scan_id(self):
+        """Scan id of a stopped rebuild to resume, None if a full rebuild is needed
+
+        The marker is valid only if the scan manifest still records the
+        checkpoint of the rebuild's scan; otherwise it is removed.
+        """
+        checkpoint_path = self._get_checkpoint_path()
+        if not os.path.exists(checkpoint_path):
+            return None
+        marker = load_from_file(checkpoint_path)
+        scan_checkpoint = AssetRepository().get_scan_checkpoint(self.folder_path)
+        scan_id = marker.get("checkpoint") if isinstance(marker, dict) else None
+        if scan_id and scan_checkpoint and scan_checkpoint.get("id") == scan_id:
+            return scan_id
+        logger.info(f"Ignoring outdated rebuild checkpoint: {checkpoint_path}")
+        self._remove_checkpoint()
+        return None
+
+    def _write_checkpoint(self, scan_id: str):
+        """Marks the folder as being rebuilt (old assets are already removed)"""
+        try:
+            os.makedirs(os.path.join(self.folder_path, CACHE_DIR_NAME), exist_ok=True)
+            save_to_file(
+                {"folder": self.folder_path, "checkpoint": scan_id, "started": time.time()},
+                self._get_checkpoint_path(),
+                atomic=True,
+            )
+        except Exception as e:
+            logger.warning(f"Could not write rebuild checkpoint: {e}")
+
+    def _remove_checkpoint(self):
+        try:
+            os.remove(self._get_checkpoint_path())
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove rebuild checkpoint: {e}")
+
+    def _run_scanner(self, incremental: bool = False, scan_id: str = None) -> dict:
+        """Runs scanner.py in the folder
+
+        Args:
+            incremental (bool): Skip pairs completed before the rebuild was stopped
+            scan_id (str): Checkpoint id shared with the rebuild marker
+
+        Returns:
+            dict: Thumbnail statistics (thumbnails, reused, dedup_ratio)
+        """
         try:
 
             def progress_callback(current, total, message):
@@ -128,16 +224,31 @@ class AssetRebuilderWorker(QThread):
                 if total > 0:
                     # Map scanning progress to the 40-100% range
                     scanner_progress = int(40 + (current / total) * 60)
-                    self.progress_updated.emit(scanner_progress, 100, message)
+                    self._report_progress(scanner_progress, 100, message)
                 else:
-                    self.progress_updated.emit(100, 100, message)
+                    self._report_progress(100, 100, message)
 
             asset_repository = AssetRepository()
             created_assets = asset_repository.find_and_create_assets(
-                self.folder_path, progress_callback
+                self.folder_path,
+                progress_callback,
+                parallel_thumbnails=True,
+                incremental=incremental,
+                cancel_token=self._cancel_token,
+                scan_id=scan_id,
             )
             logger.debug("Scanner created %d new assets", len(created_assets))
 
+            stats = dict(asset_repository.thumbnail_stats)
+            stats["dedup_ratio"] = asset_repository.get_dedup_ratio()
+            logger.info(
+                "Rebuild thumbnails: %d, reused from identical images: %d (%.0f%%)",
+                stats["thumbnails"],
+                stats["reused"],
+                stats["dedup_ratio"] * 100,
+            )
+            return stats
+
         except Exception as e:
             logger.error(f"Error running scanner: {e}")
             raise
@@ -0,0 +1,103 @@
+"""
+AssetScanWorker - Worker streaming scan results of a folder in batches.
+Runs AssetRepository.iter_assets off the GUI thread, so the first tiles
+can be shown before the whole folder is scanned.
+"""
+
+import logging
+import time
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from ..cancellation import CancellationToken
+from ..scanner import AssetRepository
+from .signal_batcher import SignalBatcher
+
+logger = logging.getLogger(__name__)
+
+# A batch is emitted when it reaches this many records...
+SCAN_BATCH_SIZE = 100
+# ...or when this much time passed since the last batch
+SCAN_BATCH_INTERVAL = 0.05
+
+
+class AssetScanWorker(QThread):
+    """Worker scanning a folder and emitting asset records in batches"""
+
+    assets_batch_ready = pyqtSignal(list)  # batch of asset records
+    # [(current, total, message), ...] - progress steps of one time slice
+    progress_batch = pyqtSignal(list)
+    scan_finished = pyqtSignal(list, float)  # all asset records, duration
+    error_occurred = pyqtSignal(str)  # error message
+
+    def __init__(self, folder_path: str):
+        super().__init__()
+        self.folder_path = folder_path
+        self._should_stop = False
+        self._cancel_token = CancellationToken()
+
+        # Scanner steps are delivered in batches (one event per time slice)
+        self._progress_batcher = SignalBatcher()
+        self._progress_batcher.batch_ready.connect(self.progress_batch)
+        self.scan_finished.connect(self._progress_batcher.discard)
+        self.error_occurred.connect(self._progress_batcher.discard)
+
+    def request_stop(self):
+        """Safely requests the scan to stop"""
+        self._should_stop = True
+        self._cancel_token.cancel()
+        self.requestInterruption()
+
+    def is_stopped(self) -> bool:
+        return self._should_stop or self.isInterruptionRequested()
+
+    def run(self):
+        """Streams assets of the folder in batches"""
+        start_time = time.time()
+        all_assets = []
+        batch = []
+        last_emit = time.monotonic()
+
+        try:
+            asset_repository = AssetRepository()
+            assets = asset_repository.iter_assets(
+                self.folder_path,
+                self._report_progress,
+                parallel_thumbnails=True,
+                concurrent=True,
+                cancel_token=self._cancel_token,
+            )
+            try:
+                for asset_data in assets:
+                    if self.is_stopped():
+                        logger.debug(f"Scan stopped: {self.folder_path}")
+                        return
+                    all_assets.append(asset_data)
+                    batch.append(asset_data)
+                    now = time.monotonic()
+                    if (
+                        len(batch) >= SCAN_BATCH_SIZE
+                        or now - last_emit >= SCAN_BATCH_INTERVAL
+                    ):
+                        self.assets_batch_ready.emit(batch)
+                        batch = []
+                        last_emit = now
+            finally:
+                assets.close()
+
+            if self.is_stopped():
+                # Zatrzymany przed pierwszym rekordem - to nie jest pusty folder
+                logger.debug(f"Scan stopped: {self.folder_path}")
+                return
+            if batch:
+                self.assets_batch_ready.emit(batch)
+            self.scan_finished.emit(all_assets, time.time() - start_time)
+
+        except Exception as e:
+            error_msg = f"Error during scan: {e}"
+            logger.error(error_msg)
+            self.error_occurred.emit(error_msg)
+
+    def _report_progress(self, current: int, total: int, message: str):
+        if not self.is_stopped():
+            self._progress_batcher.add((current, total, message))
@@ -0,0 +1,68 @@
+"""
+SignalBatcher - Coalesces worker results into one signal per time slice.
+
+Workers call add() from any thread for every result or progress step; the
+batcher emits batch_ready(list) with everything collected during the last
+time slice (16 ms by default, about one frame). Only the first item of a
+slice posts an event to the batcher's thread, so a folder with thousands of
+assets produces tens of events instead of tens of thousands.
+
+The batcher must be created in the thread that consumes the batches
+(usually the GUI thread, e.g. in the worker's __init__).
+"""
+
+import logging
+import threading
+from typing import Any, List
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+
+logger = logging.getLogger(__name__)
+
+# One batch per frame at 60 Hz
+DEFAULT_BATCH_INTERVAL_MS = 16
+
+
+class SignalBatcher(QObject):
+    """Collects items from any thread and emits them as lists per time slice"""
+
+    batch_ready = pyqtSignal(list)  # items collected during one time slice
+
+    # Posted from the adding thread when a new slice starts
+    _slice_started = pyqtSignal()
+
+    def __init__(self, interval_ms: int = DEFAULT_BATCH_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._items: List[Any] = []
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._slice_started.connect(self._start_slice)
+
+    def add(self, item: Any) -> None:
+        """Adds an item to the current batch (thread-safe)"""
+        with self._lock:
+            self._items.append(item)
+            first_in_slice = len(self._items) == 1
+        if first_in_slice:
+            self._slice_started.emit()
+
+    @pyqtSlot()
+    def _start_slice(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @pyqtSlot()
+    def flush(self) -> None:
+        """Emits the collected items now (from the calling thread)"""
+        with self._lock:
+            items, self._items = self._items, []
+        if items:
+            self.batch_ready.emit(items)
+
+    def discard(self, *_args) -> None:
+        """Drops items not delivered yet (e.g. progress after the worker finished)"""
+        with self._lock:
+            self._items = []
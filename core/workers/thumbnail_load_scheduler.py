@@ -0,0 +1,216 @@
+"""
+ThumbnailLoadScheduler - Viewport-priority queue for thumbnail loading.
+
+Tiles request their thumbnails here instead of starting a worker directly.
+Only a few ThumbnailLoaderWorkers per pool thread are started at a time;
+the rest wait in a queue ordered by the tile position relative to the
+gallery viewport:
+
+- visible tiles first,
+- then tiles up to one screen above or below the viewport,
+- then everything else (hidden tiles last).
+
+The order is recomputed when the gallery scrolls or its layout changes, so
+scrolling to the bottom of a large folder loads the tiles on screen next
+instead of every thumbnail above them. Tiles returned to AssetTilePool
+cancel their pending request.
+
+Requesters that are not widgets inside the scroll area (cells of the
+virtualized gallery) provide get_load_priority() instead.
+
+Workers deliver decoded QImages through a SignalBatcher; each batch is
+converted to QPixmaps and handed to the tiles in one pass on the GUI thread.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+from PyQt6.QtCore import QObject, QPoint, QThreadPool, QTimer
+from PyQt6.QtGui import QPixmap
+
+from core.workers.signal_batcher import SignalBatcher
+from core.workers.thumbnail_loader_worker import ThumbnailLoaderWorker
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_VISIBLE = 0
+PRIORITY_NEAR = 1  # within one screen above or below the viewport
+PRIORITY_BACKGROUND = 2
+PRIORITY_HIDDEN = 3
+
+# Workers started ahead per pool thread - results arrive in batches, so a
+# thread must not idle until its previous result is delivered
+WORKERS_PER_THREAD = 4
+
+
+class ThumbnailLoadScheduler(QObject):
+    """Starts thumbnail loads in viewport priority order on a shared QThreadPool"""
+
+    def __init__(self, thread_pool: QThreadPool = None, parent=None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool()
+        self._scroll_area = None
+
+        # tile -> (requested path, display size, request sequence number)
+        self._pending: Dict[object, tuple] = {}
+        # (path, display size) -> tiles waiting for the running worker; the
+        # same path at another size (level switch after zooming) is its own load
+        self._running: Dict[Tuple[str, int], List[object]] = {}
+        self._sequence = 0
+
+        # Pending tiles sorted by priority; rebuilt when marked dirty
+        self._order: List[object] = []
+        self._order_position = 0
+        self._order_dirty = False
+
+        # Coalesces requests/scroll events into one dispatch per event loop pass
+        self._dispatch_timer = QTimer(self)
+        self._dispatch_timer.setSingleShot(True)
+        self._dispatch_timer.timeout.connect(self._dispatch)
+
+        # Finished loads (path, size, image, error message) delivered per time slice
+        self._result_batcher = SignalBatcher(parent=self)
+        self._result_batcher.batch_ready.connect(self._deliver_results)
+
+    def set_scroll_area(self, scroll_area) -> None:
+        """Sets the gallery scroll area used to prioritise visible tiles"""
+        if self._scroll_area is scroll_area:
+            return
+        self._scroll_area = scroll_area
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.reprioritize)
+        scroll_bar.rangeChanged.connect(self.reprioritize)
+
+    def request(self, tile, path: str, display_size: int = 0) -> None:
+        """Queues loading of a thumbnail for a tile (replaces its previous request)
+
+        Args:
+            tile: Tile with _on_thumbnail_loaded/_on_thumbnail_error callbacks
+            path: Thumbnail path
+            display_size: Side of the square the thumbnail is decoded to (0 - natural)
+        """
+        self.cancel(tile)
+        self._sequence += 1
+        self._pending[tile] = (path, display_size, self._sequence)
+        self._order_dirty = True
+        self._schedule_dispatch()
+
+    def cancel(self, tile) -> None:
+        """Drops the pending request of a tile; a running load is not delivered to it"""
+        if self._pending.pop(tile, None) is not None:
+            return
+        for tiles in self._running.values():
+            if tile in tiles:
+                tiles.remove(tile)
+                return
+
+    def reprioritize(self, *_args) -> None:
+        """Recomputes the queue order (after scrolling or a layout change)"""
+        if self._pending:
+            self._order_dirty = True
+            self._schedule_dispatch()
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def _schedule_dispatch(self) -> None:
+        if not self._dispatch_timer.isActive():
+            # Zero delay - runs after the pending layout requests are processed
+            self._dispatch_timer.start(0)
+
+    def _dispatch(self) -> None:
+        """Starts workers for the highest-priority requests while threads are free"""
+        free_slots = (
+            self.thread_pool.maxThreadCount() * WORKERS_PER_THREAD
+            - len(self._running)
+        )
+        if free_slots <= 0 or not self._pending:
+            return
+        if self._order_dirty:
+            self._rebuild_order()
+
+        while free_slots > 0 and self._order_position < len(self._order):
+            tile = self._order[self._order_position]
+            self._order_position += 1
+            request = self._pending.pop(tile, None)
+            if request is None:
+                continue  # cancelled or re-requested since the order was built
+            path, display_size = request[0], request[1]
+            key = (path, display_size)
+            if key in self._running:
+                self._running[key].append(tile)
+                continue
+            self._running[key] = [tile]
+            self._start_worker(path, display_size)
+            free_slots -= 1
+
+    def _rebuild_order(self) -> None:
+        viewport_height = self._get_viewport_height()
+        self._order = sorted(
+            self._pending,
+            key=lambda tile: (
+                self._get_priority(tile, viewport_height),
+                self._pending[tile][2],
+            ),
+        )
+        self._order_position = 0
+        self._order_dirty = False
+
+    def _get_viewport_height(self) -> int:
+        if self._scroll_area is None:
+            return 0
+        return self._scroll_area.viewport().height()
+
+    def _get_priority(self, tile, viewport_height: int) -> int:
+        """Priority class of a tile from its position relative to the viewport"""
+        get_load_priority = getattr(tile, "get_load_priority", None)
+        if get_load_priority is not None:
+            return get_load_priority()
+        try:
+            if not tile.isVisible():
+                return PRIORITY_HIDDEN
+            if self._scroll_area is None or viewport_height <= 0:
+                return PRIORITY_VISIBLE
+            top = tile.mapTo(self._scroll_area.viewport(), QPoint(0, 0)).y()
+        except (RuntimeError, AttributeError):
+            # Widget deleted or not inside the gallery
+            return PRIORITY_HIDDEN
+        bottom = top + tile.height()
+        if bottom >= 0 and top <= viewport_height:
+            return PRIORITY_VISIBLE
+        if bottom >= -viewport_height and top <= 2 * viewport_height:
+            return PRIORITY_NEAR
+        return PRIORITY_BACKGROUND
+
+    def _start_worker(self, path: str, display_size: int) -> None:
+        worker = ThumbnailLoaderWorker(path, display_size, self._result_batcher)
+        self.thread_pool.start(worker)
+
+    def _deliver_results(self, results: list) -> None:
+        """Converts a batch of images to pixmaps and hands them to the tiles"""
+        for path, display_size, image, error_message in results:
+            tiles = self._running.pop((path, display_size), [])
+            if not tiles:
+                continue  # All requesting tiles were cancelled
+            pixmap = QPixmap.fromImage(image) if image is not None else None
+            for tile in tiles:
+                try:
+                    if pixmap is not None:
+                        tile._on_thumbnail_loaded(path, pixmap)
+                    else:
+                        tile._on_thumbnail_error(path, error_message)
+                except RuntimeError:
+                    pass  # Tile widget already deleted
+        self._schedule_dispatch()
+
+
+# Global scheduler instance (created on first use, after QApplication)
+_scheduler = None
+
+
+def get_thumbnail_load_scheduler() -> ThumbnailLoadScheduler:
+    """Gets the global thumbnail load scheduler"""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = ThumbnailLoadScheduler()
+    return _scheduler
@@ -1,19 +1,47 @@
 """
 ThumbnailLoaderWorker - Asynchronous thumbnail loading.
+
+The worker decodes into a QImage (QPixmap must not be created outside the
+GUI thread) with QImageReader at the size the tile displays, cropped to a
+square from the top-left corner; only the QImage -> QPixmap conversion is
+left to the GUI thread.
+
+The compressed thumbnail bytes are taken from (and added to) the second
+tier of the thumbnail cache, so a recently shown folder is decoded from
+memory instead of being read from disk again. Thumbnails packed in a folder
+atlas are decoded straight from the mapped slice and not added to that
+tier (the mapping already keeps them in memory); PyQt6 has no
+QByteArray.fromRawData, so the decoder's QByteArray is the only copy.
+
+With a result batcher the worker adds (path, target size, image, error
+message) to it instead of emitting its own signals, so finished loads reach the GUI thread
+in batches.
 """
 
 import logging
 import os
 
-from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QIODevice,
+    QObject,
+    QRect,
+    QRunnable,
+    QSize,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QImage, QImageReader
+
+from core.thumbnail_atlas import read_thumbnail_bytes
+from core.thumbnail_cache import thumbnail_cache
 
 logger = logging.getLogger(__name__)
 
 
 class ThumbnailLoaderSignals(QObject):
     """Signals for thumbnail loading worker."""
-    finished = pyqtSignal(str, QPixmap)  # path, pixmap
+    finished = pyqtSignal(str, QImage)  # path, image
     error = pyqtSignal(str, str)  # path, error_message
 
 
@@ -23,26 +51,72 @@ class ThumbnailLoaderWorker(QRunnable):
     Uses QThreadPool for better thread management.
     """
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, target_size: int = 0, result_batcher=None):
         super().__init__()
         self.path = path
+        self.target_size = target_size  # 0 - natural size
+        self.result_batcher = result_batcher
         self.signals = ThumbnailLoaderSignals()
 
     def run(self):
         """Loads thumbnail from disk."""
         try:
-            if not os.path.exists(self.path):
-                raise FileNotFoundError(f"Thumbnail file does not exist: {self.path}")
-
-            pixmap = QPixmap(self.path)
+            data = thumbnail_cache.get_compressed(self.path)
+            if data is None:
+                # Packed thumbnail - slice of the memory-mapped folder atlas
+                data = read_thumbnail_bytes(self.path)
+            if data is None:
+                data = self._read_thumbnail_file()
+                thumbnail_cache.put_compressed(self.path, data)
 
-            if pixmap.isNull():
-                raise IOError(f"Cannot load QPixmap from file: {self.path}")
+            buffer = QBuffer()
+            buffer.setData(QByteArray(data))
+            buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+            image = self._read_image(QImageReader(buffer))
 
-            self.signals.finished.emit(self.path, pixmap)
+            if self.result_batcher is not None:
+                self.result_batcher.add((self.path, self.target_size, image, None))
+            else:
+                self.signals.finished.emit(self.path, image)
             logger.debug(f"Successfully loaded thumbnail: {self.path}")
 
         except Exception as e:
             error_msg = f"Error loading thumbnail {self.path}: {e}"
             logger.error(error_msg)
-            self.signals.error.emit(self.path, error_msg)
+            if self.result_batcher is not None:
+                self.result_batcher.add((self.path, self.target_size, None, error_msg))
+            else:
+                self.signals.error.emit(self.path, error_msg)
+
+    def _read_thumbnail_file(self) -> bytes:
+        """Reads the compressed thumbnail from its file"""
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Thumbnail file does not exist: {self.path}")
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def _read_image(self, reader: QImageReader) -> QImage:
+        """Decodes a top-left square at the target size"""
+        size = reader.size()
+        if size.isValid():
+            side = min(size.width(), size.height())
+            if size.width() != size.height():
+                # Szeroki - od lewej, wysoki - od góry
+                reader.setClipRect(QRect(0, 0, side, side))
+            if self.target_size > 0 and side != self.target_size:
+                reader.setScaledSize(QSize(self.target_size, self.target_size))
+
+        image = reader.read()
+        if image.isNull():
+            raise IOError(
+                f"Cannot read image from file: {self.path} ({reader.errorString()})"
+            )
+
+        # Format QPixmap.fromImage converts without copying pixels again
+        if image.hasAlphaChannel():
+            target_format = QImage.Format.Format_ARGB32_Premultiplied
+        else:
+            target_format = QImage.Format.Format_RGB32
+        if image.format() != target_format:
+            image = image.convertToFormat(target_format)
+        return image
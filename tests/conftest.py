@@ -0,0 +1,65 @@
+"""
+Shared fixtures of the test suite.
+
+The local data folder (dedup registry, library index, local thumbnail
+store) is redirected to a temporary folder for the whole session, so tests
+never touch the data of an installed application.
+"""
+
+import os
+import time
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_data_dir(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("local_data")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("XDG_CACHE_HOME", str(data_dir))
+        patch.setenv("LOCALAPPDATA", str(data_dir))
+        yield data_dir
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """QApplication for tests of widgets, timers and queued signals"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def wait_until(qapp):
+    """Processes Qt events until a condition is true (or the timeout passes)"""
+
+    def wait(condition, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            qapp.processEvents()
+            time.sleep(0.005)
+        return condition()
+
+    return wait
+
+
+def make_pair(folder, name: str, index: int = 0) -> None:
+    """Creates a preview image and an archive with the same name"""
+    Image.new("RGB", (64 + index, 48), (index * 10 % 255, 100, 50)).save(
+        os.path.join(folder, f"{name}.jpg")
+    )
+    with open(os.path.join(folder, f"{name}.zip"), "wb") as f:
+        f.write(b"x" * (100 * (index + 1)))
+
+
+@pytest.fixture
+def asset_folder(tmp_path):
+    """Work folder with three archive/preview pairs and one unpaired archive"""
+    folder = tmp_path / "assets"
+    folder.mkdir()
+    for index, name in enumerate(("alpha", "beta", "gamma")):
+        make_pair(folder, name, index)
+    (folder / "lonely.7z").write_bytes(b"y")
+    return str(folder)
@@ -0,0 +1,186 @@
+import pytest
+
+from core.asset_filter_index import AssetFilterIndex, sort_assets_for_display
+
+ASSETS = [
+    {"name": "Wooden Chair", "stars": 3, "color": "red"},
+    {"name": "Oak Table", "stars": 5, "color": "green"},
+    {"name": "chair_modern", "stars": 1},
+    {"name": "Lamp", "stars": "4", "color": "red"},
+    {"name": "textures", "type": "special_folder"},
+]
+
+
+@pytest.fixture
+def index():
+    return AssetFilterIndex(ASSETS)
+
+
+def get_names(index, positions):
+    return [asset["name"] for asset in index.get_assets(positions)]
+
+
+def test_display_order_puts_special_folder_first():
+    names = [a["name"] for a in sort_assets_for_display(ASSETS)]
+
+    assert names == ["textures", "chair_modern", "Lamp", "Oak Table", "Wooden Chair"]
+
+
+def test_query_without_filters_returns_all(index):
+    assert index.query() == index.all_positions
+    assert len(index) == len(ASSETS)
+
+
+def test_query_min_stars(index):
+    positions = index.query(min_stars=4)
+
+    assert get_names(index, positions) == ["textures", "Lamp", "Oak Table"]
+
+
+def test_query_color(index):
+    positions = index.query(color="red")
+
+    assert get_names(index, positions) == ["textures", "Lamp", "Wooden Chair"]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("chair", ["textures", "chair_modern", "Wooden Chair"]),
+        ("CH", ["textures", "chair_modern", "Wooden Chair"]),
+        ("  oak ", ["textures", "Oak Table"]),
+        ("sofa", ["textures"]),
+    ],
+)
+def test_query_text_is_case_insensitive_substring(index, text, expected):
+    assert get_names(index, index.query(text=text)) == expected
+
+
+def test_query_combines_filters(index):
+    positions = index.query(min_stars=2, text="chair", color="red")
+
+    assert get_names(index, positions) == ["textures", "Wooden Chair"]
+
+
+def test_text_ignores_extension():
+    index = AssetFilterIndex([{"name": "model.blend"}, {"name": "blender_kit"}])
+
+    assert get_names(index, index.query(text="blend")) == ["blender_kit"]
+    assert get_names(index, index.query(text="model")) == ["model.blend"]
+
+
+def test_update_asset_moves_buckets(index):
+    assert get_names(index, index.query(min_stars=5)) == ["textures", "Oak Table"]
+    assert get_names(index, index.query(color="red")) == [
+        "textures",
+        "Lamp",
+        "Wooden Chair",
+    ]
+
+    index.update_asset({"name": "Lamp", "stars": 5, "color": "blue"})
+
+    assert get_names(index, index.query(min_stars=5)) == [
+        "textures",
+        "Lamp",
+        "Oak Table",
+    ]
+    assert get_names(index, index.query(color="red")) == ["textures", "Wooden Chair"]
+    assert get_names(index, index.query(color="blue")) == ["textures", "Lamp"]
+
+
+def test_update_asset_ignores_unknown_and_special(index):
+    before = index.query(min_stars=1)
+
+    index.update_asset({"name": "missing", "stars": 5})
+    index.update_asset({"name": "textures", "stars": 5})
+
+    assert index.query(min_stars=1) == before
+
+
+def test_get_colors_lists_used_colors(index):
+    assert index.get_colors() == ["green", "red"]
+
+    index.update_asset({"name": "Oak Table", "stars": 5, "color": None})
+
+    assert index.get_colors() == ["red"]
+
+
+class GridController:
+    """Filter state of AssetGridController with a real filter index"""
+
+    def __init__(self, assets):
+        self.index = AssetFilterIndex(assets)
+        self.active_star_filter = 0
+        self.active_color_filter = None
+        self.shown = None
+
+    def get_filter_index(self):
+        return self.index
+
+    def set_color_filter(self, color):
+        self.active_color_filter = color
+
+    def clear_color_filter(self):
+        self.active_color_filter = None
+
+    def apply_filter_result(self, positions):
+        self.shown = get_names(self.index, positions)
+
+
+@pytest.fixture
+def control_panel(qapp):
+    from types import SimpleNamespace
+
+    from PyQt6.QtWidgets import QComboBox, QLineEdit
+
+    from core.amv_controllers.handlers.control_panel_controller import (
+        ControlPanelController,
+    )
+
+    view = SimpleNamespace(color_filter_combo=QComboBox(), text_input=QLineEdit())
+    view.color_filter_combo.addItem("Any color", None)
+    controller = SimpleNamespace(asset_grid_controller=GridController(ASSETS))
+    panel = ControlPanelController(None, view, controller)
+    view.color_filter_combo.currentIndexChanged.connect(panel.on_color_filter_changed)
+    return panel
+
+
+def get_combo_colors(panel):
+    combo = panel.view.color_filter_combo
+    return [combo.itemData(i) for i in range(combo.count())]
+
+
+def test_color_filter_control_filters_grid(control_panel):
+    grid = control_panel.controller.asset_grid_controller
+    control_panel.update_color_filter_options()
+    combo = control_panel.view.color_filter_combo
+
+    assert get_combo_colors(control_panel) == [None, "green", "red"]
+
+    combo.setCurrentIndex(combo.findData("red"))
+    assert grid.active_color_filter == "red"
+    assert grid.shown == ["textures", "Lamp", "Wooden Chair"]
+
+    combo.setCurrentIndex(0)
+    assert grid.active_color_filter is None
+    assert grid.shown == get_names(grid.index, grid.index.all_positions)
+
+
+def test_color_filter_follows_folder_colors(control_panel):
+    grid = control_panel.controller.asset_grid_controller
+    combo = control_panel.view.color_filter_combo
+    control_panel.update_color_filter_options()
+    combo.setCurrentIndex(combo.findData("green"))
+
+    # Inny folder z kolorem "green" - filtr zostaje i działa na nowej liście
+    grid.index = AssetFilterIndex([{"name": "Sofa", "color": "green"}, {"name": "Bed"}])
+    control_panel.update_color_filter_options()
+    assert combo.currentData() == "green"
+    assert grid.shown == ["Sofa"]
+
+    # Folder bez tego koloru - filtr jest czyszczony
+    grid.index = AssetFilterIndex([{"name": "Bed", "color": "red"}])
+    control_panel.update_color_filter_options()
+    assert get_combo_colors(control_panel) == [None, "red"]
+    assert combo.currentData() is None
+    assert grid.active_color_filter is None
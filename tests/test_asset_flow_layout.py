@@ -0,0 +1,100 @@
+import pytest
+from PyQt6.QtCore import QPoint, QRect, QSize
+from PyQt6.QtWidgets import QWidget
+
+from core.amv_views.asset_flow_layout import AssetFlowLayout
+
+CELL = QSize(100, 150)
+
+
+class Tile(QWidget):
+    def sizeHint(self):
+        return CELL
+
+
+@pytest.fixture
+def gallery(qapp):
+    widget = QWidget()
+    layout = AssetFlowLayout(widget)
+    layout.setContentsMargins(10, 20, 10, 20)
+    layout.setSpacing(5)
+    layout.set_columns(3)
+    yield widget, layout
+    widget.deleteLater()
+
+
+def test_cell_positions_are_row_major(gallery):
+    widget, layout = gallery
+    layout.set_widgets([Tile(widget) for _ in range(7)])
+
+    assert layout.get_cell_size() == CELL
+    assert layout.get_cell_position(0) == QPoint(10, 20)
+    assert layout.get_cell_position(2) == QPoint(220, 20)
+    assert layout.get_cell_position(4) == QPoint(115, 175)
+
+
+def test_grid_size_covers_all_rows(gallery):
+    widget, layout = gallery
+    layout.set_widgets([Tile(widget) for _ in range(7)])
+
+    # 3 kolumny x 3 wiersze + marginesy i odstępy
+    assert layout.sizeHint() == QSize(20 + 3 * 100 + 2 * 5, 40 + 3 * 150 + 2 * 5)
+
+
+def test_set_geometry_positions_tiles(gallery):
+    widget, layout = gallery
+    tiles = [Tile(widget) for _ in range(5)]
+    layout.set_widgets(tiles)
+
+    layout.setGeometry(QRect(0, 0, 400, 600))
+
+    assert tiles[4].geometry() == QRect(QPoint(115, 175), CELL)
+
+
+def test_reordering_moves_tiles(gallery):
+    widget, layout = gallery
+    tiles = [Tile(widget) for _ in range(4)]
+    layout.set_widgets(tiles)
+    layout.setGeometry(QRect(0, 0, 400, 600))
+
+    layout.set_widgets([tiles[3], tiles[1]])
+    layout.setGeometry(QRect(0, 0, 400, 600))
+
+    assert layout.count() == 2
+    assert tiles[3].geometry().topLeft() == QPoint(10, 20)
+    assert tiles[1].geometry().topLeft() == QPoint(115, 20)
+
+
+def test_cells_in_rect(gallery):
+    widget, layout = gallery
+    layout.set_widgets([Tile(widget) for _ in range(10)])
+
+    # Wiersze zaczynają się na y=20, 175, 330 i 485
+    assert layout.get_cells_in_rect(QRect(0, 200, 400, 100)) == range(3, 6)
+    assert layout.get_cells_in_rect(QRect(0, 0, 400, 400)) == range(0, 9)
+    assert layout.get_cells_in_rect(QRect(0, 490, 400, 1000)) == range(9, 10)
+
+
+def test_reserved_cells_use_expected_cell_size(gallery):
+    _, layout = gallery
+    layout.set_widgets([None] * 10)
+
+    assert layout.get_cells_in_rect(QRect(0, 0, 400, 300)) == range(0)
+
+    layout.set_cell_size(CELL)
+
+    assert layout.get_cells_in_rect(QRect(0, 0, 400, 300)) == range(0, 6)
+
+
+def test_set_widget_at_fills_reserved_cell(gallery):
+    widget, layout = gallery
+    layout.set_cell_size(CELL)
+    layout.set_widgets([None] * 4)
+    tile = Tile(widget)
+
+    layout.set_widget_at(2, tile)
+    layout.setGeometry(QRect(0, 0, 400, 600))
+
+    assert tile.geometry().topLeft() == QPoint(220, 20)
+    with pytest.raises(IndexError):
+        layout.set_widget_at(2, Tile(widget))
@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+
+import pytest
+
+from core.folder_snapshot import invalidate_folder_snapshot
+from core.json_utils import load_from_file, save_to_file
+from core.scanner import AssetRepository
+
+
+def set_mtime_in_past(path: str, seconds: int = 60) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def scanned_folder(asset_folder):
+    """Scanned folder whose .asset files are older than the racy window"""
+    AssetRepository().find_and_create_assets(asset_folder)
+    for name in os.listdir(asset_folder):
+        if name.endswith(".asset"):
+            set_mtime_in_past(os.path.join(asset_folder, name))
+    invalidate_folder_snapshot(asset_folder)
+    return asset_folder
+
+
+def get_index_path(folder: str) -> str:
+    return AssetRepository._get_asset_index_path(folder)
+
+
+def test_load_writes_asset_index(scanned_folder):
+    assets = AssetRepository().load_existing_assets(scanned_folder)
+
+    index = load_from_file(get_index_path(scanned_folder))
+    assert sorted(index["assets"]) == ["alpha.asset", "beta.asset", "gamma.asset"]
+    assert sorted(a["name"] for a in assets) == ["alpha", "beta", "gamma"]
+
+
+def test_load_serves_unchanged_records_from_index(scanned_folder, monkeypatch):
+    AssetRepository().load_existing_assets(scanned_folder)
+    invalidate_folder_snapshot(scanned_folder)
+    repository = AssetRepository()
+    read_files = []
+    monkeypatch.setattr(
+        repository, "_load_single_asset_file", lambda path: read_files.append(path)
+    )
+
+    assets = repository.load_existing_assets(scanned_folder)
+
+    assert read_files == []
+    assert sorted(a["name"] for a in assets) == ["alpha", "beta", "gamma"]
+
+
+def test_load_rereads_modified_asset_file(scanned_folder):
+    AssetRepository().load_existing_assets(scanned_folder)
+    asset_path = os.path.join(scanned_folder, "beta.asset")
+    asset_data = load_from_file(asset_path)
+    asset_data["stars"] = 5
+    save_to_file(asset_data, asset_path)
+    set_mtime_in_past(asset_path, 30)
+    invalidate_folder_snapshot(scanned_folder)
+
+    assets = AssetRepository().load_existing_assets(scanned_folder)
+
+    stars = {a["name"]: a.get("stars") for a in assets}
+    assert stars["beta"] == 5
+    index = load_from_file(get_index_path(scanned_folder))
+    assert index["assets"]["beta.asset"][2]["stars"] == 5
+
+
+def test_load_drops_removed_asset_from_index(scanned_folder):
+    AssetRepository().load_existing_assets(scanned_folder)
+    os.remove(os.path.join(scanned_folder, "alpha.asset"))
+    invalidate_folder_snapshot(scanned_folder)
+
+    assets = AssetRepository().load_existing_assets(scanned_folder)
+
+    assert sorted(a["name"] for a in assets) == ["beta", "gamma"]
+    index = load_from_file(get_index_path(scanned_folder))
+    assert "alpha.asset" not in index["assets"]
+
+
+def test_recently_modified_records_are_left_out_of_index(asset_folder):
+    AssetRepository().find_and_create_assets(asset_folder)
+    invalidate_folder_snapshot(asset_folder)
+
+    assets = AssetRepository().load_existing_assets(asset_folder)
+
+    assert len(assets) == 3
+    index = load_from_file(get_index_path(asset_folder))
+    assert index["assets"] == {}
+
+
+def test_concurrent_load_keeps_file_name_order(tmp_path, monkeypatch):
+    folder = tmp_path / "assets"
+    folder.mkdir()
+    names = [f"item{i:02d}" for i in range(24)]
+    for name in names:
+        save_to_file({"name": name}, folder / f"{name}.asset")
+    (folder / "broken.asset").write_text("{not json")
+    repository = AssetRepository()
+    load_single_asset_file = repository._load_single_asset_file
+    threads = set()
+
+    def slow_load(path):
+        threads.add(threading.get_ident())
+        # Wcześniejsze pliki kończą się później
+        name = os.path.basename(path)[: -len(".asset")]
+        if name in names:
+            time.sleep((len(names) - names.index(name)) * 0.001)
+        return load_single_asset_file(path)
+
+    monkeypatch.setattr(repository, "_load_single_asset_file", slow_load)
+    progress = []
+
+    assets = repository.load_existing_assets(
+        str(folder),
+        progress_callback=lambda done, total, message: progress.append((done, total)),
+        concurrent=True,
+    )
+
+    assert [a["name"] for a in assets] == names
+    assert len(threads) > 1
+    assert progress[-1] == (25, 25)
@@ -0,0 +1,58 @@
+import os
+
+import core.workers.asset_scan_worker as asset_scan_worker
+from core.scanner import AssetRepository
+from core.workers.asset_scan_worker import AssetScanWorker
+
+
+def get_names(assets):
+    return [a["name"] for a in assets if a.get("type") != "special_folder"]
+
+
+def test_iter_assets_streams_unchanged_records_before_created_ones(asset_folder):
+    AssetRepository().find_and_create_assets(asset_folder)
+    with open(os.path.join(asset_folder, "alpha.zip"), "ab") as f:
+        f.write(b"more data")
+
+    assets = list(AssetRepository().iter_assets(asset_folder))
+
+    assert get_names(assets) == ["beta", "gamma", "alpha"]
+
+
+def test_closed_stream_records_a_checkpoint(asset_folder):
+    repository = AssetRepository()
+    stream = repository.iter_assets(asset_folder)
+
+    first = next(stream)
+    stream.close()
+
+    assert first["name"] == "alpha"
+    assert repository.get_scan_checkpoint(asset_folder) is not None
+    manifest = repository._load_scan_manifest(asset_folder)
+    assert list(manifest["pairs"]) == ["alpha"]
+
+
+def test_worker_emits_records_in_batches(asset_folder, qapp, monkeypatch):
+    monkeypatch.setattr(asset_scan_worker, "SCAN_BATCH_SIZE", 2)
+    worker = AssetScanWorker(asset_folder)
+    batches, finished = [], []
+    worker.assets_batch_ready.connect(batches.append)
+    worker.scan_finished.connect(lambda assets, duration: finished.append(assets))
+
+    worker.run()
+
+    assert all(len(batch) <= 2 for batch in batches)
+    assert [a for batch in batches for a in batch] == finished[0]
+    assert sorted(get_names(finished[0])) == ["alpha", "beta", "gamma"]
+
+
+def test_stopped_worker_does_not_finish(asset_folder, qapp):
+    worker = AssetScanWorker(asset_folder)
+    finished = []
+    worker.scan_finished.connect(lambda assets, duration: finished.append(assets))
+
+    worker.request_stop()
+    worker.run()
+
+    assert finished == []
+    assert not os.path.exists(os.path.join(asset_folder, "alpha.asset"))
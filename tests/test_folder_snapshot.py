@@ -0,0 +1,77 @@
+import os
+
+import core.folder_snapshot as folder_snapshot
+from core.folder_snapshot import FolderSnapshot, FolderSnapshotCache
+
+
+def make_folder(tmp_path):
+    folder = tmp_path / "assets"
+    folder.mkdir()
+    for name in ("a.ZIP", "a.jpg", "a.asset", "b.7z", "notes.txt"):
+        (folder / name).write_bytes(b"data")
+    (folder / "Textures").mkdir()
+    (folder / "other").mkdir()
+    cache_dir = folder / ".cache"
+    cache_dir.mkdir()
+    (cache_dir / "a.thumb").write_bytes(b"t")
+    (cache_dir / "a.thumb64").write_bytes(b"t")
+    return str(folder)
+
+
+def test_snapshot_categorises_folder_in_one_listing(tmp_path):
+    folder = make_folder(tmp_path)
+
+    snapshot = FolderSnapshot(folder)
+
+    assert sorted(snapshot.archives) == ["a.ZIP", "b.7z"]
+    assert list(snapshot.previews) == ["a.jpg"]
+    assert list(snapshot.assets) == ["a.asset"]
+    assert sorted(snapshot.subfolders) == [".cache", "Textures", "other"]
+    assert snapshot.special_folders == ["Textures"]
+    assert snapshot.cache_exists
+    assert snapshot.cache_thumbs == {"a.thumb"}
+    assert "notes.txt" in snapshot.file_names
+    entry = snapshot.get_file_entry("a.jpg")
+    assert entry.path == os.path.join(folder, "a.jpg")
+    assert (entry.size, entry.mtime_ns) == (4, os.stat(entry.path).st_mtime_ns)
+    assert snapshot.files_with_extensions([".zip"]) == ["a.ZIP"]
+
+
+def test_cached_snapshot_is_reused_until_invalidated(tmp_path):
+    folder = make_folder(tmp_path)
+    cache = FolderSnapshotCache()
+    snapshot = cache.get(folder)
+    (tmp_path / "assets" / "c.zip").write_bytes(b"data")
+
+    assert cache.get(folder) is snapshot
+    assert "c.zip" in cache.get(folder, refresh=True).archives
+
+    (tmp_path / "assets" / "d.zip").write_bytes(b"data")
+    cache.invalidate(folder)
+    assert "d.zip" in cache.get(folder).archives
+
+
+def test_expired_snapshot_is_listed_again(tmp_path, monkeypatch):
+    folder = make_folder(tmp_path)
+    cache = FolderSnapshotCache()
+    snapshot = cache.get(folder)
+
+    monkeypatch.setattr(folder_snapshot, "SNAPSHOT_TTL", -1.0)
+
+    assert cache.get(folder) is not snapshot
+
+
+def test_least_recently_used_snapshot_is_dropped(tmp_path):
+    folders = []
+    for name in ("a", "b", "c"):
+        (tmp_path / name).mkdir()
+        folders.append(str(tmp_path / name))
+    cache = FolderSnapshotCache(max_size=2)
+    first = cache.get(folders[0])
+    second = cache.get(folders[1])
+    cache.get(folders[0])
+
+    cache.get(folders[2])
+
+    assert cache.get(folders[0]) is first
+    assert cache.get(folders[1]) is not second
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import QObject, QRect, QSize, QTimer
+from PyQt6.QtWidgets import QStackedLayout, QWidget
+
+import core.amv_controllers.handlers.asset_grid_controller as asset_grid_controller
+from core.amv_controllers.handlers.asset_grid_controller import AssetGridController
+from core.amv_views.asset_flow_layout import AssetFlowLayout
+
+CELL = QSize(100, 150)
+
+
+class Tile(QWidget):
+    def __init__(self, parent, index):
+        super().__init__(parent)
+        self.index = index
+
+    def sizeHint(self):
+        return CELL
+
+
+@pytest.fixture
+def grid(qapp, monkeypatch):
+    """Grid controller with a real flow layout and a viewport on rows 4-5"""
+    monkeypatch.setattr(asset_grid_controller, "POPULATION_CHUNK_BUDGET", 0)
+    widget = QWidget()
+    layout = AssetFlowLayout(widget)
+    layout.setContentsMargins(0, 0, 0, 0)
+    layout.setSpacing(0)
+    layout.set_columns(3)
+    layout.set_cell_size(CELL)
+
+    # Bez pełnego widoku galerii - tylko to, czego używa wypełnianie siatki
+    grid = AssetGridController.__new__(AssetGridController)
+    QObject.__init__(grid)
+    grid.view = SimpleNamespace(
+        gallery_layout=layout,
+        stacked_layout=QStackedLayout(),
+        gallery_page_index=0,
+        update_gallery_placeholder=lambda text: None,
+    )
+    grid.model = SimpleNamespace(
+        control_panel_model=SimpleNamespace(get_thumbnail_size=lambda: 256)
+    )
+    grid.controller = SimpleNamespace(
+        control_panel_controller=SimpleNamespace(update_button_states=lambda: None)
+    )
+    grid.asset_tiles = []
+    grid._population_queue = []
+    grid._population_assets = []
+    grid._population_timer = QTimer()
+    grid._population_timer.setSingleShot(True)
+    grid._population_timer.timeout.connect(grid._populate_next_chunk)
+    grid.created = []
+
+    def create_tile(asset, number, total, thumb_size):
+        grid.created.append(number - 1)
+        return Tile(widget, number - 1)
+
+    monkeypatch.setattr(grid, "_create_tile", create_tile)
+    monkeypatch.setattr(
+        grid, "_get_viewport_rect", lambda: QRect(0, 3 * 150, 300, 2 * 150)
+    )
+    yield grid
+    grid._cancel_population()
+    widget.deleteLater()
+
+
+def start_population(grid, count):
+    assets = [{"name": f"item{i:02d}"} for i in range(count)]
+    grid.view.gallery_layout.set_widgets([None] * count)
+    grid._start_population(assets, list(enumerate(assets)))
+
+
+def test_viewport_cells_are_created_first(grid, wait_until):
+    start_population(grid, 30)
+
+    # Pierwsza komórka widoczna powstaje od razu, reszta w kolejnych krokach
+    assert grid.created == [9]
+    assert grid.is_populating()
+    assert wait_until(lambda: not grid.is_populating())
+
+    assert grid.created[:6] == list(range(9, 15))
+    assert grid.created[6:] == [i for i in range(30) if not 9 <= i < 15]
+    layout = grid.view.gallery_layout
+    layout.setGeometry(QRect(0, 0, 300, 1500))
+    for tile in grid.asset_tiles:
+        assert tile.geometry().topLeft() == layout.get_cell_position(tile.index)
+
+
+def test_cancelled_population_leaves_cells_reserved(grid, wait_until):
+    start_population(grid, 30)
+
+    assert wait_until(lambda: len(grid.created) >= 6)
+    grid._cancel_population()
+    created = len(grid.created)
+    wait_until(lambda: False, timeout=0.05)
+
+    assert len(grid.created) == created < 30
+    assert not grid.is_populating()
+    assert len(grid.asset_tiles) == created
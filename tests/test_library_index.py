@@ -0,0 +1,203 @@
+import os
+
+import pytest
+
+import core.library_index as library_index
+from core.library_index import LibraryIndex
+
+# mtime of the records - older than the racy window
+MTIME_NS = 1_000_000_000
+
+
+def make_records(*assets, size=100):
+    return {f"{asset['name']}.asset": [size, MTIME_NS, asset] for asset in assets}
+
+
+@pytest.fixture
+def index(tmp_path):
+    return LibraryIndex(str(tmp_path / "library.db"))
+
+
+@pytest.fixture
+def folders(tmp_path):
+    root = tmp_path / "lib"
+    chairs = root / "Chairs"
+    tables = root / "Tables"
+    return str(root), str(chairs), str(tables)
+
+
+@pytest.fixture
+def filled_index(index, folders):
+    _, chairs, tables = folders
+    index.update_folder(
+        chairs,
+        make_records(
+            {"name": "Wooden Chair", "stars": 3, "color": "red", "archive": "wc.zip"},
+            {"name": "Office Chair", "stars": 5, "color": "blue"},
+            {"name": "ab", "stars": 1},
+        ),
+    )
+    index.update_folder(
+        tables,
+        make_records(
+            {"name": "Oak Table", "stars": 4, "color": "red", "meta": {"tag": "rustic"}},
+        ),
+    )
+    return index
+
+
+def search_names(index, **kwargs):
+    search = index.search(**kwargs)
+    return [row["name"] for row in search.fetch(100)]
+
+
+def test_update_folder_writes_only_changed_records(index, folders):
+    _, chairs, _ = folders
+    records = make_records({"name": "Chair"}, {"name": "Stool"})
+
+    assert index.update_folder(chairs, records) == 2
+    assert index.update_folder(chairs, records) == 0
+
+    records["Chair.asset"] = [200, MTIME_NS, {"name": "Chair", "stars": 2}]
+    del records["Stool.asset"]
+    assert index.update_folder(chairs, records) == 2
+    assert search_names(index) == ["Chair"]
+    assert index.get_stats() == {"assets": 1, "folders": 1}
+
+
+def test_recent_records_are_written_again(index, folders):
+    _, chairs, _ = folders
+    recent = {"Chair.asset": [100, 2**62, {"name": "Chair"}]}
+
+    index.update_folder(chairs, recent)
+
+    assert index.update_folder(chairs, recent) == 1
+
+
+def test_search_all_ordered_by_name(filled_index):
+    search = filled_index.search()
+
+    assert search.total == 4
+    assert [row["name"] for row in search.fetch(100)] == [
+        "ab",
+        "Oak Table",
+        "Office Chair",
+        "Wooden Chair",
+    ]
+    assert search.exhausted
+
+
+def test_search_fetches_in_batches(filled_index):
+    search = filled_index.search(text="chair")
+
+    assert search.total == 2
+    assert [row["name"] for row in search.fetch(1)] == ["Office Chair"]
+    assert not search.exhausted
+    assert [row["name"] for row in search.fetch(1)] == ["Wooden Chair"]
+    assert search.exhausted
+    assert search.fetch(1) == []
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"text": "CHAIR"}, ["Office Chair", "Wooden Chair"]),
+        ({"text": "wc.zip"}, ["Wooden Chair"]),
+        ({"text": "rustic"}, ["Oak Table"]),
+        ({"text": "chair wood"}, ["Wooden Chair"]),
+        ({"text": "ab"}, ["ab", "Oak Table"]),
+        ({"min_stars": 4}, ["Oak Table", "Office Chair"]),
+        ({"color": "red"}, ["Oak Table", "Wooden Chair"]),
+        ({"text": "chair", "color": "red"}, ["Wooden Chair"]),
+    ],
+)
+def test_search_filters(filled_index, kwargs, expected):
+    assert search_names(filled_index, **kwargs) == expected
+
+
+def test_search_in_folder_includes_subfolders(filled_index, folders):
+    root, chairs, _ = folders
+    filled_index.update_folder(
+        os.path.join(chairs, "Antique"), make_records({"name": "Throne"})
+    )
+
+    assert search_names(filled_index, folder_path=chairs) == [
+        "ab",
+        "Office Chair",
+        "Throne",
+        "Wooden Chair",
+    ]
+    assert len(search_names(filled_index, folder_path=root)) == 5
+    # Folder z tym samym prefiksem nazwy nie jest podfolderem
+    assert search_names(filled_index, folder_path=chairs[:-1]) == []
+
+
+def test_broad_search_walks_name_index(filled_index, monkeypatch):
+    monkeypatch.setattr(library_index, "SORTED_RESULTS_LIMIT", 1)
+
+    search = filled_index.search(text="chair")
+
+    assert search.total is None
+    assert [row["name"] for row in search.fetch(100)] == [
+        "Office Chair",
+        "Wooden Chair",
+    ]
+    assert search.exhausted
+
+
+def test_update_asset_changes_stars_and_color(filled_index, folders):
+    _, chairs, _ = folders
+
+    filled_index.update_asset(chairs, {"name": "ab", "stars": 5, "color": "green"})
+
+    assert search_names(filled_index, min_stars=5) == ["ab", "Office Chair"]
+    assert filled_index.get_colors() == ["blue", "green", "red"]
+    # Zapis .asset zmienia mtime - rekord jest zapisywany ponownie
+    records = make_records({"name": "ab", "stars": 5, "color": "green"})
+    assert filled_index.update_folder(chairs, records) > 0
+
+
+def test_get_colors_skips_empty(index, folders):
+    _, chairs, _ = folders
+    index.update_folder(
+        chairs,
+        make_records(
+            {"name": "a", "color": "red"},
+            {"name": "b", "color": ""},
+            {"name": "c"},
+            {"name": "d", "color": "blue"},
+        ),
+    )
+
+    assert index.get_colors() == ["blue", "red"]
+
+
+def test_remove_missing_folders(filled_index, folders):
+    root, chairs, tables = folders
+
+    assert filled_index.remove_missing_folders([root], [chairs]) == 1
+
+    assert search_names(filled_index, folder_path=tables) == []
+    assert len(search_names(filled_index, folder_path=chairs)) == 3
+
+
+def test_search_dialog_filters_by_color(filled_index, qapp, monkeypatch):
+    from core import library_search_dialog
+
+    monkeypatch.setattr(library_search_dialog, "get_library_index", lambda: filled_index)
+    dialog = library_search_dialog.LibrarySearchDialog()
+    dialog.show()
+
+    colors = [dialog.color_combo.itemData(i) for i in range(dialog.color_combo.count())]
+    assert colors == [None, "blue", "red"]
+
+    dialog.color_combo.setCurrentIndex(dialog.color_combo.findData("red"))
+    model = dialog.results_model
+    names = [model.get_row(row)["name"] for row in range(model.rowCount())]
+    assert names == ["Oak Table", "Wooden Chair"]
+
+    # Wybrany kolor zostaje po ponownym otwarciu okna
+    dialog.hide()
+    dialog.show()
+    assert dialog.color_combo.currentData() == "red"
+    dialog.close()
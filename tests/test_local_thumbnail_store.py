@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from core.local_thumbnail_store import LocalThumbnailStore
+
+MB = 1024 * 1024
+
+
+def make_folder(root, name: str, size: int, thumb: str = "item.thumb") -> str:
+    folder = root / name
+    cache_dir = folder / ".cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    (cache_dir / thumb).write_bytes(name.encode()[:1] * size)
+    return str(folder)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store_dir = tmp_path / "store"
+    store_dir.mkdir()
+    store = LocalThumbnailStore(str(store_dir), 1 * MB)
+    yield store
+    store._connection.close()
+
+
+def test_sync_copies_thumbnails_to_local_disk(tmp_path, store):
+    folder = make_folder(tmp_path, "a", 1000)
+
+    store.sync_folder(folder)
+
+    assert store.is_folder_synced(folder)
+    assert store.get_thumbnail_names(folder) == {"item.thumb"}
+    local_path = store.get_local_path(folder, "item.thumb")
+    assert local_path.startswith(store.files_dir)
+    with open(local_path, "rb") as f:
+        assert f.read() == b"a" * 1000
+
+
+def test_regenerated_thumbnail_replaces_local_copy(tmp_path, store):
+    folder = make_folder(tmp_path, "a", 1000)
+    store.sync_folder(folder)
+    old_path = store.get_local_path(folder, "item.thumb")
+
+    make_folder(tmp_path, "a", 2000)
+    store.sync_folder(folder)
+
+    new_path = store.get_local_path(folder, "item.thumb")
+    assert new_path != old_path
+    assert not os.path.exists(old_path)
+    assert os.path.getsize(new_path) == 2000
+
+
+def test_least_recently_used_folder_is_evicted_at_the_limit(tmp_path, store):
+    size = 400 * 1024
+    first = make_folder(tmp_path, "a", size)
+    second = make_folder(tmp_path, "b", size)
+    store.sync_folder(first)
+    store.sync_folder(second)
+    second_path = store.get_local_path(second, "item.thumb")
+    # Pierwszy folder był oglądany później niż drugi
+    assert store.get_local_path(first, "item.thumb") is not None
+
+    third = make_folder(tmp_path, "c", size)
+    store.sync_folder(third)
+
+    assert not store.is_folder_synced(second)
+    assert not os.path.exists(second_path)
+    assert store.is_folder_synced(first)
+    assert store.is_folder_synced(third)
+    total = sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(store.files_dir)
+        for name in names
+    )
+    assert total <= 1 * MB
+
+
+def test_store_below_the_limit_evicts_nothing(tmp_path, store):
+    store.sync_folder(make_folder(tmp_path, "a", 1000))
+
+    assert store.evict() == 0
+
+
+def test_forget_folder_removes_local_copies(tmp_path, store):
+    folder = make_folder(tmp_path, "a", 1000)
+    store.sync_folder(folder)
+    local_path = store.get_local_path(folder, "item.thumb")
+
+    store.forget_folder(folder)
+
+    assert not store.is_folder_synced(folder)
+    assert not os.path.exists(local_path)
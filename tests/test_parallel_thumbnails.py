@@ -0,0 +1,92 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import core.scanner as scanner
+from core.cancellation import CancellationToken
+from core.json_utils import load_from_file
+from core.scanner import AssetRepository
+from tests.conftest import make_pair
+
+
+def get_names(assets):
+    return sorted(a["name"] for a in assets if a.get("type") != "special_folder")
+
+
+def test_parallel_scan_writes_every_asset_and_thumbnail(asset_folder):
+    repository = AssetRepository()
+    progress = []
+
+    assets = repository.find_and_create_assets(
+        asset_folder,
+        progress_callback=lambda current, total, message: progress.append(current),
+        parallel_thumbnails=True,
+    )
+
+    assert get_names(assets) == ["alpha", "beta", "gamma"]
+    assert sorted(progress) == [1, 2, 3]
+    for name in ("alpha", "beta", "gamma"):
+        asset = load_from_file(os.path.join(asset_folder, f"{name}.asset"))
+        assert asset["thumbnail"] == f"{name}.thumb"
+        assert os.path.exists(os.path.join(asset_folder, ".cache", f"{name}.thumb"))
+
+
+def test_cancel_token_stops_pending_parallel_thumbnails(tmp_path, monkeypatch):
+    monkeypatch.setattr(scanner, "MAX_THUMBNAIL_PROCESSES", 1)
+    names = [f"item{i:02d}" for i in range(12)]
+    for index, name in enumerate(names):
+        make_pair(tmp_path, name, index)
+    cancel_token = CancellationToken()
+
+    def progress_callback(current, total, message):
+        cancel_token.cancel()
+
+    assets = AssetRepository().find_and_create_assets(
+        str(tmp_path),
+        progress_callback=progress_callback,
+        parallel_thumbnails=True,
+        cancel_token=cancel_token,
+    )
+
+    # Miniaturki już przekazane do procesu są kończone, reszta odpada
+    created = get_names(assets)
+    assert 1 <= len(created) < len(names)
+    written = sorted(n for n in names if (tmp_path / f"{n}.asset").exists())
+    assert written == created
+
+    repository = AssetRepository()
+    assert repository.get_scan_checkpoint(str(tmp_path)) is not None
+    remaining = repository.find_and_create_assets(str(tmp_path), incremental=True)
+    assert get_names(remaining) == sorted(set(names) - set(created))
+
+
+def test_cancelled_scan_does_not_start_the_pool(asset_folder):
+    cancel_token = CancellationToken()
+    cancel_token.cancel()
+
+    assets = AssetRepository().find_and_create_assets(
+        asset_folder, parallel_thumbnails=True, cancel_token=cancel_token
+    )
+
+    assert get_names(assets) == []
+    assert not os.path.exists(os.path.join(asset_folder, "alpha.asset"))
+
+
+def test_broken_pool_falls_back_to_serial_thumbnails(asset_folder, monkeypatch):
+    def broken_pool(self, names, archive_by_name, image_by_name, folder_path, *args):
+        # Pierwsza para gotowa, potem proces roboczy pada
+        name = names[0]
+        thumbnail = self._generate_thumbnail_for_image(image_by_name[name])
+        yield name, self._create_single_asset(
+            name, archive_by_name[name], image_by_name[name], folder_path, thumbnail
+        )
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(AssetRepository, "_iter_assets_parallel", broken_pool)
+
+    assets = AssetRepository().find_and_create_assets(
+        asset_folder, parallel_thumbnails=True
+    )
+
+    assert get_names(assets) == ["alpha", "beta", "gamma"]
+    gamma = load_from_file(os.path.join(asset_folder, "gamma.asset"))
+    assert gamma["thumbnail"] == "gamma.thumb"
@@ -0,0 +1,127 @@
+import os
+import stat
+import threading
+
+import pytest
+
+from core.cancellation import CancellationToken
+from core.json_utils import load_from_file, save_to_file
+from core.scanner import REBUILD_CHECKPOINT_NAME, AssetRepository
+from core.workers.asset_rebuilder_worker import AssetRebuilderWorker
+
+
+def stop_after(cancel_token, count):
+    def progress_callback(current, total, message):
+        if current >= count:
+            cancel_token.cancel()
+
+    return progress_callback
+
+
+def run_stopped_scan(folder, scan_id=None):
+    """Full scan stopped after two of the three pairs"""
+    cancel_token = CancellationToken()
+    return AssetRepository().find_and_create_assets(
+        folder,
+        progress_callback=stop_after(cancel_token, 2),
+        cancel_token=cancel_token,
+        scan_id=scan_id,
+    )
+
+
+def test_atomic_save_from_many_threads_leaves_no_temp_files(tmp_path):
+    target = tmp_path / "data.json"
+    errors = []
+
+    def write(worker):
+        try:
+            for i in range(20):
+                save_to_file({"worker": worker, "i": i}, target, atomic=True)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert load_from_file(target)["i"] == 19
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_stopped_scan_records_checkpoint(asset_folder):
+    assets = run_stopped_scan(asset_folder, scan_id="scan-1")
+
+    assert len(assets) == 2
+    repository = AssetRepository()
+    assert repository.get_scan_checkpoint(asset_folder)["id"] == "scan-1"
+    manifest = repository._load_scan_manifest(asset_folder)
+    assert sorted(manifest["pairs"]) == ["alpha", "beta"]
+
+
+def test_incremental_scan_resumes_and_clears_checkpoint(asset_folder):
+    run_stopped_scan(asset_folder)
+    repository = AssetRepository()
+
+    assets = repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert [a["name"] for a in assets if a.get("type") != "special_folder"] == [
+        "gamma"
+    ]
+    assert repository.get_scan_checkpoint(asset_folder) is None
+
+
+def test_rebuild_resumes_its_own_stopped_scan(asset_folder, qapp):
+    worker = AssetRebuilderWorker(asset_folder)
+    worker._write_checkpoint("rebuild-1")
+    run_stopped_scan(asset_folder, scan_id="rebuild-1")
+
+    assert worker._get_resumable_scan_id() == "rebuild-1"
+
+
+def test_rebuild_checkpoint_expires_after_another_scan(asset_folder, qapp):
+    worker = AssetRebuilderWorker(asset_folder)
+    worker._write_checkpoint("rebuild-1")
+    run_stopped_scan(asset_folder, scan_id="rebuild-1")
+    # A gallery scan stopped in between records its own checkpoint
+    run_stopped_scan(asset_folder)
+
+    assert worker._get_resumable_scan_id() is None
+    marker_path = os.path.join(asset_folder, ".cache", REBUILD_CHECKPOINT_NAME)
+    assert not os.path.exists(marker_path)
+
+
+def test_completed_scan_removes_rebuild_checkpoint(asset_folder, qapp):
+    worker = AssetRebuilderWorker(asset_folder)
+    worker._write_checkpoint("rebuild-1")
+    run_stopped_scan(asset_folder, scan_id="rebuild-1")
+
+    AssetRepository().find_and_create_assets(asset_folder, incremental=True)
+
+    assert worker._get_resumable_scan_id() is None
+    marker_path = os.path.join(asset_folder, ".cache", REBUILD_CHECKPOINT_NAME)
+    assert not os.path.exists(marker_path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions")
+def test_atomic_save_keeps_permissions_of_plain_save(tmp_path):
+    plain = tmp_path / "plain.json"
+    atomic = tmp_path / "atomic.json"
+
+    save_to_file({}, plain)
+    save_to_file({}, atomic, atomic=True)
+
+    assert stat.S_IMODE(os.stat(atomic).st_mode) == stat.S_IMODE(os.stat(plain).st_mode)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file permissions")
+def test_atomic_save_keeps_permissions_of_existing_target(tmp_path):
+    target = tmp_path / "data.json"
+    save_to_file({}, target)
+    os.chmod(target, 0o640)
+
+    save_to_file({"changed": True}, target, atomic=True)
+
+    assert stat.S_IMODE(os.stat(target).st_mode) == 0o640
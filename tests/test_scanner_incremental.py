@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+
+from core.scanner import AssetRepository
+
+
+def get_names(assets):
+    return sorted(a["name"] for a in assets if a.get("type") != "special_folder")
+
+
+def test_full_scan_records_every_pair_in_manifest(asset_folder):
+    repository = AssetRepository()
+
+    assets = repository.find_and_create_assets(asset_folder)
+
+    assert get_names(assets) == ["alpha", "beta", "gamma"]
+    manifest = repository._load_scan_manifest(asset_folder)
+    assert sorted(manifest["pairs"]) == ["alpha", "beta", "gamma"]
+    assert manifest["checkpoint"] is None
+    assert manifest["unpaired"]["archives"] == ["lonely.7z"]
+
+
+def test_incremental_scan_skips_unchanged_pairs(asset_folder):
+    repository = AssetRepository()
+    repository.find_and_create_assets(asset_folder)
+    asset_path = os.path.join(asset_folder, "alpha.asset")
+    mtime_ns = os.stat(asset_path).st_mtime_ns
+
+    assets = repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert get_names(assets) == []
+    assert os.stat(asset_path).st_mtime_ns == mtime_ns
+
+
+def test_incremental_scan_processes_modified_pair(asset_folder):
+    repository = AssetRepository()
+    repository.find_and_create_assets(asset_folder)
+    with open(os.path.join(asset_folder, "beta.zip"), "ab") as f:
+        f.write(b"more data")
+
+    assets = repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert get_names(assets) == ["beta"]
+
+
+def test_incremental_scan_recreates_missing_asset_file(asset_folder):
+    repository = AssetRepository()
+    repository.find_and_create_assets(asset_folder)
+    os.remove(os.path.join(asset_folder, "gamma.asset"))
+
+    assets = repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert get_names(assets) == ["gamma"]
+    assert os.path.exists(os.path.join(asset_folder, "gamma.asset"))
+
+
+def test_incremental_scan_without_manifest_processes_all_pairs(asset_folder):
+    repository = AssetRepository()
+
+    assets = repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert get_names(assets) == ["alpha", "beta", "gamma"]
+    assert repository.scan_stats == {"pairs": 3, "to_process": 3}
+
+
+def test_unchanged_incremental_scan_does_not_rewrite_manifest(asset_folder):
+    repository = AssetRepository()
+    repository.find_and_create_assets(asset_folder)
+    manifest_path = repository._get_manifest_path(asset_folder)
+    os.utime(manifest_path, ns=(1_000_000_000, 1_000_000_000))
+
+    repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert os.stat(manifest_path).st_mtime_ns == 1_000_000_000
+
+    (Path(asset_folder) / "lonely2.7z").write_bytes(b"y")
+    repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert os.stat(manifest_path).st_mtime_ns != 1_000_000_000
+    manifest = repository._load_scan_manifest(asset_folder)
+    assert manifest["unpaired"]["archives"] == ["lonely.7z", "lonely2.7z"]
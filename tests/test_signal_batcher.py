@@ -0,0 +1,51 @@
+import threading
+
+from core.workers.signal_batcher import SignalBatcher
+
+
+def test_items_of_one_slice_arrive_in_one_batch(wait_until):
+    batcher = SignalBatcher(interval_ms=10)
+    batches = []
+    batcher.batch_ready.connect(batches.append)
+
+    for i in range(100):
+        batcher.add(i)
+
+    assert wait_until(lambda: batches)
+    assert batches == [list(range(100))]
+
+
+def test_items_from_worker_threads_are_all_delivered(wait_until):
+    batcher = SignalBatcher(interval_ms=5)
+    batches = []
+    batcher.batch_ready.connect(batches.append)
+
+    def add_items(worker):
+        for i in range(250):
+            batcher.add((worker, i))
+
+    threads = [threading.Thread(target=add_items, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert wait_until(lambda: sum(map(len, batches)) == 1000)
+    assert len(batches) < 1000
+    items = [item for batch in batches for item in batch]
+    for worker in range(4):
+        assert [i for w, i in items if w == worker] == list(range(250))
+
+
+def test_flush_emits_at_once_and_discard_drops(qapp):
+    batcher = SignalBatcher(interval_ms=1000)
+    batches = []
+    batcher.batch_ready.connect(batches.append)
+
+    batcher.add("a")
+    batcher.flush()
+    batcher.add("b")
+    batcher.discard()
+    batcher.flush()
+
+    assert batches == [["a"]]
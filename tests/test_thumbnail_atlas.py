@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+import core.thumbnail_atlas as thumbnail_atlas
+from core.thumbnail_atlas import ATLAS_MAGIC, ThumbnailAtlas
+
+
+def write_thumb(cache_dir, name: str, data: bytes) -> None:
+    with open(os.path.join(cache_dir, name), "wb") as f:
+        f.write(data)
+
+
+def list_thumbs(cache_dir) -> dict:
+    with os.scandir(cache_dir) as entries:
+        return {
+            entry.name: entry
+            for entry in entries
+            if thumbnail_atlas.is_thumbnail_file_name(entry.name)
+        }
+
+
+def read_all(atlas: ThumbnailAtlas) -> dict:
+    return {name: bytes(atlas.get(name)) for name in sorted(atlas.names())}
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache_dir = tmp_path / ".cache"
+    cache_dir.mkdir()
+    return str(cache_dir)
+
+
+def test_is_thumbnail_file_name():
+    assert thumbnail_atlas.is_thumbnail_file_name("a.thumb")
+    assert thumbnail_atlas.is_thumbnail_file_name("a.THUMB128")
+    assert not thumbnail_atlas.is_thumbnail_file_name("a.thumbx")
+    assert not thumbnail_atlas.is_thumbnail_file_name("thumbs.atlas.json")
+
+
+def test_atlas_write_read_round_trip(cache_dir):
+    files = {"a.thumb": b"A" * 100, "a.thumb64": b"a" * 10, "b.thumb": b"B" * 50}
+    for name, data in files.items():
+        write_thumb(cache_dir, name, data)
+    atlas = ThumbnailAtlas(cache_dir)
+
+    assert atlas.sync(list_thumbs(cache_dir)) is True
+    assert atlas.sync(list_thumbs(cache_dir)) is False
+
+    assert read_all(atlas) == files
+    assert atlas.get("missing.thumb") is None
+    # Nowa instancja (inny proces) czyta ten sam indeks
+    atlas.close()
+    assert read_all(ThumbnailAtlas(cache_dir)) == files
+
+
+def test_changed_and_removed_files_are_synced(cache_dir):
+    write_thumb(cache_dir, "a.thumb", b"A" * 100)
+    write_thumb(cache_dir, "b.thumb", b"B" * 100)
+    atlas = ThumbnailAtlas(cache_dir)
+    atlas.sync(list_thumbs(cache_dir))
+
+    write_thumb(cache_dir, "a.thumb", b"new" * 10)
+    os.remove(os.path.join(cache_dir, "b.thumb"))
+    atlas.sync(list_thumbs(cache_dir))
+
+    assert read_all(atlas) == {"a.thumb": b"new" * 10}
+
+
+def test_dead_space_is_compacted(cache_dir):
+    for name in ("a", "b", "c", "d"):
+        write_thumb(cache_dir, f"{name}.thumb", name.encode() * 100)
+    atlas = ThumbnailAtlas(cache_dir)
+    atlas.sync(list_thumbs(cache_dir))
+    atlas_path = os.path.join(cache_dir, thumbnail_atlas.ATLAS_FILE_NAME)
+    assert os.path.getsize(atlas_path) == len(ATLAS_MAGIC) + 400
+
+    # Jedna zmieniona i dwie usunięte - martwe bajty przekraczają połowę
+    write_thumb(cache_dir, "a.thumb", b"x" * 40)
+    os.remove(os.path.join(cache_dir, "b.thumb"))
+    os.remove(os.path.join(cache_dir, "c.thumb"))
+    atlas.sync(list_thumbs(cache_dir))
+
+    expected = {"a.thumb": b"x" * 40, "d.thumb": b"d" * 100}
+    assert read_all(atlas) == expected
+    assert os.path.getsize(atlas_path) == len(ATLAS_MAGIC) + 140
+    assert [n for n in os.listdir(cache_dir) if n.endswith(".tmp")] == []
+    atlas.close()
+    reopened = ThumbnailAtlas(cache_dir)
+    assert read_all(reopened) == expected
+    assert reopened._dead_bytes == 0
+
+
+def test_removed_atlas_file_is_packed_again(cache_dir):
+    write_thumb(cache_dir, "a.thumb", b"A" * 10)
+    atlas = ThumbnailAtlas(cache_dir)
+    atlas.sync(list_thumbs(cache_dir))
+    atlas.close()
+    os.remove(os.path.join(cache_dir, thumbnail_atlas.ATLAS_FILE_NAME))
+
+    assert atlas.sync(list_thumbs(cache_dir)) is True
+    assert read_all(atlas) == {"a.thumb": b"A" * 10}
+
+
+def test_thumbnail_lookups_use_the_folder_atlas(tmp_path, cache_dir, monkeypatch):
+    monkeypatch.setattr(thumbnail_atlas, "_atlas_enabled", True)
+    write_thumb(cache_dir, "a.thumb", b"A" * 10)
+    thumb_path = os.path.join(cache_dir, "a.thumb")
+    try:
+        thumbnail_atlas.sync_thumbnail_atlas(str(tmp_path))
+        os.remove(thumb_path)
+
+        assert bytes(thumbnail_atlas.read_thumbnail_bytes(thumb_path)) == b"A" * 10
+        assert thumbnail_atlas.thumbnail_exists(thumb_path)
+        assert thumbnail_atlas.get_atlas_thumbnail_names(str(tmp_path)) == {"a.thumb"}
+    finally:
+        thumbnail_atlas.close_thumbnail_atlas(str(tmp_path))
@@ -0,0 +1,148 @@
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+import core.thumbnail_cache as thumbnail_cache
+import core.workers.thumbnail_loader_worker as thumbnail_loader_worker
+from core.thumbnail_cache import (
+    CompressedThumbnailCache,
+    ThumbnailCache,
+    get_pixmap_size_bytes,
+)
+from core.workers.thumbnail_loader_worker import ThumbnailLoaderWorker
+
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def make_cache(qapp, monkeypatch):
+    """Fresh cache instead of the global singleton"""
+    monkeypatch.setattr(ThumbnailCache, "_register_stats", lambda self: None)
+
+    def make(max_size_mb, available_mb=None):
+        if available_mb is None:
+            monkeypatch.setattr(thumbnail_cache, "PSUTIL_AVAILABLE", False)
+        else:
+            monkeypatch.setattr(thumbnail_cache, "PSUTIL_AVAILABLE", True)
+            monkeypatch.setattr(
+                thumbnail_cache.psutil,
+                "virtual_memory",
+                lambda: SimpleNamespace(available=available_mb * MB),
+            )
+        monkeypatch.setattr(ThumbnailCache, "_instance", None)
+        return ThumbnailCache(max_size_mb)
+
+    return make
+
+
+def make_pixmap(size=256):
+    from PyQt6.QtGui import QPixmap
+
+    pixmap = QPixmap(size, size)
+    pixmap.fill()
+    return pixmap
+
+
+def test_least_recently_used_thumbnail_is_evicted(make_cache):
+    cache = make_cache(1)
+    pixmap = make_pixmap()
+    capacity = cache.max_size_bytes // get_pixmap_size_bytes(pixmap)
+    paths = [f"/f/{i}.thumb" for i in range(capacity)]
+    for path in paths:
+        cache.put(path, pixmap)
+
+    assert cache.get(paths[0]) is not None
+    cache.put("/f/new.thumb", pixmap)
+
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[0]) is not None
+    assert cache.current_size_bytes <= cache.max_size_bytes
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 1)
+
+
+def test_budget_follows_available_ram(make_cache):
+    assert make_cache(600, available_mb=1000).max_size_bytes == 150 * MB
+    assert make_cache(600, available_mb=100_000).max_size_bytes == 600 * MB
+    assert make_cache(600, available_mb=10).max_size_bytes == (
+        thumbnail_cache.MIN_CACHE_SIZE_MB * MB
+    )
+
+
+def test_budget_floor_does_not_exceed_the_limit(make_cache):
+    assert make_cache(16, available_mb=10).max_size_bytes == 16 * MB
+
+
+def test_variants_are_counted_and_dropped_separately(make_cache):
+    cache = make_cache(8)
+    cache.put("/f/a.thumb", make_pixmap())
+    cache.put_variant("/f/a.thumb", 64, make_pixmap(64))
+    cache.put_variant("/f/a.thumb", 128, make_pixmap(128))
+
+    assert cache.get_variant("/f/a.thumb", 64) is not None
+    assert cache.get_variant("/f/a.thumb", 96) is None
+    cache.invalidate_variants(keep_size=128)
+
+    assert cache.get_variant("/f/a.thumb", 64) is None
+    assert cache.get_variant("/f/a.thumb", 128) is not None
+    assert cache.get("/f/a.thumb") is not None
+    assert cache.current_size_bytes == get_pixmap_size_bytes(
+        make_pixmap()
+    ) + get_pixmap_size_bytes(make_pixmap(128))
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 0)
+    assert stats["variants"]["hits"] == 2
+    assert stats["variants"]["misses"] == 2
+
+
+def test_compressed_tier_evicts_by_bytes():
+    cache = CompressedThumbnailCache(max_size_mb=1)
+    block = b"x" * (200 * 1024)
+    for i in range(5):
+        cache.put(f"/f/{i}.thumb", block)
+    assert cache.get("/f/0.thumb") is not None
+
+    cache.put("/f/5.thumb", block)
+
+    assert cache.get("/f/1.thumb") is None
+    assert cache.get("/f/0.thumb") == block
+    assert cache.current_size_bytes == 5 * len(block)
+    stats = cache.get_stats()
+    assert (stats["items"], stats["evictions"]) == (5, 1)
+
+
+def test_compressed_tier_copies_views_and_skips_oversized_data():
+    cache = CompressedThumbnailCache(max_size_mb=1)
+    source = bytearray(b"abc")
+    cache.put("/f/a.thumb", memoryview(source))
+    source[:] = b"zzz"
+    cache.put("/f/a.thumb", b"abcd")
+    cache.put("/f/big.thumb", b"x" * (300 * 1024))
+
+    assert cache.get("/f/a.thumb") == b"abcd"
+    assert cache.current_size_bytes == 4
+    assert cache.get("/f/big.thumb") is None
+
+
+def test_loader_decodes_again_from_the_compressed_tier(
+    make_cache, monkeypatch, tmp_path
+):
+    cache = make_cache(8)
+    monkeypatch.setattr(thumbnail_loader_worker, "thumbnail_cache", cache)
+    path = tmp_path / "item.thumb"
+    Image.new("RGB", (256, 256), (10, 200, 10)).save(path, format="WEBP")
+    images = []
+
+    def load():
+        worker = ThumbnailLoaderWorker(str(path), 64)
+        worker.signals.finished.connect(lambda p, image: images.append(image))
+        worker.run()
+
+    load()
+    # Plik zniknął (np. udział sieciowy niedostępny) - bajty są w pamięci
+    path.unlink()
+    load()
+
+    assert [(image.width(), image.height()) for image in images] == [(64, 64)] * 2
+    assert cache.get_stats()["compressed"]["hits"] == 1
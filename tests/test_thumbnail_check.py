@@ -0,0 +1,81 @@
+import os
+import time
+
+import pytest
+from PIL import Image
+
+import core.scanner as scanner
+from core.folder_snapshot import invalidate_folder_snapshot
+from core.scanner import AssetRepository
+
+NAMES = {"alpha", "beta", "gamma"}
+
+
+def set_mtime_in_past(path: str, seconds: int = 60) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def check_thumbnails(folder: str) -> dict:
+    invalidate_folder_snapshot(folder)
+    repository = AssetRepository()
+    _, image_by_name, _ = repository._scan_and_group_files(folder)
+    return repository._check_thumbnails(folder, NAMES, image_by_name)
+
+
+@pytest.fixture
+def indexed_folder(asset_folder):
+    """Scanned folder with every .asset record in the asset index"""
+    AssetRepository().find_and_create_assets(asset_folder)
+    for name in NAMES:
+        set_mtime_in_past(os.path.join(asset_folder, f"{name}.asset"))
+    invalidate_folder_snapshot(asset_folder)
+    AssetRepository().load_existing_assets(asset_folder)
+    return asset_folder
+
+
+def test_unchanged_thumbnails_are_current(indexed_folder):
+    result = check_thumbnails(indexed_folder)
+
+    assert result["current"] == {name: f"{name}.thumb" for name in NAMES}
+    assert result["stale"] == set()
+
+
+def test_changed_preview_and_missing_thumbnail_are_stale(indexed_folder):
+    Image.new("RGB", (80, 80), (0, 0, 0)).save(
+        os.path.join(indexed_folder, "beta.jpg")
+    )
+    os.remove(os.path.join(indexed_folder, ".cache", "gamma.thumb"))
+
+    result = check_thumbnails(indexed_folder)
+
+    assert set(result["current"]) == {"alpha"}
+    assert result["stale"] == {"beta", "gamma"}
+
+
+def test_names_without_index_record_are_left_unchecked(indexed_folder):
+    os.remove(AssetRepository._get_asset_index_path(indexed_folder))
+
+    result = check_thumbnails(indexed_folder)
+
+    assert result == {"current": {}, "stale": set()}
+
+
+def test_rescan_generates_only_stale_thumbnails(indexed_folder, monkeypatch):
+    Image.new("RGB", (80, 80), (0, 0, 0)).save(
+        os.path.join(indexed_folder, "beta.jpg")
+    )
+    invalidate_folder_snapshot(indexed_folder)
+    calls = []
+    generate_thumbnail = scanner.generate_thumbnail
+
+    def record_call(image_path, force=False):
+        calls.append((os.path.basename(image_path), force))
+        return generate_thumbnail(image_path, force)
+
+    monkeypatch.setattr(scanner, "generate_thumbnail", record_call)
+
+    assets = AssetRepository().find_and_create_assets(indexed_folder)
+
+    assert sorted(a["name"] for a in assets) == sorted(NAMES)
+    assert calls == [("beta.jpg", True)]
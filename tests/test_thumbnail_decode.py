@@ -0,0 +1,67 @@
+import os
+
+import pytest
+from PIL import Image
+
+from core.thumbnail import DECODE_OVERSAMPLE, THUMBNAIL_LEVELS, ThumbnailGenerator
+
+MIN_DECODED_SIZE = 256 * DECODE_OVERSAMPLE
+
+
+@pytest.fixture
+def generator():
+    return ThumbnailGenerator(256, THUMBNAIL_LEVELS)
+
+
+def save_image(path, size, color=(200, 30, 30)) -> str:
+    Image.new("RGB", size, color).save(path)
+    return str(path)
+
+
+def test_large_jpeg_is_decoded_at_reduced_size(tmp_path, generator):
+    path = save_image(tmp_path / "large.jpg", (4000, 3000))
+
+    with Image.open(path) as img:
+        generator._draft_for_size(img, 256)
+        img.load()
+        assert min(img.size) >= MIN_DECODED_SIZE
+        assert img.size[0] < 4000
+
+
+def test_small_jpeg_and_png_are_decoded_whole(tmp_path, generator):
+    small = save_image(tmp_path / "small.jpg", (600, 400))
+    png = save_image(tmp_path / "large.png", (4000, 3000))
+
+    for path, size in ((small, (600, 400)), (png, (4000, 3000))):
+        with Image.open(path) as img:
+            generator._draft_for_size(img, 256)
+            img.load()
+            assert img.size == size
+
+
+def test_reduce_keeps_oversampled_size(generator):
+    img = Image.new("RGB", (3000, 1800))
+
+    reduced = generator._reduce_for_size(img, 256)
+
+    assert reduced.size == (1000, 600)
+    assert min(reduced.size) >= MIN_DECODED_SIZE
+    small = Image.new("RGB", (900, 900))
+    assert generator._reduce_for_size(small, 256) is small
+
+
+def test_tall_preview_is_cropped_from_the_top(tmp_path, generator):
+    img = Image.new("RGB", (3000, 6000), (20, 20, 200))
+    img.paste((200, 30, 30), (0, 0, 3000, 3000))
+    path = tmp_path / "tall.jpg"
+    img.save(path, quality=95)
+
+    name, size, reused = generator.generate_thumbnail(str(path))
+
+    with Image.open(tmp_path / ".cache" / name) as thumb:
+        assert thumb.size == (size, size) == (256, 256)
+        red, green, blue = thumb.convert("RGB").getpixel((128, 200))
+        assert red > 150 and blue < 80
+    for level in THUMBNAIL_LEVELS:
+        if level != 256:
+            assert os.path.exists(tmp_path / ".cache" / f"tall.thumb{level}")
@@ -0,0 +1,170 @@
+import os
+import time
+
+import pytest
+from PIL import Image
+
+import core.thumbnail as thumbnail
+from core.thumbnail import THUMBNAIL_LEVELS, ThumbnailGenerator
+from core.thumbnail_dedup import (
+    FINGERPRINT_BLOCK_SIZE,
+    FINGERPRINT_SAMPLES,
+    ThumbnailDedupRegistry,
+    compute_content_fingerprint,
+    link_or_copy,
+)
+
+LARGE_FILE_SIZE = FINGERPRINT_BLOCK_SIZE * (FINGERPRINT_SAMPLES + 2)
+
+
+def write_file(path, data: bytes) -> str:
+    path.write_bytes(data)
+    return str(path)
+
+
+def set_mtime_in_past(path: str, seconds: int = 3600) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return ThumbnailDedupRegistry(str(tmp_path / "dedup.db"))
+
+
+def test_fingerprint_is_equal_for_copies(tmp_path):
+    data = os.urandom(LARGE_FILE_SIZE)
+    first = write_file(tmp_path / "a.jpg", data)
+    second = write_file(tmp_path / "b.jpg", data)
+
+    assert compute_content_fingerprint(first) == compute_content_fingerprint(second)
+
+
+def test_fingerprint_detects_change_in_sampled_block(tmp_path):
+    data = bytearray(os.urandom(LARGE_FILE_SIZE))
+    first = write_file(tmp_path / "a.jpg", bytes(data))
+    data[-1] ^= 0xFF
+    second = write_file(tmp_path / "b.jpg", bytes(data))
+
+    assert compute_content_fingerprint(first) != compute_content_fingerprint(second)
+
+
+def test_fingerprint_hashes_small_files_whole(tmp_path):
+    data = bytearray(os.urandom(FINGERPRINT_BLOCK_SIZE * 2))
+    first = write_file(tmp_path / "a.jpg", bytes(data))
+    data[FINGERPRINT_BLOCK_SIZE + 10] ^= 0xFF
+    second = write_file(tmp_path / "b.jpg", bytes(data))
+
+    assert compute_content_fingerprint(first) != compute_content_fingerprint(second)
+
+
+def test_fingerprint_includes_file_size(tmp_path):
+    first = write_file(tmp_path / "a.jpg", b"\0" * 100)
+    second = write_file(tmp_path / "b.jpg", b"\0" * 101)
+
+    assert compute_content_fingerprint(first).startswith(f"{100:x}-")
+    assert compute_content_fingerprint(first) != compute_content_fingerprint(second)
+
+
+def test_link_or_copy_hardlinks_and_keeps_source_mtime(tmp_path):
+    source = write_file(tmp_path / "src.thumb", b"thumbnail")
+    set_mtime_in_past(source)
+    mtime_ns = os.stat(source).st_mtime_ns
+    target = str(tmp_path / "dst.thumb")
+
+    assert link_or_copy(source, target)
+
+    assert os.path.samefile(source, target)
+    assert os.stat(source).st_mtime_ns == mtime_ns
+
+
+def test_link_or_copy_replaces_existing_target(tmp_path):
+    source = write_file(tmp_path / "src.thumb", b"new")
+    target = write_file(tmp_path / "dst.thumb", b"old")
+
+    assert link_or_copy(source, target)
+
+    with open(target, "rb") as f:
+        assert f.read() == b"new"
+
+
+def test_registry_reuses_registered_files(tmp_path, registry):
+    cache_dir = tmp_path / "first"
+    cache_dir.mkdir()
+    write_file(cache_dir / "item.thumb", b"256")
+    write_file(cache_dir / "item.thumb64", b"64")
+    registry.register("fp", "256", str(cache_dir), "item")
+    targets = {
+        ".thumb": str(tmp_path / "copy.thumb"),
+        ".thumb64": str(tmp_path / "copy.thumb64"),
+    }
+
+    assert registry.reuse("fp", "256", targets)
+
+    assert os.path.samefile(targets[".thumb"], cache_dir / "item.thumb")
+    assert os.path.samefile(targets[".thumb64"], cache_dir / "item.thumb64")
+
+
+def test_registry_forgets_removed_files(tmp_path, registry):
+    registry.register("fp", "256", str(tmp_path), "missing")
+
+    assert not registry.reuse("fp", "256", {".thumb": str(tmp_path / "copy.thumb")})
+    assert registry.find("fp", "256") is None
+
+
+def test_reuse_in_place_does_not_touch_hardlinked_file(tmp_path, registry):
+    cache_dir = tmp_path / "first"
+    cache_dir.mkdir()
+    thumb = write_file(cache_dir / "item.thumb", b"256")
+    os.link(thumb, tmp_path / "linked.thumb")
+    set_mtime_in_past(thumb)
+    mtime_ns = os.stat(thumb).st_mtime_ns
+    registry.register("fp", "256", str(cache_dir), "item")
+
+    assert registry.reuse("fp", "256", {".thumb": thumb})
+
+    assert os.stat(thumb).st_mtime_ns == mtime_ns
+
+
+def make_preview(folder, color) -> str:
+    folder.mkdir(exist_ok=True)
+    path = folder / "item.jpg"
+    Image.new("RGB", (300, 200), color).save(path, quality=95)
+    # Podgląd starszy niż miniaturki, które z niego powstaną
+    set_mtime_in_past(str(path))
+    return str(path)
+
+
+def get_thumb_color(preview: str) -> tuple:
+    thumb_path = os.path.join(os.path.dirname(preview), ".cache", "item.thumb")
+    with Image.open(thumb_path) as img:
+        return img.convert("RGB").getpixel((img.width // 2, img.height // 2))
+
+
+def is_close(color, expected) -> bool:
+    return all(abs(a - b) <= 8 for a, b in zip(color, expected))
+
+
+def test_changed_source_does_not_reuse_its_old_thumbnails(
+    tmp_path, registry, monkeypatch
+):
+    monkeypatch.setattr(thumbnail, "get_dedup_registry", lambda: registry)
+    generator = ThumbnailGenerator(256, THUMBNAIL_LEVELS)
+    red, blue = (200, 20, 20), (20, 20, 200)
+    first = make_preview(tmp_path / "first", red)
+    second = make_preview(tmp_path / "second", red)
+
+    assert generator.generate_thumbnail(first)[2] is False
+    assert generator.generate_thumbnail(second)[2] is True
+
+    # Podgląd pierwszego folderu podmieniony - miniaturki generowane od nowa
+    make_preview(tmp_path / "first", blue)
+    assert generator.generate_thumbnail(first, force=True)[2] is False
+    assert is_close(get_thumb_color(first), blue)
+    # Hardlink drugiego folderu nie został nadpisany
+    assert is_close(get_thumb_color(second), red)
+
+    # Kolejna kopia czerwonego podglądu nie dostaje niebieskich miniaturek
+    third = make_preview(tmp_path / "third", red)
+    generator.generate_thumbnail(third)
+    assert is_close(get_thumb_color(third), red)
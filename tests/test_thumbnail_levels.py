@@ -0,0 +1,76 @@
+import os
+
+import pytest
+from PIL import Image
+
+import core.thumbnail as thumbnail
+from core.amv_models.asset_tile_model import get_asset_thumbnail_path
+from core.json_utils import load_from_file
+from core.scanner import AssetRepository
+from core.thumbnail import (
+    THUMBNAIL_LEVELS,
+    ThumbnailGenerator,
+    get_level_thumbnail_name,
+    select_thumbnail_level,
+)
+
+
+@pytest.mark.parametrize(
+    "display_size, expected",
+    [(32, 64), (64, 64), (100, 128), (200, 256), (400, 256)],
+)
+def test_select_thumbnail_level(display_size, expected):
+    assert select_thumbnail_level([256, 64, 128], display_size) == expected
+
+
+def test_select_thumbnail_level_without_levels():
+    assert select_thumbnail_level([], 128) is None
+
+
+def test_level_of_base_size_is_thumb_file():
+    assert get_level_thumbnail_name("Item", 256, 256) == "Item.thumb"
+    assert get_level_thumbnail_name("Item", 128, 256) == "Item.thumb128"
+    assert get_level_thumbnail_name("Item", 256, 128) == "Item.thumb256"
+
+
+def get_image_size(path: str) -> tuple:
+    with Image.open(path) as img:
+        return img.size
+
+
+def assert_levels_resolve(asset: dict, folder: str) -> None:
+    for level in THUMBNAIL_LEVELS:
+        path = get_asset_thumbnail_path(asset, folder, level)
+        assert os.path.exists(path), path
+        assert get_image_size(path) == (level, level)
+
+
+def test_levels_resolve_after_thumbnail_size_change(asset_folder, monkeypatch):
+    monkeypatch.setattr(thumbnail, "_generator", ThumbnailGenerator(256, THUMBNAIL_LEVELS))
+    repository = AssetRepository()
+    repository.find_and_create_assets(asset_folder)
+    asset_path = os.path.join(asset_folder, "alpha.asset")
+    cache_dir = os.path.join(asset_folder, ".cache")
+
+    asset = load_from_file(asset_path)
+    assert asset["thumbnail_size"] == 256
+    assert_levels_resolve(asset, asset_folder)
+    assert not os.path.exists(os.path.join(cache_dir, "alpha.thumb256"))
+
+    # "thumbnail": 128 w config.json
+    monkeypatch.setattr(thumbnail, "_generator", ThumbnailGenerator(128, THUMBNAIL_LEVELS))
+
+    # Rekord sprzed ponownego skanu nadal wskazuje istniejące pliki
+    assert_levels_resolve(asset, asset_folder)
+
+    assets = repository.find_and_create_assets(asset_folder, incremental=True)
+
+    assert sorted(a["name"] for a in assets) == ["alpha", "beta", "gamma"]
+    asset = load_from_file(asset_path)
+    assert asset["thumbnail_size"] == 128
+    assert_levels_resolve(asset, asset_folder)
+    assert get_image_size(os.path.join(cache_dir, "alpha.thumb")) == (128, 128)
+    assert not os.path.exists(os.path.join(cache_dir, "alpha.thumb128"))
+
+    # Kolejny skan bez zmian niczego nie generuje
+    assert repository.find_and_create_assets(asset_folder, incremental=True) == []
@@ -0,0 +1,88 @@
+import pytest
+from PIL import Image
+
+from core.workers.thumbnail_load_scheduler import PRIORITY_VISIBLE, ThumbnailLoadScheduler
+
+
+class Tile:
+    """Requester outside the gallery scroll area"""
+
+    def __init__(self):
+        self.loaded = None
+        self.error = None
+
+    def get_load_priority(self):
+        return PRIORITY_VISIBLE
+
+    def _on_thumbnail_loaded(self, path, pixmap):
+        self.loaded = (path, pixmap.width(), pixmap.height())
+
+    def _on_thumbnail_error(self, path, error_message):
+        self.error = (path, error_message)
+
+
+@pytest.fixture
+def thumbnail(tmp_path):
+    path = tmp_path / "item.thumb"
+    Image.new("RGB", (256, 256), (200, 30, 30)).save(path, format="PNG")
+    return str(path)
+
+
+@pytest.fixture
+def scheduler(qapp, monkeypatch):
+    scheduler = ThumbnailLoadScheduler()
+    scheduler.started = []
+    start_worker = scheduler._start_worker
+
+    def record_start(path, display_size):
+        scheduler.started.append((path, display_size))
+        start_worker(path, display_size)
+
+    monkeypatch.setattr(scheduler, "_start_worker", record_start)
+    yield scheduler
+    scheduler.thread_pool.waitForDone()
+
+
+def test_same_path_at_two_sizes_is_delivered_to_both(scheduler, thumbnail, wait_until):
+    small, large = Tile(), Tile()
+
+    scheduler.request(small, thumbnail, 64)
+    scheduler.request(large, thumbnail, 128)
+
+    assert wait_until(lambda: small.loaded and large.loaded)
+    assert small.loaded == (thumbnail, 64, 64)
+    assert large.loaded == (thumbnail, 128, 128)
+    assert sorted(scheduler.started) == [(thumbnail, 64), (thumbnail, 128)]
+
+
+def test_same_path_and_size_shares_one_load(scheduler, thumbnail, wait_until):
+    tiles = [Tile() for _ in range(3)]
+
+    for tile in tiles:
+        scheduler.request(tile, thumbnail, 64)
+
+    assert wait_until(lambda: all(tile.loaded for tile in tiles))
+    assert scheduler.started == [(thumbnail, 64)]
+
+
+def test_cancelled_tile_is_not_delivered(scheduler, thumbnail, wait_until):
+    kept, cancelled = Tile(), Tile()
+    scheduler.request(kept, thumbnail, 64)
+    scheduler.request(cancelled, thumbnail, 64)
+
+    scheduler.cancel(cancelled)
+
+    assert wait_until(lambda: kept.loaded)
+    assert cancelled.loaded is None
+    assert scheduler.pending_count() == 0
+
+
+def test_missing_file_reports_error(scheduler, tmp_path, wait_until):
+    tile = Tile()
+    path = str(tmp_path / "missing.thumb")
+
+    scheduler.request(tile, path, 64)
+
+    assert wait_until(lambda: tile.error)
+    assert tile.error[0] == path
+    assert tile.loaded is None